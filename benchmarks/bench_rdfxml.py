@@ -0,0 +1,76 @@
+# bench_rdfxml.py
+#
+# Throughput and peak memory of the streaming RDF/XML reader:
+#
+#   python -m benchmarks.bench_rdfxml --statements 100000 1000000
+#
+# Peak traced memory of the parse-only pass should not grow with the
+# file size; the full load is dominated by the Ontology tables.
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from ontology import Ontology
+from ontology.rdfxml import RdfXmlSource
+
+
+def write_sample(path: Path, n: int) -> None:
+    # each node element below is 6 statements
+    with path.open("w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0"?>\n'
+                '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"\n'
+                '         xmlns:ex="http://example.org/ns#"\n'
+                '         xmlns:foaf="http://xmlns.com/foaf/0.1/">\n')
+        for i in range(0, n, 6):
+            f.write(
+                f'  <foaf:Person rdf:about="http://example.org/n{i}">\n'
+                f'    <foaf:name xml:lang="en">Node {i}</foaf:name>\n'
+                f'    <foaf:knows rdf:resource="http://example.org/n{(i * 31) % n}"/>\n'
+                f'    <foaf:knows rdf:resource="http://example.org/n{(i * 17) % n}"/>\n'
+                f'    <ex:tag><rdf:Description><ex:weight>{i % 97}</ex:weight>'
+                f'</rdf:Description></ex:tag>\n'
+                f'  </foaf:Person>\n'
+            )
+        f.write("</rdf:RDF>\n")
+
+
+def parse_only(path: Path):
+    # memory pass (tracemalloc slows allocation, so time separately)
+    tracemalloc.start()
+    for _ in RdfXmlSource(path):
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    t0 = time.perf_counter()
+    source = RdfXmlSource(path)
+    for _ in source:
+        pass
+    seconds = time.perf_counter() - t0
+    return source.statements, seconds, peak
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="RDF/XML loader benchmark")
+    p.add_argument("--statements", type=int, nargs="+", default=[1_000_000])
+    args = p.parse_args(argv)
+
+    print(f"{'statements':>10} {'file MB':>8} {'parse stmt/s':>13} {'peak MB':>8} {'load stmt/s':>12}")
+    for n in args.statements:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bench.rdf"
+            write_sample(path, n)
+            size_mb = os.path.getsize(path) / 1e6
+
+            count, seconds, peak = parse_only(path)
+            stats = Ontology(str(path)).load_stats
+            print(f"{count:>10} {size_mb:>8.1f} {count / seconds:>13.0f} "
+                  f"{peak / 1e6:>8.2f} {stats['statements_per_sec']:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
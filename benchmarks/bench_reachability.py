@@ -0,0 +1,69 @@
+# bench_reachability.py
+#
+# Build time, query time and incremental update cost of the
+# reachability index over a "has as kind" hierarchy:
+#
+#   python -m benchmarks.bench_reachability --instances 1000000
+#
+# Kinds form a complete tree (fan-out 10, --levels deep); every instance
+# points at a random leaf kind.
+
+import argparse
+import random
+import time
+
+from ontology.reachability import ReachabilityIndex
+
+
+def hierarchy(instances: int, levels: int, fanout: int = 10):
+    edges = []
+    level, next_id = [0], 1
+    for _ in range(levels):
+        below = []
+        for parent in level:
+            for _ in range(fanout):
+                edges.append((next_id, parent))
+                below.append(next_id)
+                next_id += 1
+        level = below
+    rng = random.Random(0)
+    first = next_id
+    edges.extend((first + i, rng.choice(level)) for i in range(instances))
+    return edges, level, first
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Reachability index benchmark")
+    p.add_argument("--instances", type=int, default=1_000_000)
+    p.add_argument("--levels", type=int, default=4)
+    p.add_argument("--queries", type=int, default=100_000)
+    args = p.parse_args(argv)
+
+    edges, leaves, first = hierarchy(args.instances, args.levels)
+    t0 = time.perf_counter()
+    index = ReachabilityIndex(0, edges)
+    print(f"build          {time.perf_counter() - t0:>8.2f} s  ({len(edges)} edges)")
+
+    rng = random.Random(1)
+    pairs = [(first + rng.randrange(args.instances), rng.randrange(first))
+             for _ in range(args.queries)]
+    t0 = time.perf_counter()
+    for x, y in pairs:
+        index.reaches(x, y)
+    per = (time.perf_counter() - t0) / args.queries
+    print(f"reaches        {per * 1e6:>8.2f} us / query")
+
+    t0 = time.perf_counter()
+    n = sum(1 for _ in index.descendants(0))
+    print(f"descendants(0) {time.perf_counter() - t0:>8.2f} s  ({n} nodes)")
+
+    t0 = time.perf_counter()
+    start = first + args.instances
+    for i in range(10_000):
+        index.add_edge(start + i, rng.choice(leaves))
+    per = (time.perf_counter() - t0) / 10_000
+    print(f"add_edge       {per * 1e6:>8.2f} us / new instance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# bench_rules.py
+#
+# Time to fixpoint for the forward-chaining rule engine:
+#
+#   python -m benchmarks.bench_rules --instances 200000 --depth 5
+#
+# Instances are typed with a leaf of a chain-shaped kind hierarchy and
+# two rules propagate kinds upwards (RDFS-style subclass reasoning), so
+# instances * depth triples are derived over `depth` rounds.
+#
+# --naive also times re-joining the whole graph every round, for scale.
+
+import argparse
+import time
+
+from ontology import Ontology
+from ontology.models import Atom, Predicate
+from ontology.rules import Rule, _Evaluator
+
+
+HAS_KIND, SUB_KIND = 0, 1
+
+
+def build(instances: int, depth: int, branches: int = 10) -> Ontology:
+    onto = Ontology()
+    onto.predicates[HAS_KIND] = Predicate(HAS_KIND, "has as kind")
+    onto.predicates[SUB_KIND] = Predicate(SUB_KIND, "is a sub kind of")
+    next_id = 2
+
+    # `branches` independent chains of `depth` kinds each
+    leaves = []
+    for b in range(branches):
+        chain = []
+        for d in range(depth):
+            onto.atoms[next_id] = Atom(next_id, f"kind {b}.{d}")
+            chain.append(next_id)
+            next_id += 1
+        leaves.append(chain[0])
+        onto._next_id = next_id
+        for lower, upper in zip(chain, chain[1:]):
+            onto.add_triple(lower, SUB_KIND, upper)
+        next_id = onto._next_id
+
+    for i in range(instances):
+        onto.atoms[next_id] = Atom(next_id, f"thing {i}")
+        next_id += 1
+    onto._next_id = next_id
+    first = next_id - instances
+    for i in range(instances):
+        onto.add_triple(first + i, HAS_KIND, leaves[i % branches], label="")
+    return onto
+
+
+RULES = [
+    Rule([("?x", HAS_KIND, "?k"), ("?k", SUB_KIND, "?j")], ("?x", HAS_KIND, "?j"),
+         name="kind inheritance"),
+    Rule([("?a", SUB_KIND, "?b"), ("?b", SUB_KIND, "?c")], ("?a", SUB_KIND, "?c"),
+         name="sub kind transitivity"),
+]
+
+
+def naive(onto: Ontology):
+    """Re-evaluate every rule against the full graph until nothing is new."""
+    ev = _Evaluator(onto)
+    while True:
+        heads = dict.fromkeys(h for rule in RULES for h in ev.fire(rule, first_round=True))
+        new = [h for h in heads if not onto._index.has(*h)]
+        if not new:
+            return
+        for s, p, o in new:
+            onto.add_triple(s, p, o, label="")
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Rule engine benchmark")
+    p.add_argument("--instances", type=int, default=200_000)
+    p.add_argument("--depth", type=int, default=5)
+    p.add_argument("--naive", action="store_true")
+    args = p.parse_args(argv)
+
+    onto = build(args.instances, args.depth)
+    before = len(onto.triples)
+    t0 = time.perf_counter()
+    derived = onto.infer(RULES)
+    seconds = time.perf_counter() - t0
+    print(f"{before} triples -> {len(onto.triples)} triples "
+          f"({len(derived)} derived) in {seconds:.2f} s")
+
+    if args.naive:
+        onto = build(args.instances, args.depth)
+        t0 = time.perf_counter()
+        naive(onto)
+        print(f"naive re-joining: {time.perf_counter() - t0:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# bench_sources.py
+#
+# Multi-file loading with Ontology.from_sources:
+#
+#   python -m benchmarks.bench_sources --shards 8 --rows 100000
+#
+# Writes `shards` CSV edge lists sharing a label vocabulary, then loads
+# them with 1 worker and with --workers (default: one per CPU), and
+# compares the size of an encoded shard with the pickled model objects
+# a worker would otherwise send back.
+
+import argparse
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+from ontology import Ontology
+from ontology.parallel import _records, encode_source
+
+
+def write_shard(path: Path, rows: int, seed: int) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        f.write("subject,predicate,object\n")
+        for i in range(rows):
+            k = i * 7919 + seed * 104729
+            f.write(f"n{k % 50000},p{k % 13},n{(k // 7) % 50000}\n")
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Parallel multi-file loading benchmark")
+    p.add_argument("--shards", type=int, default=8)
+    p.add_argument("--rows", type=int, default=100_000, help="rows per shard")
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    p.add_argument("--policy", default="label")
+    args = p.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [Path(tmp) / f"shard{i}.csv" for i in range(args.shards)]
+        for i, path in enumerate(paths):
+            write_shard(path, args.rows, i)
+
+        encoded = len(pickle.dumps(encode_source(paths[0]), pickle.HIGHEST_PROTOCOL))
+        _, _, records = _records(paths[0], {})
+        objects = len(pickle.dumps(list(records), pickle.HIGHEST_PROTOCOL))
+        print(f"one shard       encoded {encoded / 1e6:.1f} MB, "
+              f"pickled objects {objects / 1e6:.1f} MB")
+
+        total = args.shards * args.rows
+        for workers in sorted({1, args.workers}):
+            t0 = time.perf_counter()
+            onto = Ontology.from_sources(paths, workers=workers, policy=args.policy)
+            seconds = time.perf_counter() - t0
+            print(f"workers={workers:<3}   {seconds:6.2f} s  {total / seconds:>10.0f} rows/s  "
+                  f"({onto.load_stats['nodes']} nodes, {onto.load_stats['triples']} triples)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# bench_storage.py
+#
+# Memory and time of the two Ontology.triples layouts:
+#
+#   python -m benchmarks.bench_storage --sizes 1000000 10000000
+#
+# The triple table is measured on its own (no nodes), so the numbers
+# are directly comparable per triple. The TripleIndex over the same
+# triples, which either layout pays for, is measured separately.
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from ontology.indexes import TripleIndex
+from ontology.models import Triple
+from ontology.store import ColumnarTriples
+
+
+def fill(table, n: int):
+    for i in range(n):
+        table[i] = Triple(id=i, subject=i % 1000, predicate=7, object=(i * 31) % 1000,
+                          label=f"t{i}")
+    return table
+
+
+def new_table(layout: str):
+    return {} if layout == "dict" else ColumnarTriples()
+
+
+def measure(layout: str, n: int):
+    # memory pass (tracemalloc slows allocation, so time separately)
+    gc.collect()
+    tracemalloc.start()
+    table = fill(new_table(layout), n)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del table
+
+    gc.collect()
+    t0 = time.perf_counter()
+    table = fill(new_table(layout), n)
+    build = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for i in range(0, n, max(1, n // 100_000)):
+        table[i]
+    lookup = time.perf_counter() - t0
+
+    del table
+    return size / n, build, lookup
+
+
+def measure_index(n: int):
+    gc.collect()
+    tracemalloc.start()
+    index = TripleIndex()
+    for i in range(n):
+        index.add(Triple(id=i, subject=i % 1000, predicate=7, object=(i * 31) % 1000,
+                         label=f"t{i}"))
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del index
+    return size / n
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Triple storage layout benchmark")
+    p.add_argument("--sizes", type=int, nargs="+", default=[1_000_000])
+    args = p.parse_args(argv)
+
+    print(f"{'layout':<10} {'triples':>10} {'bytes/triple':>13} {'build s':>9} {'100k get s':>11}")
+    for n in args.sizes:
+        for layout in ("dict", "columnar"):
+            per, build, lookup = measure(layout, n)
+            print(f"{layout:<10} {n:>10} {per:>13.1f} {build:>9.2f} {lookup:>11.3f}")
+        print(f"{'index':<10} {n:>10} {measure_index(n):>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
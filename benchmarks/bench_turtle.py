@@ -0,0 +1,74 @@
+# bench_turtle.py
+#
+# Throughput and peak memory of the streaming Turtle reader:
+#
+#   python -m benchmarks.bench_turtle --statements 1000000
+#
+# A synthetic file mixing prefixed names, ';'/',' lists, literals and
+# blank nodes is written to a temp dir, then timed twice: tokenize+parse
+# only (TurtleSource) and a full Ontology load.
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from ontology import Ontology
+from ontology.turtle import TurtleSource
+
+
+def write_sample(path: Path, n: int) -> None:
+    # each subject block below is 6 statements
+    with path.open("w", encoding="utf-8") as f:
+        f.write("@prefix ex: <http://example.org/ns#> .\n")
+        f.write("@prefix foaf: <http://xmlns.com/foaf/0.1/> .\n\n")
+        for i in range(0, n, 6):
+            f.write(
+                f"ex:n{i} a foaf:Person ;\n"
+                f"    foaf:name \"Node {i}\"@en ;\n"
+                f"    foaf:knows ex:n{(i * 31) % n}, ex:n{(i * 17) % n} ;\n"
+                f"    ex:tag [ ex:weight {i % 97} ] .\n"
+            )
+
+
+def parse_only(path: Path):
+    # memory pass (tracemalloc slows allocation, so time separately)
+    tracemalloc.start()
+    for _ in TurtleSource(path):
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    t0 = time.perf_counter()
+    source = TurtleSource(path)
+    for _ in source:
+        pass
+    seconds = time.perf_counter() - t0
+    return source.statements, seconds, peak
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Turtle loader benchmark")
+    p.add_argument("--statements", type=int, default=1_000_000)
+    args = p.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.ttl"
+        write_sample(path, args.statements)
+        size_mb = os.path.getsize(path) / 1e6
+
+        n, seconds, peak = parse_only(path)
+        print(f"file          {size_mb:>10.1f} MB")
+        print(f"parse only    {n / seconds:>10.0f} statements/s  "
+              f"(peak {peak / 1e6:.1f} MB traced)")
+
+        onto = Ontology(str(path))
+        stats = onto.load_stats
+        print(f"full load     {stats['statements_per_sec']:>10.0f} statements/s  "
+              f"({stats['nodes']} nodes, {stats['triples']} triples)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# generate.py
+#
+# Reproducible synthetic ontologies for the benchmarks:
+#
+#   python -m benchmarks.generate --nodes 10000 --predicates 20 --degree 4 \
+#       --distribution zipf --reification-depth 2 --seed 1 -o big.json
+#   python -m benchmarks.generate ... --schema legacy -o big_legacy.json
+#
+# "new" writes the validdata.json schema (nodes + triples) read by
+# ontology.Ontology; "legacy" writes the Ontology.to_dict() schema of the
+# ontologica package. The same arguments and seed always give the same
+# file.
+
+import argparse
+import json
+import random
+from itertools import accumulate
+from typing import Dict, List
+
+
+def _weights(n: int, distribution: str, skew: float) -> List[float]:
+    """Cumulative weights for picking one of n nodes."""
+    if distribution == "uniform":
+        return list(accumulate([1.0] * n))
+    if distribution == "zipf":
+        # rank r gets weight 1 / r^skew: a few hubs, a long tail
+        return list(accumulate(1.0 / (r ** skew) for r in range(1, n + 1)))
+    raise ValueError(f"Unknown degree distribution: {distribution!r}")
+
+
+def generate(
+    nodes: int,
+    predicates: int = 10,
+    degree: float = 3.0,
+    distribution: str = "uniform",
+    skew: float = 1.1,
+    reification_depth: int = 0,
+    reify_fraction: float = 0.1,
+    seed: int = 0,
+) -> Dict[str, list]:
+    """
+    A random ontology in the validdata.json schema.
+
+    Fields of the shape:
+        nodes: number of Atoms
+        predicates: number of Predicates
+        degree: average number of triples per Atom (as subject)
+        distribution: "uniform", or "zipf" for hub-heavy subjects and objects
+        skew: zipf exponent
+        reification_depth: levels of triples about triples; level k has
+            reify_fraction times as many triples as level k-1, each with a
+            level k-1 triple as subject
+        seed: random seed
+
+    Ids are dense: atoms, then predicates, then triples level by level.
+    """
+    if nodes < 1 or predicates < 1:
+        raise ValueError("Need at least one node and one predicate.")
+    rng = random.Random(seed)
+    atom_ids = range(nodes)
+    pred_ids = range(nodes, nodes + predicates)
+    labels = [f"n{i}" for i in atom_ids] + [f"p{j}" for j in range(predicates)]
+
+    out_nodes = [{"id": i, "kind": "Atom", "label": labels[i]} for i in atom_ids]
+    out_nodes += [{"id": i, "kind": "Predicate", "label": labels[i]} for i in pred_ids]
+
+    cum = _weights(nodes, distribution, skew)
+    # Shuffle which atoms are the hubs, so hubs are not just the low ids.
+    order = list(atom_ids)
+    rng.shuffle(order)
+
+    triples: List[dict] = []
+    next_id = nodes + predicates
+
+    def add(s: int, p: int, o: int, label: str) -> dict:
+        nonlocal next_id
+        t = {"id": next_id, "kind": "Triple", "subject": s, "predicate": p,
+             "object": o, "label": label}
+        next_id += 1
+        triples.append(t)
+        labels.append(label)
+        return t
+
+    n_base = int(nodes * degree)
+    subjects = rng.choices(order, cum_weights=cum, k=n_base)
+    objects = rng.choices(order, cum_weights=cum, k=n_base)
+    level = []
+    for s, o in zip(subjects, objects):
+        p = rng.choice(pred_ids)
+        level.append(add(s, p, o, f"{labels[s]} {labels[p]} {labels[o]}"))
+
+    for _ in range(reification_depth):
+        about = rng.sample(level, max(1, int(len(level) * reify_fraction))) if level else []
+        level = []
+        for t in about:
+            p = rng.choice(pred_ids)
+            o = order[rng.randrange(nodes)]
+            level.append(add(t["id"], p, o, f"({t['label']}) {labels[p]} {labels[o]}"))
+
+    return {"nodes": out_nodes, "triples": triples}
+
+
+_LEGACY_KINDS = {"Atom": "Thing", "Predicate": "Predicate"}
+
+
+def to_legacy(data: Dict[str, list]) -> Dict[str, list]:
+    """The same ontology in the ontologica Ontology.to_dict() schema."""
+    things = [{"id": n["id"], "label": n["label"], "kind": _LEGACY_KINDS[n["kind"]]}
+              for n in data["nodes"]]
+    things += [{"id": t["id"], "label": t["label"], "kind": "Statement",
+                "subject_id": t["subject"], "predicate_id": t["predicate"],
+                "object_id": t["object"]}
+               for t in data["triples"]]
+    return {"things": things}
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Synthetic ontology generator")
+    p.add_argument("--nodes", type=int, default=10_000)
+    p.add_argument("--predicates", type=int, default=10)
+    p.add_argument("--degree", type=float, default=3.0)
+    p.add_argument("--distribution", choices=("uniform", "zipf"), default="uniform")
+    p.add_argument("--skew", type=float, default=1.1)
+    p.add_argument("--reification-depth", type=int, default=0)
+    p.add_argument("--reify-fraction", type=float, default=0.1)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--schema", choices=("new", "legacy"), default="new")
+    p.add_argument("-o", "--output", required=True)
+    args = p.parse_args(argv)
+
+    data = generate(args.nodes, args.predicates, args.degree, args.distribution,
+                    args.skew, args.reification_depth, args.reify_fraction, args.seed)
+    if args.schema == "legacy":
+        data = to_legacy(data)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    print(f"Wrote {args.output}: {len(data.get('nodes', data.get('things')))} "
+          f"{'nodes' if args.schema == 'new' else 'things'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+# suite.py
+#
+# Load, query and persistence timings on generated ontologies
+# (see generate.py), at several scales, with an optional comparison
+# against a stored baseline:
+#
+#   PYTHONPATH=old/src python -m benchmarks.suite --scales 1000 10000 \
+#       --out results.json --baseline benchmarks/baseline.json
+#
+# Cases on the ontology package: load_any, normalize_json,
+# Ontology.__init__. Cases on the legacy ontologica package (skipped
+# unless old/src is on PYTHONPATH): _resolve_things, show, enumerate,
+# and save/load in the snapshot, pickle and JSON formats.
+#
+# Each case is timed --repeat times and the fastest run is kept. With
+# --baseline, every case slower than the baseline by more than
+# --tolerance is reported and the exit status is 1. --update-baseline
+# writes this run as the new baseline.
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, List
+
+from ontology import Ontology
+from ontology.loaders import load_any
+from ontology.normalize import normalize_json
+
+from .generate import generate, to_legacy
+
+try:
+    import ontologica
+except ImportError:
+    ontologica = None
+
+# enumerate() binds every (thing, predicate, thing) triple, so it runs
+# on a fixed small ontology whatever the scale.
+ENUMERATE_NODES = 20
+ENUMERATE_PREDICATES = 3
+LOOKUPS = 200
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+class Fixture:
+    """Generated files and objects shared by the cases of one scale."""
+
+    def __init__(self, tmp: str, nodes: int, args):
+        self.nodes = nodes
+        self.tmp = tmp
+        data = generate(nodes, args.predicates, args.degree, args.distribution,
+                        reification_depth=args.reification_depth, seed=args.seed)
+        self.json_path = os.path.join(tmp, f"new_{nodes}.json")
+        with open(self.json_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        rng = random.Random(args.seed)
+        self.labels = [n["label"] for n in rng.sample(data["nodes"], min(LOOKUPS, len(data["nodes"])))]
+
+        self.legacy = None
+        if ontologica is not None:
+            self.legacy_path = os.path.join(tmp, f"legacy_{nodes}.json")
+            with open(self.legacy_path, "w", encoding="utf-8") as f:
+                json.dump(to_legacy(data), f)
+            self.legacy = ontologica.Ontology.load_json(self.legacy_path)
+
+    def store(self, fmt: str) -> str:
+        return os.path.join(self.tmp, f"store_{self.nodes}.{fmt}")
+
+
+# --- cases ---
+#
+# A case takes the fixture and returns the function to time. It is
+# called again before every run, so it can set up fresh state (and that
+# setup is not timed).
+
+def case_load_any(fx: Fixture) -> Callable[[], object]:
+    def run():
+        _, raw = load_any(fx.json_path)
+        for _ in raw:       # the JSON stream decodes lazily
+            pass
+    return run
+
+
+def case_normalize_json(fx: Fixture) -> Callable[[], object]:
+    def run():
+        _, raw = load_any(fx.json_path)
+        return normalize_json(raw)
+    return run
+
+
+def case_ontology_init(fx: Fixture) -> Callable[[], object]:
+    return lambda: Ontology(fx.json_path)
+
+
+def case_resolve_things(fx: Fixture) -> Callable[[], object]:
+    onto, labels = fx.legacy, fx.labels
+
+    def run():
+        for label in labels:
+            onto._resolve_things(label)
+    return run
+
+
+def case_show(fx: Fixture) -> Callable[[], object]:
+    onto, labels = fx.legacy, fx.labels
+    onto.query_cache.clear()    # time the uncached path
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            for label in labels:
+                onto.show(label)
+    return run
+
+
+def case_enumerate(fx: Fixture) -> Callable[[], object]:
+    onto = ontologica.Ontology()
+    onto.add_many(f"n{i}" for i in range(ENUMERATE_NODES))
+    onto.add_predicate_many(f"p{i}" for i in range(ENUMERATE_PREDICATES))
+    return onto.enumerate
+
+
+def _save(fmt: str):
+    def case(fx: Fixture) -> Callable[[], object]:
+        path = fx.store(fmt)
+        if fmt == "json":
+            return lambda: fx.legacy.save_json(path)
+        return lambda: fx.legacy.save(path, format=fmt)
+    return case
+
+
+def _load(fmt: str):
+    def case(fx: Fixture) -> Callable[[], object]:
+        path = fx.store(fmt)
+        if fmt == "json":
+            fx.legacy.save_json(path)
+            return lambda: ontologica.Ontology.load_json(path)
+        fx.legacy.save(path, format=fmt)
+        return lambda: ontologica.Ontology.load(path)
+    return case
+
+
+# (name, needs the legacy package, case, fixed scale or None)
+CASES = [
+    ("load_any", False, case_load_any, None),
+    ("normalize_json", False, case_normalize_json, None),
+    ("Ontology.__init__", False, case_ontology_init, None),
+    ("legacy._resolve_things", True, case_resolve_things, None),
+    ("legacy.show", True, case_show, None),
+    ("legacy.enumerate", True, case_enumerate, ENUMERATE_NODES),
+]
+for _fmt in ("snapshot", "pickle", "json"):
+    CASES.append((f"legacy.save.{_fmt}", True, _save(_fmt), None))
+    CASES.append((f"legacy.load.{_fmt}", True, _load(_fmt), None))
+
+
+def measure(case: Callable[[Fixture], Callable[[], object]], fx: Fixture, repeat: int) -> List[float]:
+    runs = []
+    for _ in range(repeat):
+        run = case(fx)
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        runs.append(time.perf_counter() - start)
+    return runs
+
+
+def run_suite(args) -> dict:
+    results = []
+    done_fixed = set()
+    with tempfile.TemporaryDirectory() as tmp:
+        for nodes in args.scales:
+            fx = Fixture(tmp, nodes, args)
+            for name, legacy, case, fixed in CASES:
+                if legacy and ontologica is None:
+                    continue
+                if args.only and not any(s in name for s in args.only):
+                    continue
+                if fixed is not None:
+                    if name in done_fixed:
+                        continue
+                    done_fixed.add(name)
+                runs = measure(case, fx, args.repeat)
+                scale = fixed if fixed is not None else nodes
+                results.append({"case": name, "scale": scale,
+                                "seconds": min(runs), "runs": runs})
+                print(f"{name:<26} {scale:>9} {min(runs):>11.5f}", flush=True)
+            del fx
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "predicates": args.predicates,
+            "degree": args.degree,
+            "distribution": args.distribution,
+            "reification_depth": args.reification_depth,
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float, min_seconds: float) -> List[dict]:
+    """
+    Cases of `current` slower than in `baseline` by more than `tolerance`
+    (a fraction) and by more than `min_seconds`, which keeps sub-millisecond
+    noise from counting as a regression. Prints every comparable case.
+    """
+    before = {(r["case"], r["scale"]): r["seconds"] for r in baseline["results"]}
+    regressions = []
+    print(f"\n{'case':<26} {'scale':>9} {'baseline s':>11} {'now s':>11} {'ratio':>7}")
+    for r in current["results"]:
+        old = before.get((r["case"], r["scale"]))
+        if old is None:
+            continue
+        ratio = r["seconds"] / old if old else float("inf")
+        slower = ratio > 1 + tolerance and r["seconds"] - old > min_seconds
+        if slower:
+            regressions.append(dict(r, baseline=old, ratio=ratio))
+        print(f"{r['case']:<26} {r['scale']:>9} {old:>11.5f} {r['seconds']:>11.5f} "
+              f"{ratio:>6.2f}x{'  REGRESSION' if slower else ''}")
+    return regressions
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Load, query and persistence benchmark suite")
+    p.add_argument("--scales", type=int, nargs="+", default=[1_000, 10_000],
+                   help="node counts to generate")
+    p.add_argument("--predicates", type=int, default=10)
+    p.add_argument("--degree", type=float, default=3.0)
+    p.add_argument("--distribution", choices=("uniform", "zipf"), default="zipf")
+    p.add_argument("--reification-depth", type=int, default=1)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--only", nargs="+", help="run only cases whose name contains one of these")
+    p.add_argument("--out", help="write the results as JSON to this file")
+    p.add_argument("--baseline", help=f"compare against this results file (e.g. {DEFAULT_BASELINE})")
+    p.add_argument("--tolerance", type=float, default=0.25,
+                   help="allowed slowdown against the baseline, as a fraction")
+    p.add_argument("--min-seconds", type=float, default=0.001,
+                   help="ignore slowdowns smaller than this")
+    p.add_argument("--update-baseline", metavar="PATH", nargs="?", const=DEFAULT_BASELINE,
+                   help="write this run as the baseline")
+    args = p.parse_args(argv)
+
+    if ontologica is None:
+        print("ontologica is not importable; skipping legacy cases "
+              "(run with PYTHONPATH=old/src)", file=sys.stderr)
+
+    print(f"{'case':<26} {'scale':>9} {'best s':>11}")
+    current = run_suite(args)
+
+    for path in (args.out, args.update_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(current, f, indent=2)
+                f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.tolerance, args.min_seconds)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed by more than "
+                  f"{args.tolerance:.0%}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
-from ontologica import Ontology
+from ontologica import Ontology, Predicate, Statement
+from ontologica.core import CandidateSpace
 from src.ontologica.core.parser import Parser
 import sys
 
@@ -6,23 +7,16 @@ def check_completeness(data_path):
     parser = Parser()
     triples = parser.parse_file(data_path)
     onto = Ontology()
-    things = {}
-    predicates = {}
-    for subj, pred, obj in triples:
-        if subj not in things:
-            things[subj] = onto.add_thing(subj)
-        if obj not in things:
-            things[obj] = onto.add_thing(obj)
-        if pred not in predicates:
-            predicates[pred] = onto.add_predicate(pred)
-        onto.bind(things[subj], predicates[pred], things[obj])
-    # Placeholder completeness check
-    # You can define what 'complete' means for your ontology
-    is_complete = hasattr(onto, 'is_complete') and onto.is_complete() if callable(getattr(onto, 'is_complete', None)) else False
-    if is_complete:
+    onto.bind_many(triples)
+    # Complete = every atom x predicate x atom combination is asserted.
+    atoms = [t for t in onto.things if not isinstance(t, (Predicate, Statement))]
+    predicates = [t for t in onto.things if isinstance(t, Predicate)]
+    missing = CandidateSpace(onto, atoms, predicates, atoms).unasserted()
+    if not len(missing):
         print(f"Ontology loaded from {data_path} is COMPLETE.")
     else:
-        print(f"Ontology loaded from {data_path} is NOT complete.")
+        print(f"Ontology loaded from {data_path} is NOT complete "
+              f"({len(missing)} missing, e.g. {missing[0].label!r}).")
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
@@ -6,22 +6,15 @@ def enumerate_ontology(data_path):
     parser = Parser()
     triples = parser.parse_file(data_path)
     onto = Ontology()
-    things = {}
-    predicates = {}
-    for subj, pred, obj in triples:
-        if subj not in things:
-            things[subj] = onto.add_thing(subj)
-        if obj not in things:
-            things[obj] = onto.add_thing(obj)
-        if pred not in predicates:
-            predicates[pred] = onto.add_predicate(pred)
-        onto.bind(things[subj], predicates[pred], things[obj])
+    onto.bind_many(triples)
+    # Candidates are streamed straight to the file; no Statements are created.
+    space = onto.candidates()
     parser.write_triples(
-        [(stmt.subject.name, stmt.predicate.name, stmt.object.name) for stmt in onto.statements],
+        ((c.subject.label, c.predicate.label, c.obj.label) for c in space),
         data_path,
         header="# Enumerated Ontologica Triples"
     )
-    print(f"Enumerated {len(onto.statements)} triples written to {data_path}")
+    print(f"Enumerated {len(space)} triples written to {data_path}")
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
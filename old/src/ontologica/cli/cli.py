@@ -1,10 +1,30 @@
 # ontology_cli.py
 
 import argparse
+import io
 import os
-from typing import Optional
+import sys
+import traceback
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from functools import partial
+from typing import Any, Dict, Iterator, Optional
 
 from ontologica import Ontology, Predicate
+from ontologica.cli.daemon import Client, Resident, forward, serve, socket_path
+from ontologica.core.journal import AppendSession
+from ontologica.core.labels import SEARCH_MODES
+
+
+# Without --file the store is ontology.snap, unless only the store of
+# older versions, ontology.pkl, exists: that one is kept in use.
+DEFAULT_STORE = "ontology.snap"
+LEGACY_STORE = "ontology.pkl"
+
+
+def default_store() -> str:
+    if os.path.exists(LEGACY_STORE) and not os.path.exists(DEFAULT_STORE):
+        return LEGACY_STORE
+    return DEFAULT_STORE
 
 
 def load_or_new(path: str) -> Ontology:
@@ -13,6 +33,36 @@ def load_or_new(path: str) -> Ontology:
     return Ontology()
 
 
+# Inside `serve`, commands get the daemon's Resident as args.resident and
+# work on its in-memory Ontology instead of the store on disk.
+
+
+def _ontology(args: argparse.Namespace) -> Ontology:
+    resident = getattr(args, "resident", None)
+    if resident is not None:
+        return resident.onto
+    return load_or_new(args.file)
+
+
+@contextmanager
+def _appender(args: argparse.Namespace) -> Iterator[Any]:
+    """Something with add/add_predicate/bind/find_one whose changes go to
+    the store's log and are committed when the block succeeds."""
+    resident = getattr(args, "resident", None)
+    if resident is None:
+        with AppendSession(args.file) as store:
+            yield store
+        return
+    yield resident.onto
+    resident.onto.commit()
+
+
+def _replace(args: argparse.Namespace, onto: Ontology) -> None:
+    resident = getattr(args, "resident", None)
+    if resident is not None:
+        resident.replace(onto)
+
+
 def parse_key(raw: Optional[str]) -> Optional[str | int]:
     """
     Try to interpret a CLI string as int (id) if it looks like an int,
@@ -29,26 +79,34 @@ def parse_key(raw: Optional[str]) -> Optional[str | int]:
 def cmd_new(args: argparse.Namespace) -> None:
     onto = Ontology()
     onto.save(args.file)
+    _replace(args, onto)
     print(f"Created new ontology at {args.file}")
 
 
+# add / add-predicate / bind append to the store's log (see journal.py)
+# rather than loading and rewriting the whole store; `compact` folds the
+# log back into the snapshot.
+
+
 def cmd_add(args: argparse.Namespace) -> None:
-    onto = load_or_new(args.file)
-    t = onto.add(args.label)
-    onto.save(args.file)
+    with _appender(args) as store:
+        t = store.add(args.label)
     print(f"Added Thing: {t!r}")
 
 
 def cmd_add_predicate(args: argparse.Namespace) -> None:
-    onto = load_or_new(args.file)
-    p = onto.add_predicate(args.label)
-    onto.save(args.file)
+    with _appender(args) as store:
+        p = store.add_predicate(args.label)
     print(f"Added Predicate: {p!r}")
 
 
 def cmd_bind(args: argparse.Namespace) -> None:
-    onto = load_or_new(args.file)
+    with _appender(args) as store:
+        stmt = _bind(store, args)
+    print(f"Added Statement: {stmt!r}")
 
+
+def _bind(onto: Any, args: argparse.Namespace):
     subj_key = parse_key(args.subject)
     pred_key = parse_key(args.predicate)
     obj_key = parse_key(args.object)
@@ -64,36 +122,77 @@ def cmd_bind(args: argparse.Namespace) -> None:
     if obj is None:
         raise SystemExit(f"Could not find object {args.object!r}")
 
-    stmt = onto.bind(subj, pred, obj)
-    onto.save(args.file)
-    print(f"Added Statement: {stmt!r}")
+    return onto.bind(subj, pred, obj)
 
 
 def cmd_enumerate(args: argparse.Namespace) -> None:
-    onto = load_or_new(args.file)
+    onto = _ontology(args)
     onto.enumerate()
     onto.save(args.file)
     print("Enumerated all possible statements over current Things/Predicates.")
 
 
 def cmd_show(args: argparse.Namespace) -> None:
-    onto = load_or_new(args.file)
+    onto = _ontology(args)
 
     key = parse_key(args.key)
     subject = parse_key(args.subject)
     predicate = parse_key(args.predicate)
     object_ = parse_key(args.object)
 
-    onto.show(
-        key=key,
-        subject=subject,
-        predicate=predicate,
-        object=object_,
-    )
+    if (args.limit is not None and args.limit < 1) or args.offset < 0:
+        raise SystemExit("--limit must be positive and --offset not negative")
+    try:
+        next_cursor = onto.show(
+            key=key,
+            subject=subject,
+            predicate=predicate,
+            object=object_,
+            limit=args.limit,
+            offset=args.offset,
+            cursor=args.cursor,
+        )
+    except ValueError as e:
+        raise SystemExit(str(e))
+    if next_cursor is not None:
+        print(f"More results: show again with --cursor {next_cursor}", file=sys.stderr)
+    if isinstance(key, str) and onto.find_one(key) is None:
+        suggestions = onto.search(key, mode="fuzzy", limit=3, min_score=0.2)
+        if suggestions:
+            names = ", ".join(map(repr, dict.fromkeys(t.label for t in suggestions)))
+            print(f"No Thing labelled {key!r}. Did you mean: {names}?", file=sys.stderr)
+
+
+def cmd_search(args: argparse.Namespace) -> None:
+    onto = _ontology(args)
+    found = onto.search(args.text, mode=args.mode, limit=args.limit)
+    for thing in found:
+        print(repr(thing))
+    if not found:
+        print("No matches.")
+
+
+def cmd_query(args: argparse.Namespace) -> None:
+    onto = _ontology(args)
+
+    patterns = [tuple(parse_key(term) for term in where) for where in args.where]
+    found = 0
+    for binding in onto.query(patterns):
+        print("  ".join(f"{var}={thing.label!r}" for var, thing in sorted(binding.items())))
+        found += 1
+        if args.limit is not None and found >= args.limit:
+            break
+    if not found:
+        print("No matches.")
+
+
+def cmd_compact(args: argparse.Namespace) -> None:
+    records = Ontology.compact(args.file)
+    print(f"Compacted {records} log records into {args.file}")
 
 
 def cmd_export_json(args: argparse.Namespace) -> None:
-    onto = load_or_new(args.file)
+    onto = _ontology(args)
     onto.save_json(args.json)
     print(f"Exported ontology in JSON format to {args.json}")
 
@@ -101,16 +200,57 @@ def cmd_export_json(args: argparse.Namespace) -> None:
 def cmd_import_json(args: argparse.Namespace) -> None:
     onto = Ontology.load_json(args.json)
     onto.save(args.file)
+    _replace(args, onto)
     print(f"Imported ontology from JSON {args.json} into {args.file}")
 
 
+def cmd_serve(args: argparse.Namespace) -> None:
+    if getattr(args, "resident", None) is not None:
+        raise SystemExit("Already running inside the daemon")
+    if args.stop:
+        try:
+            with Client(args.file) as client:
+                print(client.stop().out, end="")
+        except OSError:
+            raise SystemExit(f"No daemon is serving {args.file}")
+        return
+    resident = Resident(args.file)
+    print(f"Serving {args.file} on {socket_path(args.file)}", flush=True)
+    # Building the parser costs more than most commands; do it once.
+    serve(resident, partial(execute, parser=build_parser()))
+
+
+def execute(
+    argv: list, resident: Resident, parser: Optional[argparse.ArgumentParser] = None
+) -> Dict[str, Any]:
+    """Run one command line against the daemon's resident Ontology."""
+    out, err = io.StringIO(), io.StringIO()
+    code = 0
+    with redirect_stdout(out), redirect_stderr(err):
+        try:
+            args = (parser or build_parser()).parse_args(argv)
+            args.file = resident.path
+            args.resident = resident
+            args.func(args)
+        except SystemExit as e:
+            if isinstance(e.code, str):
+                print(e.code, file=sys.stderr)
+                code = 1
+            else:
+                code = e.code or 0
+        except Exception:
+            traceback.print_exc()
+            code = 1
+    return {"out": out.getvalue(), "err": err.getvalue(), "code": code}
+
+
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(prog="ontology-cli", description="Ontology CLI tool")
     p.add_argument(
         "--file",
         "-f",
-        default="ontology.pkl",
-        help="Path to ontology pickle file (default: ontology.pkl)",
+        help="Path to ontology store: binary snapshot, or a legacy pickle file "
+        f"(default: {DEFAULT_STORE}, or {LEGACY_STORE} if only that exists)",
     )
 
     sub = p.add_subparsers(dest="command", required=True)
@@ -158,8 +298,62 @@ def build_parser() -> argparse.ArgumentParser:
         "--object",
         help="Filter statements by object (id or label)",
     )
+    sp.add_argument("--limit", type=int, help="Show at most this many results")
+    sp.add_argument("--offset", type=int, default=0, help="Skip this many results first")
+    sp.add_argument(
+        "--cursor",
+        type=int,
+        help="Resume after the result with this id (printed when --limit cuts a listing short)",
+    )
     sp.set_defaults(func=cmd_show)
 
+    # query
+    sp = sub.add_parser(
+        "query",
+        help="Find bindings for one or more triple patterns, e.g. "
+        "--where ?x livesIn ?c --where ?x type Human",
+    )
+    sp.add_argument(
+        "--where",
+        nargs=3,
+        action="append",
+        required=True,
+        metavar=("SUBJECT", "PREDICATE", "OBJECT"),
+        help="A triple pattern; terms starting with '?' are variables, others ids or labels",
+    )
+    sp.add_argument("--limit", type=int, help="Stop after this many results")
+    sp.set_defaults(func=cmd_query)
+
+    # search
+    sp = sub.add_parser(
+        "search",
+        help="Find Things and Predicates by label: whole words, word prefixes, "
+        "substrings or typo-tolerant (fuzzy) matches",
+    )
+    sp.add_argument("text", help="What to look for")
+    sp.add_argument(
+        "--mode",
+        choices=SEARCH_MODES,
+        default="substring",
+        help="token: every word; prefix: words starting with each word; "
+        "substring: anywhere in the label (default); fuzzy: closest labels",
+    )
+    sp.add_argument("--limit", type=int, default=20, help="Show at most this many labels")
+    sp.set_defaults(func=cmd_search)
+
+    # compact
+    sp = sub.add_parser("compact", help="Fold the append log into a new snapshot")
+    sp.set_defaults(func=cmd_compact)
+
+    # serve
+    sp = sub.add_parser(
+        "serve",
+        help="Keep the ontology in memory and run commands sent to it; while it "
+        "runs, other invocations on the same --file are forwarded to it",
+    )
+    sp.add_argument("--stop", action="store_true", help="Stop the running daemon")
+    sp.set_defaults(func=cmd_serve)
+
     # export-json
     sp = sub.add_parser("export-json", help="Export ontology to JSON")
     sp.add_argument("json", help="Path to JSON file")
@@ -176,6 +370,16 @@ def build_parser() -> argparse.ArgumentParser:
 def main(argv: Optional[list[str]] = None) -> None:
     parser = build_parser()
     args = parser.parse_args(argv)
+    if args.file is None:
+        args.file = default_store()
+    if args.command != "serve":
+        response = forward(args.file, sys.argv[1:] if argv is None else list(argv))
+        if response is not None:
+            sys.stdout.write(response.out)
+            sys.stderr.write(response.err)
+            if response.code:
+                raise SystemExit(response.code)
+            return
     args.func(args)
 
 
@@ -0,0 +1,240 @@
+# daemon.py
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socket
+import struct
+import threading
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+from ontologica import Ontology
+from ontologica.core.snapshot import write_snapshot
+
+# `serve` keeps one store's Ontology resident and runs CLI commands sent
+# over a Unix domain socket next to the store, at `<store>.sock`.
+#
+# Every message is a frame: a 4-byte big-endian length, then that many
+# bytes of UTF-8 JSON. Requests and responses alternate on a connection:
+#
+#   request   {"argv": [...], "cwd": "..."}   or   {"stop": true}
+#   response  {"out": "...", "err": "...", "code": 0}
+#
+# Connections are served concurrently, but commands run one at a time;
+# a connection may send any number of requests.
+
+FRAME = struct.Struct(">I")
+ACCEPT_POLL = 0.2   # seconds
+
+
+def socket_path(path: str) -> str:
+    """Path of the socket a daemon for the store at `path` listens on."""
+    return f"{os.path.abspath(path)}.sock"
+
+
+def send_frame(sock: socket.socket, message: Dict[str, Any]) -> None:
+    data = json.dumps(message).encode("utf-8")
+    sock.sendall(FRAME.pack(len(data)) + data)
+
+
+def recv_frame(sock: socket.socket) -> Optional[Dict[str, Any]]:
+    """The next message, or None if the peer closed the connection."""
+    header = _recv_exactly(sock, FRAME.size)
+    if header is None:
+        return None
+    (length,) = FRAME.unpack(header)
+    data = _recv_exactly(sock, length)
+    if data is None:
+        raise ConnectionError("Connection closed in the middle of a frame")
+    return json.loads(data.decode("utf-8"))
+
+
+def _recv_exactly(sock: socket.socket, n: int) -> Optional[bytes]:
+    chunks = []
+    while n:
+        chunk = sock.recv(n)
+        if not chunk:
+            if chunks:
+                raise ConnectionError("Connection closed in the middle of a frame")
+            return None
+        chunks.append(chunk)
+        n -= len(chunk)
+    return b"".join(chunks)
+
+
+# --- server side ---
+
+class Resident:
+    """
+    The Ontology a daemon keeps in memory, with its log attached so every
+    mutating command is durable (appended and fsynced) before it replies.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        if not os.path.exists(self.path):
+            write_snapshot((), self.path)
+        self.replace(Ontology.load(self.path))
+
+    def replace(self, onto: Ontology) -> None:
+        """Swap in a new Ontology, e.g. after `new` or `import-json`."""
+        onto.attach_journal(self.path)
+        self.onto = onto
+
+
+Execute = Callable[[list, Resident], Dict[str, Any]]
+
+
+def serve(resident: Resident, execute: Execute) -> None:
+    """
+    Answer requests on the store's socket until stopped by a stop
+    request, SIGTERM or Ctrl-C. `execute(argv, resident)` runs one
+    command and returns its response.
+
+    Every connection is served on its own thread, so a client that is
+    slow to send (or never does) holds up no one else; commands still
+    run one at a time, under a lock.
+    """
+    path = socket_path(resident.path)
+    if os.path.exists(path):
+        if _alive(path):
+            raise SystemExit(f"A daemon is already serving {resident.path}")
+        os.unlink(path)     # left behind by a daemon that was killed
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen()
+    # accept() wakes up this often to notice a stop request.
+    server.settimeout(ACCEPT_POLL)
+    lock = threading.Lock()
+    stopped = threading.Event()
+    previous = signal.signal(signal.SIGTERM, _raise_exit)
+    try:
+        while not stopped.is_set():
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                continue
+            conn.settimeout(None)
+            threading.Thread(
+                target=_handle, args=(conn, resident, execute, lock, stopped), daemon=True
+            ).start()
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+        server.close()
+        os.unlink(path)
+        with lock:
+            pass        # let a command that is running finish
+
+
+def _raise_exit(signum: int, frame: object) -> None:
+    raise SystemExit(0)
+
+
+def _handle(
+    conn: socket.socket,
+    resident: Resident,
+    execute: Execute,
+    lock: threading.Lock,
+    stopped: threading.Event,
+) -> None:
+    """Serve one connection, until the client closes it or goes away."""
+    with conn:
+        try:
+            while not stopped.is_set():
+                request = recv_frame(conn)
+                if request is None:
+                    return
+                if request.get("stop"):
+                    stopped.set()
+                    send_frame(conn, {"out": "Daemon stopped.\n", "err": "", "code": 0})
+                    return
+
+                with lock:
+                    if stopped.is_set():
+                        return
+                    cwd = os.getcwd()
+                    try:
+                        os.chdir(request.get("cwd") or cwd)
+                        response = execute(list(request["argv"]), resident)
+                    finally:
+                        os.chdir(cwd)
+                send_frame(conn, response)
+        except (OSError, ValueError, KeyError, TypeError):
+            # A client that went away (BrokenPipeError, ConnectionError)
+            # or sent garbage loses its connection, not the daemon.
+            return
+
+
+# --- client side ---
+
+class Response(NamedTuple):
+    out: str
+    err: str
+    code: int
+
+
+class Client:
+    """
+    A connection to the daemon serving `path`. Keeping one open and
+    calling run() repeatedly avoids even the per-connection setup.
+    """
+
+    def __init__(self, path: str):
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._sock.connect(socket_path(path))
+        except OSError:
+            self._sock.close()
+            raise
+
+    def run(self, *argv: str) -> Response:
+        """Run one CLI command (without --file) in the daemon."""
+        return self._request({"argv": list(argv), "cwd": os.getcwd()})
+
+    def stop(self) -> Response:
+        return self._request({"stop": True})
+
+    def _request(self, message: Dict[str, Any]) -> Response:
+        send_frame(self._sock, message)
+        response = recv_frame(self._sock)
+        if response is None:
+            raise ConnectionError("Daemon closed the connection")
+        return Response(response["out"], response["err"], response["code"])
+
+    def close(self) -> None:
+        self._sock.close()
+
+    def __enter__(self) -> Client:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _alive(path: str) -> bool:
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+def forward(path: str, argv: list) -> Optional[Response]:
+    """
+    Run `argv` in the daemon serving `path`, if one is running.
+    Returns None when there is none, so the caller runs it locally.
+    """
+    if not os.path.exists(socket_path(path)):
+        return None
+    try:
+        client = Client(path)
+    except OSError:
+        return None     # stale socket file
+    with client:
+        return client.run(*argv)
@@ -1,6 +1,8 @@
+from .cache import QueryCache
+from .candidates import Candidate, CandidateSpace
 from .ontology import Ontology, Key
 from .predicate import Predicate
 from .statement import Statement
 from .thing import Thing
 
-__all__ = ["Ontology", "Thing", "Predicate", "Statement", "Key"]
+__all__ = ["Ontology", "Thing", "Predicate", "Statement", "Key", "Candidate", "CandidateSpace", "QueryCache"]
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import gc
+from contextlib import contextmanager
+from typing import Iterator
+
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    """
+    Keep the cyclic garbage collector off for the duration of the block.
+
+    Bulk work (binding or indexing many Things, building sorted keys,
+    unpickling an index) allocates many small objects and nothing
+    cyclic. Every allocation counts towards the next collection, so the
+    GC would rescan them all repeatedly, for nothing; reference counting
+    still frees everything. The GC is turned back on only if it was on
+    before, so blocks can nest.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+from .statement import Statement
+from .thing import Thing
+
+# A dependency is what a cached result was derived from:
+#
+#   ("id", n)        statements with Thing n in any position, or Thing n itself
+#   ("label", s)     which Things carry label s
+#   ANY              everything (unfiltered lookups)
+#
+# Registering a Thing touches its id and label; registering a Statement
+# also touches the ids of its subject, predicate and obj. An entry is
+# stale once any of its dependencies was touched after it was stored.
+
+Dependency = Tuple[str, Any]
+ANY: Dependency = ("any", None)
+
+
+def key_dependencies(key: Any) -> Tuple[Dependency, ...]:
+    """Dependencies of a lookup by Key (Thing, id or label)."""
+    if isinstance(key, Thing):
+        return (("id", key.id),)
+    if isinstance(key, int):
+        return (("id", key),)
+    return (("label", key),)
+
+
+def normalize_key(key: Any) -> Hashable:
+    """Hashable, type-tagged form of a Key for use in cache keys."""
+    if isinstance(key, Thing):
+        return ("thing", key.id)
+    if isinstance(key, int):
+        return ("id", key)
+    if key is None:
+        return None
+    return ("label", key)
+
+
+class _Entry:
+    __slots__ = ("value", "generation", "dependencies", "size")
+
+    def __init__(self, value: Any, generation: int, dependencies: Tuple[Dependency, ...], size: int):
+        self.value = value
+        self.generation = generation
+        self.dependencies = dependencies
+        self.size = size
+
+
+class QueryCache:
+    """
+    LRU cache of lookup results, invalidated by generation.
+
+    Every mutation the cache could care about bumps `generation` and
+    records it against the ids and labels it touched. A stored entry
+    remembers the generation it was computed at and its dependencies;
+    it is served only while none of them has been touched since, so an
+    unrelated bind() leaves it alone.
+
+    Memory is bounded by `max_items`, the total number of result
+    elements (Things, Statements or bindings) held across entries, and
+    by `max_entries`. Least recently used entries are evicted first.
+
+    Counters: hits, misses, evictions, invalidations (stale entries
+    dropped on access).
+    """
+
+    def __init__(self, max_entries: int = 1024, max_items: int = 100_000):
+        self.max_entries = max_entries
+        self.max_items = max_items
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._items = 0
+        self._touched: Dict[Dependency, int] = {}
+        self._floor = 0     # every dependency counts as touched at this generation
+
+    # --- mutation tracking ---
+
+    def touch(self, thing: Thing) -> None:
+        """Record that `thing` was registered."""
+        self.generation += 1
+        gen = self.generation
+        if not self._entries:
+            # Nothing cached to invalidate. A result still being computed
+            # (a lazy query) may be stale though, so rather than keep a
+            # record per id and label, touch everything at once: put()
+            # refuses results computed before `_floor`.
+            self._floor = gen
+            return
+        touched = self._touched
+        touched[ANY] = gen
+        touched[("label", thing.label)] = gen
+        touched[("id", thing.id)] = gen
+        if isinstance(thing, Statement):
+            touched[("id", thing.subject.id)] = gen
+            touched[("id", thing.predicate.id)] = gen
+            touched[("id", thing.obj.id)] = gen
+
+    # --- lookup / store ---
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        touched = self._touched
+        if any(touched.get(d, -1) > entry.generation for d in entry.dependencies):
+            self._drop(key)
+            self.invalidations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        dependencies: Iterable[Dependency],
+        size: int,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Store `value` (holding `size` result elements). Pass the
+        `generation` read before computing it when mutations may have
+        happened in between, e.g. while a lazy query was consumed.
+        """
+        if size > self.max_items:
+            return
+        if generation is None:
+            generation = self.generation
+        elif generation < self._floor:
+            return      # computed across touches no longer on record
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = _Entry(value, generation, tuple(dependencies), size)
+        self._items += size
+        while self._items > self.max_items or len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.evictions += 1
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._items -= entry.size
+        if not self._entries:
+            self._forget_touches()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._items = 0
+        self._forget_touches()
+
+    def _forget_touches(self) -> None:
+        # Only entries need the per-dependency record; with none left it
+        # is summarized as "everything touched up to now".
+        self._touched.clear()
+        self._floor = self.generation
+
+    # --- introspection ---
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for sizing the cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+            "items": self._items,
+            "generation": self.generation,
+        }
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import random
+from bisect import bisect_right
+from itertools import product
+from typing import TYPE_CHECKING, Iterator, List, NamedTuple, Optional, Sequence
+
+from .predicate import Predicate
+from .thing import Thing
+
+if TYPE_CHECKING:
+    from .ontology import Key, Ontology
+
+
+class Candidate(NamedTuple):
+    """A statement that could be bound; nothing is created until it is."""
+
+    subject: Thing
+    predicate: Predicate
+    obj: Thing
+
+    @property
+    def label(self) -> str:
+        """The fused label bind() would give this statement."""
+        return f"{self.subject.label} {self.predicate.label} {self.obj.label}"
+
+
+class CandidateSpace:
+    """
+    Lazy view of every (subject, predicate, obj) combination over fixed
+    axes of Things.
+
+    Candidate i is subjects[i // (P*O)], predicates[i // O % P],
+    objects[i % O], so len(), indexing and sampling are arithmetic and
+    nothing is built until it is iterated or indexed. The axes are
+    snapshots: binding candidates does not change the space.
+
+    With `unasserted=True` the space skips combinations the ontology
+    already holds a Statement for; only those asserted statements are
+    ever looked at, never the full product. They are collected on first
+    use, so create a fresh view after binding more.
+    """
+
+    def __init__(
+        self,
+        ontology: Ontology,
+        subjects: Sequence[Thing],
+        predicates: Sequence[Predicate],
+        objects: Sequence[Thing],
+        unasserted: bool = False,
+    ):
+        self.ontology = ontology
+        self.subjects = list(subjects)
+        self.predicates = list(predicates)
+        self.objects = list(objects)
+        self.unasserted_only = unasserted
+        self._excluded: Optional[List[int]] = None
+        self._members: Optional[tuple[set, set, set]] = None
+
+    # --- size and position arithmetic ---
+
+    @property
+    def total(self) -> int:
+        """Size of the full product, asserted combinations included."""
+        return len(self.subjects) * len(self.predicates) * len(self.objects)
+
+    def __len__(self) -> int:
+        return self.total - len(self._excluded_positions())
+
+    def _position(self, i: int) -> Candidate:
+        n_o = len(self.objects)
+        rest, o = divmod(i, n_o)
+        s, p = divmod(rest, len(self.predicates))
+        return Candidate(self.subjects[s], self.predicates[p], self.objects[o])
+
+    def _excluded_positions(self) -> List[int]:
+        """Sorted product positions of the already asserted combinations."""
+        if not self.unasserted_only:
+            return []
+        if self._excluded is None:
+            s_pos = {t.id: i for i, t in enumerate(self.subjects)}
+            o_pos = {t.id: i for i, t in enumerate(self.objects)}
+            n_p, n_o = len(self.predicates), len(self.objects)
+            by_predicate = self.ontology._statements_by["predicate"]
+            positions = set()
+            for pi, pred in enumerate(self.predicates):
+                for stmt in by_predicate.get(pred.id, ()):
+                    si = s_pos.get(stmt.subject.id)
+                    oi = o_pos.get(stmt.obj.id)
+                    if si is not None and oi is not None:
+                        positions.add((si * n_p + pi) * n_o + oi)
+            self._excluded = sorted(positions)
+        return self._excluded
+
+    # --- access ---
+
+    def __iter__(self) -> Iterator[Candidate]:
+        excluded = self._excluded_positions()
+        if not excluded:
+            for s, p, o in product(self.subjects, self.predicates, self.objects):
+                yield Candidate(s, p, o)
+            return
+        skip = set(excluded)
+        for i, (s, p, o) in enumerate(product(self.subjects, self.predicates, self.objects)):
+            if i not in skip:
+                yield Candidate(s, p, o)
+
+    def __getitem__(self, index: int) -> Candidate:
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("candidate index out of range")
+        excluded = self._excluded_positions()
+        # Smallest position with `index` non-excluded positions before it.
+        pos = index
+        while True:
+            nxt = index + bisect_right(excluded, pos)
+            if nxt == pos:
+                return self._position(pos)
+            pos = nxt
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, tuple) or len(item) != 3:
+            return False
+        s, p, o = item
+        if self._members is None:
+            self._members = (set(self.subjects), set(self.predicates), set(self.objects))
+        subjects, predicates, objects = self._members
+        if s not in subjects or p not in predicates or o not in objects:
+            return False
+        if not self.unasserted_only:
+            return True
+        return not any(
+            st.predicate == p and st.obj == o
+            for st in self.ontology._statements_by["subject"].get(s.id, ())
+        )
+
+    def sample(self, k: int, rng: Optional[random.Random] = None) -> List[Candidate]:
+        """k distinct candidates drawn uniformly, without building the rest."""
+        rng = rng or random
+        return [self[i] for i in rng.sample(range(len(self)), k)]
+
+    # --- narrowing ---
+
+    def filter(
+        self,
+        subject: Key | None = None,
+        predicate: Key | None = None,
+        object: Key | None = None,
+    ) -> CandidateSpace:
+        """A narrower space; keys resolve like Ontology.show()."""
+        return CandidateSpace(
+            self.ontology,
+            self._narrow(self.subjects, subject),
+            self._narrow(self.predicates, predicate),
+            self._narrow(self.objects, object),
+            unasserted=self.unasserted_only,
+        )
+
+    def unasserted(self) -> CandidateSpace:
+        """The complement: candidates with no matching Statement yet."""
+        return CandidateSpace(
+            self.ontology, self.subjects, self.predicates, self.objects, unasserted=True
+        )
+
+    def _narrow(self, axis: List[Thing], key: Key | None) -> List[Thing]:
+        if key is None:
+            return axis
+        keep = self.ontology._resolve_things(key)
+        return [t for t in axis if t in keep]
+
+    def __repr__(self) -> str:
+        return (
+            f"CandidateSpace({len(self.subjects)} subjects x {len(self.predicates)} "
+            f"predicates x {len(self.objects)} objects"
+            f"{', unasserted' if self.unasserted_only else ''})"
+        )
@@ -14,3 +14,11 @@ def reset_counter(start: int) -> None:
     """Reset the global identifier counter so future ids begin at start."""
     global _id_counter
     _id_counter = count(start)
+
+
+def reserve_ids(n: int) -> range:
+    """Take n consecutive identifiers at once, e.g. for a bulk insert."""
+    global _id_counter
+    start = next(_id_counter)
+    _id_counter = count(start + n)
+    return range(start, start + n)
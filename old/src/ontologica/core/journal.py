@@ -0,0 +1,447 @@
+from __future__ import annotations
+
+import os
+import struct
+import threading
+import zlib
+from typing import Dict, Iterator, List, NamedTuple, Optional, Union
+
+try:
+    import fcntl
+except ImportError:     # Windows: no advisory locks, writers must not overlap
+    fcntl = None
+
+from .identifiers import reset_counter
+from .predicate import Predicate
+from .snapshot import KIND_CLASSES, NODE_KINDS, NODE_FIELDS, STATEMENT_FIELDS, Snapshot, is_snapshot, write_snapshot
+from .statement import Statement
+from .thing import Thing
+
+# Append-only operation log kept next to a store, at `<store>.log`:
+#
+#   header   MAGIC, then VERSION as uint32
+#   records  RECORD struct, then `label_len` bytes of UTF-8 label
+#
+# Every record is one registered Thing/Predicate/Statement with its id,
+# so replaying is just re-registering them. `kind` is one of NODE_KINDS
+# or STATEMENT_KIND; subject/predicate/obj are -1 for non-Statements.
+# `crc` covers the rest of the record, so a write torn by a crash shows
+# up as a bad tail, which readers ignore and writers cut off.
+
+MAGIC = b"ONTLOG\x00\x00"
+VERSION = 1
+FILE_HEADER = struct.Struct("<8sI")
+RECORD = struct.Struct("<IIbqqqq")  # crc, label_len, kind, id, subject, predicate, obj
+STATEMENT_KIND = 2
+
+
+class Record(NamedTuple):
+    kind: int
+    id: int
+    label: str
+    subject: int
+    predicate: int
+    obj: int
+
+
+def journal_path(path: str) -> str:
+    """Path of the log belonging to the store at `path`."""
+    return f"{path}.log"
+
+
+def lock_path(path: str) -> str:
+    """Path of the lock file of the store at `path`."""
+    return f"{path}.lock"
+
+
+# --- writer lock ---
+
+_held = threading.local()
+
+
+class StoreLock:
+    """
+    Exclusive lock on the store at `path` for everything that writes it:
+    appending to its log (from reading the log to the last commit, so
+    two writers never hand out the same ids), saving and compacting.
+
+    It is an flock on `<store>.lock`, a file that is never replaced;
+    the store and its log are, so they cannot carry the lock. A thread
+    may take the lock again while holding it (compact() saves, say).
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> None:
+        held = getattr(_held, "paths", None)
+        if held is None:
+            held = _held.paths = {}
+        if self.path in held:
+            held[self.path] += 1
+            return
+        fd = os.open(lock_path(self.path), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+        held[self.path] = 1
+
+    def release(self) -> None:
+        held = _held.paths
+        held[self.path] -= 1
+        if held[self.path]:
+            return
+        del held[self.path]
+        os.close(self._fd)      # closing drops the flock
+        self._fd = None
+
+    def __enter__(self) -> StoreLock:
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.release()
+
+
+def _encode(thing: Thing) -> bytes:
+    label = thing.label.encode("utf-8")
+    if isinstance(thing, Statement):
+        kind = STATEMENT_KIND
+        refs = (thing.subject.id, thing.predicate.id, thing.obj.id)
+    else:
+        kind = NODE_KINDS[type(thing)]
+        refs = (-1, -1, -1)
+    body = RECORD.pack(0, len(label), kind, thing.id, *refs)[4:] + label
+    return struct.pack("<I", zlib.crc32(body)) + body
+
+
+class Journal:
+    """
+    The operation log of one store.
+
+    append() only buffers; commit() writes the buffered records with a
+    single write() and fsyncs, so callers choose the durability unit
+    (one CLI command, or a whole batch).
+    """
+
+    def __init__(self, path: str):
+        self.store = path
+        self.path = journal_path(path)
+        self._pending: List[bytes] = []
+        self._valid_end: Optional[int] = None
+
+    def append(self, thing: Thing) -> None:
+        self._pending.append(_encode(thing))
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def records(self) -> Iterator[Record]:
+        """Committed records in order, stopping at a torn or corrupt tail."""
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            self._valid_end = 0
+            return
+        if len(data) < FILE_HEADER.size:
+            self._valid_end = 0
+            return
+        magic, version = FILE_HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path!r} is not an ontology log")
+        if version != VERSION:
+            raise ValueError(f"Unsupported log version {version} in {self.path!r}")
+
+        pos = FILE_HEADER.size
+        while pos + RECORD.size <= len(data):
+            crc, label_len, kind, thing_id, s, p, o = RECORD.unpack_from(data, pos)
+            end = pos + RECORD.size + label_len
+            if end > len(data) or zlib.crc32(data[pos + 4 : end]) != crc:
+                break
+            yield Record(kind, thing_id, data[pos + RECORD.size : end].decode("utf-8"), s, p, o)
+            pos = end
+        self._valid_end = pos
+
+    def commit(self) -> None:
+        """Write and fsync everything appended since the last commit."""
+        if not self._pending:
+            return
+        with StoreLock(self.store):
+            self._write_pending()
+        self._pending.clear()
+
+    def _write_pending(self) -> None:
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            if self._valid_end is None or os.fstat(fd).st_size != self._valid_end:
+                # First commit, or the log changed under us (compacted by
+                # someone else, or a torn tail): find where valid data ends.
+                for _ in self.records():
+                    pass
+            if self._valid_end < FILE_HEADER.size:
+                os.ftruncate(fd, 0)
+                os.write(fd, FILE_HEADER.pack(MAGIC, VERSION))
+                self._valid_end = FILE_HEADER.size
+            elif os.fstat(fd).st_size != self._valid_end:
+                os.ftruncate(fd, self._valid_end)   # drop a torn tail
+            chunk = b"".join(self._pending)
+            os.lseek(fd, self._valid_end, os.SEEK_SET)
+            os.write(fd, chunk)
+            os.fsync(fd)
+            self._valid_end += len(chunk)
+        finally:
+            os.close(fd)
+
+    def clear(self) -> None:
+        """Remove the log (its records are in the store now)."""
+        self._pending.clear()
+        self._valid_end = 0
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+# --- appending without loading the store ---
+
+Key = Union[Thing, int, str]
+
+
+class AppendSession:
+    """
+    Add Things and Statements to a snapshot store by appending to its
+    log, without materializing the ontology.
+
+    Lookups go to the log records (read once) and to the snapshot
+    through its mmap: ids by binary search, labels by a byte search of
+    the string table and record sections. Only the Things a command
+    touches are ever built. Stores in the legacy pickle format have no
+    such index, so they are loaded in full, but still only appended to.
+
+    Use as a context manager; leaving it without an error commits. The
+    store's StoreLock is held from opening to close().
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.journal = Journal(path)
+        self._onto = None
+        self._snapshot: Optional[Snapshot] = None
+        self._lock = StoreLock(path)
+        self._lock.acquire()
+        try:
+            self._open()
+        except BaseException:
+            self._lock.release()
+            raise
+
+    def _open(self) -> None:
+        path = self.path
+
+        if not os.path.exists(path):
+            write_snapshot((), path)
+        if not is_snapshot(path):
+            from .ontology import Ontology
+
+            self._onto = Ontology.load(path)
+            self._onto.attach_journal(path)
+            self.journal = self._onto._journal
+            return
+
+        self._snapshot = Snapshot(path)
+        self._log: Dict[int, Record] = {}
+        self._log_labels: Dict[str, List[int]] = {}
+        for rec in self.journal.records():
+            if rec.id not in self._log:
+                self._log[rec.id] = rec
+                self._log_labels.setdefault(rec.label, []).append(rec.id)
+        self._built: Dict[int, Thing] = {}
+        reset_counter(max([self._snapshot.max_id, *self._log]) + 1)
+
+    # --- context manager ---
+
+    def __enter__(self) -> AppendSession:
+        return self
+
+    def __exit__(self, exc_type, *exc: object) -> None:
+        try:
+            if exc_type is None:
+                self.commit()
+        finally:
+            self.close()
+
+    def commit(self) -> None:
+        self.journal.commit()
+
+    def close(self) -> None:
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+        if self._lock is not None:
+            self._lock.release()
+            self._lock = None
+
+    # --- lookups ---
+
+    def find_one(self, key: Key) -> Optional[Thing]:
+        """Like Ontology.find_one()."""
+        if self._onto is not None:
+            return self._onto.find_one(key)
+        if isinstance(key, Thing):
+            return key
+        if isinstance(key, int):
+            return self._build(key)
+        for thing_id in self._ids_with_label(key):
+            return self._build(thing_id)
+        return None
+
+    def _existing(self, label: str, cls: type) -> Optional[Thing]:
+        kind = NODE_KINDS[cls]
+        for thing_id in self._ids_with_label(label, kinds=(kind,)):
+            return self._build(thing_id)
+        return None
+
+    def _ids_with_label(self, label: str, kinds: tuple = (0, 1, STATEMENT_KIND)) -> Iterator[int]:
+        for thing_id in self._log_labels.get(label, ()):
+            if self._log[thing_id].kind in kinds:
+                yield thing_id
+        snap = self._snapshot
+        index = _string_index(snap, label)
+        if index < 0:
+            return
+        node_kinds = [k for k in kinds if k != STATEMENT_KIND]
+        if node_kinds:
+            nodes = snap._nodes
+            for row in _rows_with_field(snap, False, 1, index):
+                if nodes[row * NODE_FIELDS + 2] in node_kinds:
+                    yield nodes[row * NODE_FIELDS]
+        if STATEMENT_KIND in kinds:
+            for row in _rows_with_field(snap, True, 1, index):
+                yield snap._statements[row * STATEMENT_FIELDS]
+
+    def _build(self, thing_id: int) -> Optional[Thing]:
+        """The Thing with this id, built from its log or snapshot record."""
+        thing = self._built.get(thing_id)
+        if thing is not None:
+            return thing
+        rec = self._log.get(thing_id)
+        if rec is not None:
+            kind, label, refs = rec.kind, rec.label, (rec.subject, rec.predicate, rec.obj)
+        else:
+            found = self._snapshot.find(thing_id)
+            if found is None:
+                return None
+            if len(found) == 3:
+                _, label, kind = found
+                refs = None
+            else:
+                _, label, *refs = found
+                kind = STATEMENT_KIND
+        if kind == STATEMENT_KIND:
+            thing = object.__new__(Statement)
+            object.__setattr__(thing, "subject", self._build(refs[0]))
+            object.__setattr__(thing, "predicate", self._build(refs[1]))
+            object.__setattr__(thing, "obj", self._build(refs[2]))
+        else:
+            thing = object.__new__(KIND_CLASSES[kind])
+        object.__setattr__(thing, "label", label)
+        object.__setattr__(thing, "id", thing_id)
+        self._built[thing_id] = thing
+        return thing
+
+    # --- mutations (same semantics as Ontology) ---
+
+    def add(self, label: str) -> Thing:
+        if self._onto is not None:
+            return self._onto.add(label)
+        return self._existing(label, Thing) or self._record(Thing(label))
+
+    def add_predicate(self, label: str) -> Predicate:
+        if self._onto is not None:
+            return self._onto.add_predicate(label)
+        return self._existing(label, Predicate) or self._record(Predicate(label))
+
+    def bind(self, subject: Thing, predicate: Predicate, obj: Thing) -> Statement:
+        if self._onto is not None:
+            return self._onto.bind(subject, predicate, obj)
+        for t in (subject, predicate, obj):
+            if self._build(t.id) is None:
+                self._record(t)
+        fused_label = f"{subject.label} {predicate.label} {obj.label}"
+        return self._record(Statement(fused_label, subject, predicate, obj))
+
+    def _record(self, thing: Thing) -> Thing:
+        self.journal.append(thing)
+        self._built[thing.id] = thing
+        rec = Record(
+            STATEMENT_KIND if isinstance(thing, Statement) else NODE_KINDS[type(thing)],
+            thing.id, thing.label, -1, -1, -1,
+        )
+        self._log[thing.id] = rec
+        self._log_labels.setdefault(thing.label, []).append(thing.id)
+        return thing
+
+
+# --- byte-level search helpers over a mapped snapshot ---
+
+def _string_index(snap: Snapshot, label: str) -> int:
+    """Index of `label` in the snapshot's string table, or -1."""
+    needle = label.encode("utf-8")
+    if not needle:
+        return -1
+    mm, offsets, start = snap._mmap, snap._offsets, snap._blob_start
+    end = start + offsets[snap.n_strings]
+    pos = mm.find(needle, start, end)
+    while pos >= 0:
+        # A hit counts only if it is a whole string: it starts on a string
+        # boundary and the next boundary is right where it ends. Otherwise
+        # the next candidate starts on the next boundary, so every string
+        # costs at most one probe however often a short label recurs.
+        i = _bisect(offsets, pos - start, snap.n_strings + 1)
+        if offsets[i] == pos - start and offsets[i + 1] == pos - start + len(needle):
+            return i
+        pos = mm.find(needle, start + offsets[i + 1], end)
+    return -1
+
+
+def _bisect(offsets: memoryview, value: int, n: int) -> int:
+    """Largest i with offsets[i] <= value."""
+    lo, hi = 0, n
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if offsets[mid] <= value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo - 1
+
+
+def _rows_with_field(snap: Snapshot, statements: bool, field_no: int, value: int) -> Iterator[int]:
+    """Rows of a record section whose `field_no` equals `value`.
+
+    The field is copied out by record stride into a column of int64s
+    (one C-level copy), which is then searched as bytes. Other fields
+    never take part, so a value such as 0 does not also match every
+    zero `kind`; only 8-aligned hits are rows."""
+    if statements:
+        records, width = snap._statements, STATEMENT_FIELDS
+    else:
+        records, width = snap._nodes, NODE_FIELDS
+    column = records[field_no::width].tobytes()
+    needle = struct.pack("<q", value)
+    pos = column.find(needle)
+    while pos >= 0:
+        rest = pos % 8
+        if rest == 0:
+            yield pos // 8
+            pos = column.find(needle, pos + 8)
+        else:
+            # Straddles two values: resume at the next aligned one.
+            pos = column.find(needle, pos - rest + 8)
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import heapq
+import os
+import pickle
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ._gc import paused_gc
+
+# Search over the distinct labels of an ontology's Things and Predicates
+# (Statement labels are fused from these, so they are left out).
+#
+# Labels are compared case-insensitively (str.casefold). Each label has
+# a label id (lid) in order of first appearance, and two posting maps:
+#
+#   tokens    word -> lids of labels containing it; words are runs of
+#             letters/digits, with camelCase split ("livesIn" -> lives, in)
+#   trigrams  3-character window -> lids, over the label padded as
+#             "  label " so that short labels and word starts count too
+#
+# Postings are int64 arrays in increasing lid order.
+#
+#   token      labels containing every word of the query
+#   prefix     labels with, for every query word, a word starting with it
+#   substring  labels containing the query; the query's rarest trigram
+#              gives the candidates, which are then checked directly
+#   fuzzy      labels sharing the most (rarest) trigrams with the query,
+#              ranked by trigram Jaccard similarity, then the best of
+#              those reranked by edit distance
+
+SEARCH_MODES = ("token", "prefix", "substring", "fuzzy")
+
+# Fuzzy candidates are counted from the query's rarest trigrams first,
+# and stop being counted once their postings add up to FUZZY_BUDGET
+# (trigrams shared by huge numbers of labels say little about which is
+# closest). The FUZZY_POOL per result wanted that share the most are
+# then scored exactly.
+FUZZY_BUDGET = 200_000
+FUZZY_POOL = 20
+
+MAGIC = b"ONTLBL\x00\x00"
+VERSION = 1
+
+_WORD = re.compile(r"[^\W_]+")
+_CAMEL = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+
+
+def labels_path(path: str) -> str:
+    """Path of the persisted label index of the store at `path`."""
+    return f"{path}.labels"
+
+
+def tokens(label: str) -> List[str]:
+    words = _WORD.findall(_CAMEL.sub(" ", label))
+    return list(dict.fromkeys(w.casefold() for w in words))
+
+
+def trigrams(folded: str) -> Set[str]:
+    padded = f"  {folded} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance, one row at a time."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+class LabelIndex:
+    """
+    Token, prefix, substring and fuzzy search over labels.
+
+    add() indexes a label once (repeats are ignored), so the index is
+    kept up to date as Things are registered. search() returns
+    (label, score) pairs, best first.
+    """
+
+    def __init__(self) -> None:
+        self._labels: List[str] = []
+        self._folded: List[str] = []
+        self._lids: Dict[str, int] = {}
+        self._tokens: Dict[str, array] = {}
+        self._trigrams: Dict[str, array] = {}
+        self._sorted_tokens: List[str] = []
+        self._unsorted_tokens: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __contains__(self, label: object) -> bool:
+        return label in self._lids
+
+    # --- maintenance ---
+
+    def add(self, label: str) -> None:
+        if label in self._lids:
+            return
+        lid = len(self._labels)
+        folded = label.casefold()
+        self._lids[label] = lid
+        self._labels.append(label)
+        self._folded.append(folded)
+
+        postings = self._tokens
+        for word in tokens(label):
+            posting = postings.get(word)
+            if posting is None:
+                postings[word] = array("q", (lid,))
+                self._unsorted_tokens.append(word)
+            else:
+                posting.append(lid)
+
+        postings = self._trigrams
+        get = postings.get
+        for gram in trigrams(folded):
+            posting = get(gram)
+            if posting is None:
+                postings[gram] = array("q", (lid,))
+            else:
+                posting.append(lid)
+
+    def add_many(self, labels: Iterable[str]) -> None:
+        with paused_gc():       # many small arrays, nothing cyclic
+            for label in labels:
+                self.add(label)
+
+    def _words(self) -> List[str]:
+        """All indexed words, sorted (new ones merged in on demand)."""
+        if self._unsorted_tokens:
+            self._unsorted_tokens.sort()
+            self._sorted_tokens.extend(self._unsorted_tokens)
+            self._sorted_tokens.sort()
+            self._unsorted_tokens.clear()
+        return self._sorted_tokens
+
+    # --- queries ---
+
+    def search(
+        self,
+        text: str,
+        mode: str = "substring",
+        limit: Optional[int] = 20,
+        min_score: float = 0.0,
+    ) -> List[Tuple[str, float]]:
+        """
+        Labels matching `text` under `mode` (one of SEARCH_MODES), best
+        first, with a score: 1.0 for every token/prefix/substring match
+        (ranked exact label, then label prefix, then shorter labels),
+        and the trigram Jaccard similarity for fuzzy matches, which must
+        be at least `min_score`.
+        """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode: {mode!r}")
+        folded = text.casefold()
+        if mode == "fuzzy":
+            return self._fuzzy(folded, limit, min_score)
+        if mode == "substring":
+            lids = self._substring(folded)
+        else:
+            words = tokens(text)
+            if not words:
+                return []
+            lids = self._all_words(words, prefix=mode == "prefix")
+
+        labels, folded_labels = self._labels, self._folded
+        rank = lambda lid: (folded_labels[lid] != folded, not folded_labels[lid].startswith(folded),
+                            len(labels[lid]), labels[lid])
+        best = sorted(lids, key=rank) if limit is None else heapq.nsmallest(limit, lids, key=rank)
+        return [(labels[lid], 1.0) for lid in best]
+
+    def _postings_of_word(self, word: str, prefix: bool) -> array:
+        if not prefix:
+            return self._tokens.get(word, array("q"))
+        words = self._words()
+        found = array("q")
+        for i in range(bisect_left(words, word), len(words)):
+            if not words[i].startswith(word):
+                break
+            found.extend(self._tokens[words[i]])
+        return found
+
+    def _all_words(self, words: List[str], prefix: bool) -> Iterable[int]:
+        postings = sorted((self._postings_of_word(w, prefix) for w in words), key=len)
+        found = set(postings[0])
+        for posting in postings[1:]:
+            if not found:
+                break
+            found.intersection_update(posting)
+        return found
+
+    def _substring(self, folded: str) -> Iterable[int]:
+        if not folded:
+            return ()
+        folded_labels = self._folded
+        if len(folded) < 3:
+            # Shorter than a trigram: check every label (at C speed).
+            return [lid for lid, label in enumerate(folded_labels) if folded in label]
+        grams = [folded[i : i + 3] for i in range(len(folded) - 2)]
+        postings = self._trigrams
+        rarest = min((postings.get(g, ()) for g in grams), key=len)
+        return [lid for lid in rarest if folded in folded_labels[lid]]
+
+    def _fuzzy(self, folded: str, limit: Optional[int], min_score: float) -> List[Tuple[str, float]]:
+        grams = trigrams(folded)
+        postings = self._trigrams
+        found = sorted((p for p in map(postings.get, grams) if p is not None), key=len)
+        if not found:
+            return []
+        shared: Counter = Counter()
+        budget = FUZZY_BUDGET
+        for posting in found:
+            if shared and len(posting) > budget:
+                break
+            shared.update(posting)
+            budget -= len(posting)
+
+        wanted = limit if limit is not None else len(shared)
+        query, folded_labels = grams, self._folded
+        scored = []
+        for lid, _ in shared.most_common(max(wanted * FUZZY_POOL, 100)):
+            other = trigrams(folded_labels[lid])
+            common = len(query.intersection(other))
+            scored.append((common / (len(query) + len(other) - common), lid))
+        scored.sort(reverse=True)
+        scored = scored[: max(wanted * 4, 20)]
+
+        labels = self._labels
+        reranked = sorted((s for s in scored if s[0] >= min_score),
+                          key=lambda s: (self._distance(folded, s[1]), -s[0], labels[s[1]]))
+        return [(labels[lid], jaccard) for jaccard, lid in reranked[:wanted]]
+
+    def _distance(self, folded: str, lid: int) -> int:
+        """Edit distance from the query to the label or, if closer, to one
+        of its words ("deprtment" is 1 from "Department of Health")."""
+        label = self._folded[lid]
+        return min(edit_distance(folded, w) for w in [label, *tokens(self._labels[lid])])
+
+    # --- persistence ---
+
+    def save(self, path: str, store_path: str) -> None:
+        """
+        Write the index to `path`, stamped with the size and mtime of the
+        store it belongs to, so load() can tell when the store changed.
+        """
+        stat = os.stat(store_path)
+        self._words()
+        state = (self._labels, self._tokens, self._trigrams, self._sorted_tokens)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(MAGIC)
+            pickle.dump((VERSION, stat.st_size, stat.st_mtime_ns), f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, store_path: str) -> Optional[LabelIndex]:
+        """The index saved at `path`, or None if it is missing, of another
+        version, or older than the store at `store_path`."""
+        try:
+            with open(path, "rb") as f:
+                if f.read(len(MAGIC)) != MAGIC:
+                    return None
+                stat = os.stat(store_path)
+                if pickle.load(f) != (VERSION, stat.st_size, stat.st_mtime_ns):
+                    return None
+                with paused_gc():
+                    labels, token_postings, trigram_postings, words = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+            return None
+        index = cls()
+        index._labels = labels
+        index._folded = [label.casefold() for label in labels]
+        index._lids = {label: lid for lid, label in enumerate(labels)}
+        index._tokens = token_postings
+        index._trigrams = trigram_postings
+        index._sorted_tokens = words
+        return index
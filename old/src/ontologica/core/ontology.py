@@ -1,40 +1,162 @@
 from __future__ import annotations
 
+import heapq
 import json
+import os
 import pickle
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, Optional, TypeVar, Union
-
-from .identifiers import reset_counter
+from itertools import islice
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, TextIO, TypeVar, Union
+
+from ._gc import paused_gc
+from .cache import ANY, Dependency, QueryCache, key_dependencies, normalize_key
+from .candidates import CandidateSpace
+from .identifiers import reserve_ids, reset_counter
+from .journal import STATEMENT_KIND, Journal, StoreLock
+from .labels import LabelIndex, labels_path
+from .ordering import OrderedIndex, show_key
 from .predicate import Predicate
+from .query import Binding, Pattern, Query, is_variable
+from .render import DEFAULT_MAX_DEPTH, Renderer
+from .snapshot import KIND_CLASSES, Snapshot, is_snapshot, write_snapshot
 from .statement import Statement
 from .thing import Thing, thing_set_factory
 
 Key = Union[Thing, int, str]
 TThing = TypeVar("TThing", bound=Thing)
 
+# Statement attributes that can be sliced on.
+POSITIONS = ("subject", "predicate", "obj")
+
+
+# Positions indexed together with the predicate.
+PAIRED_POSITIONS = ("subject", "obj")
+
+
+def statement_index_factory() -> dict[str, dict[int, set[Statement]]]:
+    """Empty position index: attr -> component id -> Statements."""
+    return {attr: {} for attr in POSITIONS}
+
+
+def pair_index_factory() -> dict[str, dict[int, dict[int, set[Statement]]]]:
+    """Empty pair index: attr -> predicate id -> component id -> Statements."""
+    return {attr: {} for attr in PAIRED_POSITIONS}
+
 
 @dataclass
 class Ontology:
     things: set[Thing] = field(default_factory=thing_set_factory)
+    _statements_by: dict[str, dict[int, set[Statement]]] = field(
+        default_factory=statement_index_factory, init=False, repr=False, compare=False
+    )
+    _statements_by_pair: dict[str, dict[int, dict[int, set[Statement]]]] = field(
+        default_factory=pair_index_factory, init=False, repr=False, compare=False
+    )
+    _by_id: dict[int, Thing] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_label: dict[str, set[Thing]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    query_cache: QueryCache = field(
+        default_factory=QueryCache, init=False, repr=False, compare=False
+    )
+    _journal: Optional[Journal] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _show_order: OrderedIndex = field(
+        default_factory=OrderedIndex, init=False, repr=False, compare=False
+    )
+    # Label search index (see labels.py), built on first search. While it
+    # is not built, `_labels_store` names a store whose saved index can be
+    # loaded instead, and `_labels_pending` collects labels added since.
+    _labels: Optional[LabelIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _labels_store: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _labels_pending: list[str] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        for t in self.things:
+            self._index(t)
+
+    # --- pickling: persist the things only, rebuild indexes on load ---
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"things": self.things}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.things = state["things"]
+        self._statements_by = statement_index_factory()
+        self._statements_by_pair = pair_index_factory()
+        self._by_id = {}
+        self._by_label = {}
+        self.query_cache = QueryCache()
+        self._journal = None
+        self._show_order = OrderedIndex()
+        self._labels = None
+        self._labels_store = None
+        self._labels_pending = []
+        self.__post_init__()
 
     # --- internal: low-level register for any Thing subclass ---
 
     def _register(self, thing: TThing) -> TThing:
         """Internal: add an existing Thing/Predicate/Statement to the set."""
+        if self._journal is not None and thing.id not in self._by_id:
+            self._journal.append(thing)
         self.things.add(thing)
+        self._index(thing)
         return thing
 
+    def _index(self, thing: Thing) -> None:
+        """Internal: file a Thing by id and label, and a Statement under its
+        subject/predicate/obj ids and its (predicate, subject/obj) pairs."""
+        if thing.id not in self._by_id:
+            self._show_order.add(thing)
+            if not isinstance(thing, Statement):
+                self._label_added(thing.label)
+        self._by_id[thing.id] = thing
+        self._by_label.setdefault(thing.label, set()).add(thing)
+        if isinstance(thing, Statement):
+            for attr in POSITIONS:
+                component = getattr(thing, attr)
+                self._statements_by[attr].setdefault(component.id, set()).add(thing)
+            pred_id = thing.predicate.id
+            for attr in PAIRED_POSITIONS:
+                by_component = self._statements_by_pair[attr].setdefault(pred_id, {})
+                by_component.setdefault(getattr(thing, attr).id, set()).add(thing)
+        self.query_cache.touch(thing)
+
     # --- public construction API ---
 
     def add(self, label: str) -> Thing:
-        """Create a plain Thing (an atom) with this label and add it."""
+        """Return the plain Thing (an atom) with this label, creating it if needed."""
+        existing = self._existing(label, Thing)
+        if existing is not None:
+            return existing
         return self._register(Thing(label))
 
     def add_predicate(self, label: str) -> Predicate:
-        """Create a Predicate with this label and add it."""
+        """Return the Predicate with this label, creating it if needed."""
+        existing = self._existing(label, Predicate)
+        if existing is not None:
+            return existing
         return self._register(Predicate(label))
 
+    def _existing(self, label: str, cls: type[TThing]) -> Optional[TThing]:
+        """Internal: an already registered Thing of exactly `cls` with this label."""
+        for t in self._by_label.get(label, ()):
+            if type(t) is cls:
+                return t
+        return None
+
     def __iter__(self) -> Iterable[Thing]:
         return iter(self.things)
 
@@ -43,24 +165,61 @@ class Ontology:
     def _resolve_things(self, key: Key) -> set[Thing]:
         if isinstance(key, Thing):
             return {key}
-        result: set[Thing] = set()
         if isinstance(key, int):
-            for t in self.things:
-                if t.id == key:
-                    result.add(t)
-        else:  # str
-            for t in self.things:
-                if t.label == key:
-                    result.add(t)
-        return result
+            t = self._by_id.get(key)
+            return {t} if t is not None else set()
+        return set(self._by_label.get(key, ()))  # str
+
+    # --- label search (token / prefix / substring / fuzzy) ---
+
+    def search(
+        self,
+        text: str,
+        mode: str = "substring",
+        limit: Optional[int] = 20,
+        min_score: float = 0.0,
+    ) -> list[Thing]:
+        """
+        Things and Predicates whose label matches `text` under `mode`, one
+        of labels.SEARCH_MODES, best match first. `limit` caps the number
+        of distinct labels (a Thing and a Predicate may share one);
+        `min_score` is the least trigram similarity of fuzzy matches.
+        """
+        found: list[Thing] = []
+        for label, _ in self._label_index().search(text, mode, limit, min_score):
+            matches = [t for t in self._by_label.get(label, ()) if not isinstance(t, Statement)]
+            found.extend(sorted(matches, key=lambda t: t.id))
+        return found
+
+    def _label_index(self) -> LabelIndex:
+        index = self._labels
+        if index is None:
+            store = self._labels_store
+            if store is not None:
+                index = LabelIndex.load(labels_path(store), store)
+            if index is None:
+                index = LabelIndex()
+                index.add_many(t.label for t in self.things if not isinstance(t, Statement))
+            else:
+                index.add_many(self._labels_pending)
+            self._labels_pending.clear()
+            self._labels = index
+        return index
+
+    def _label_added(self, label: str) -> None:
+        if self._labels is not None:
+            self._labels.add(label)
+        elif self._labels_store is not None:
+            self._labels_pending.append(label)
 
     # --- helpful public lookup (single match) for CLI / callers ---
 
     def find_one(self, key: Key) -> Optional[Thing]:
-        matches = self._resolve_things(key)
-        if not matches:
-            return None
-        return next(iter(matches))
+        if isinstance(key, Thing):
+            return key
+        if isinstance(key, int):
+            return self._by_id.get(key)
+        return next(iter(self._by_label.get(key, ())), None)
 
     # --- bind: create a Statement and add it ---
 
@@ -78,45 +237,244 @@ class Ontology:
         )
         return self._register(stmt)
 
+    # --- bulk construction: one id block, one indexing pass ---
+
+    def add_many(self, labels: Iterable[str]) -> list[Thing]:
+        """add() for many labels; returns the Things in the order given."""
+        labels = list(labels)
+        found = self._add_many(labels, Thing)
+        return [found[label] for label in labels]
+
+    def add_predicate_many(self, labels: Iterable[str]) -> list[Predicate]:
+        """add_predicate() for many labels; returns them in the order given."""
+        labels = list(labels)
+        found = self._add_many(labels, Predicate)
+        return [found[label] for label in labels]
+
+    def _add_many(self, labels: Iterable[str], cls: type[TThing]) -> dict[str, TThing]:
+        """Internal: label -> existing or newly registered `cls` Thing."""
+        found: dict[str, TThing] = {}
+        new_labels: list[str] = []
+        for label in dict.fromkeys(labels):
+            if not label:
+                raise ValueError("label cannot be empty")
+            existing = self._existing(label, cls)
+            if existing is None:
+                new_labels.append(label)
+            else:
+                found[label] = existing
+
+        new = []
+        set_label, set_id = Thing.label.__set__, Thing.id.__set__
+        for label, thing_id in zip(new_labels, reserve_ids(len(new_labels))):
+            t = object.__new__(cls)
+            set_label(t, sys.intern(label))
+            set_id(t, thing_id)
+            found[label] = t
+            new.append(t)
+        self._register_many(new)
+        return found
+
+    def bind_many(
+        self, triples: Iterable[Sequence[Union[Thing, str]]]
+    ) -> list[Statement]:
+        """
+        bind() for many (subject, predicate, obj) triples. Terms may be
+        Things or labels; labels are resolved or created like add() and
+        add_predicate(). Returns the new Statements in the order given.
+
+        Ids come from one reserved block and every index is filled in a
+        single pass, so this is several times faster than calling bind()
+        in a loop.
+        """
+        triples = [tuple(t) for t in triples]
+        for t in triples:
+            if len(t) != 3:
+                raise ValueError(f"Expected (subject, predicate, obj), got {t!r}")
+
+        with paused_gc():
+            atoms = self._add_many(
+                (x for s, _, o in triples for x in (s, o) if isinstance(x, str)), Thing
+            )
+            preds = self._add_many((p for _, p, _ in triples if isinstance(p, str)), Predicate)
+
+            # Components passed as Things need registering once, if new;
+            # those resolved from labels just were.
+            by_id = self._by_id
+            unseen: dict[int, Thing] = {}
+            for triple in triples:
+                for t in triple:
+                    if not isinstance(t, str) and t.id not in by_id:
+                        unseen[t.id] = t
+            self._register_many(list(unseen.values()))
+
+            new = []
+            new_stmt = object.__new__
+            set_label, set_id = Thing.label.__set__, Thing.id.__set__
+            set_subject = Statement.subject.__set__
+            set_predicate = Statement.predicate.__set__
+            set_obj = Statement.obj.__set__
+            for (s, p, o), thing_id in zip(triples, reserve_ids(len(triples))):
+                s = atoms[s] if s.__class__ is str else s
+                p = preds[p] if p.__class__ is str else p
+                o = atoms[o] if o.__class__ is str else o
+                stmt = new_stmt(Statement)
+                set_label(stmt, f"{s.label} {p.label} {o.label}")
+                set_id(stmt, thing_id)
+                set_subject(stmt, s)
+                set_predicate(stmt, p)
+                set_obj(stmt, o)
+                new.append(stmt)
+            self._register_many(new)
+        return new
+
+    def _register_many(self, batch: list[Thing]) -> None:
+        """Internal: _register() for Things known to be new, filling every
+        index in one pass over the batch."""
+        if not batch:
+            return
+        if self._journal is not None:
+            for t in batch:
+                self._journal.append(t)
+        self.things.update(batch)
+        self._show_order.add_many(batch)
+        for t in batch:
+            if t.__class__ is not Statement:
+                self._label_added(t.label)
+        by_id, by_label = self._by_id, self._by_label
+        by_subject, by_predicate, by_obj = (self._statements_by[attr] for attr in POSITIONS)
+        pair_subject, pair_obj = (self._statements_by_pair[attr] for attr in PAIRED_POSITIONS)
+        touch = self.query_cache.touch
+
+        for t in batch:
+            by_id[t.id] = t
+            bucket = by_label.get(t.label)
+            if bucket is None:
+                by_label[t.label] = {t}
+            else:
+                bucket.add(t)
+            touch(t)
+            if t.__class__ is not Statement:
+                continue
+            sid, pid, oid = t.subject.id, t.predicate.id, t.obj.id
+            for index, key in ((by_subject, sid), (by_predicate, pid), (by_obj, oid),
+                               (pair_subject.get(pid) or pair_subject.setdefault(pid, {}), sid),
+                               (pair_obj.get(pid) or pair_obj.setdefault(pid, {}), oid)):
+                bucket = index.get(key)
+                if bucket is None:
+                    index[key] = {t}
+                else:
+                    bucket.add(t)
+
     # --- enumerate all possible statements ---
 
-    def enumerate(self) -> None:
-        all_things = list(self.things)
+    def candidates(
+        self,
+        subject: Key | None = None,
+        predicate: Key | None = None,
+        object: Key | None = None,
+    ) -> CandidateSpace:
+        """
+        Lazy view of every Statement enumerate() would bind, optionally
+        narrowed like show(). Nothing is created until a candidate is bound.
+        """
+        all_things = sorted(self.things, key=lambda t: t.id)
         predicates = [t for t in all_things if isinstance(t, Predicate)]
+        space = CandidateSpace(self, all_things, predicates, all_things)
+        if subject is None and predicate is None and object is None:
+            return space
+        return space.filter(subject=subject, predicate=predicate, object=object)
 
-        for subj in all_things:
-            for pred in predicates:
-                for obj in all_things:
-                    self.bind(subj, pred, obj)
+    def enumerate(self) -> None:
+        """Bind every candidate statement (see candidates() for a lazy view)."""
+        for candidate in self.candidates():
+            self.bind(*candidate)
 
     # --- internal slice ---
 
-    def _slice(self, key: Key, attr: str) -> set[Statement]:
+    def _slice(self, key: Key, attr: str) -> frozenset[Statement]:
+        cache_key = ("slice", attr, normalize_key(key))
+        hit = self.query_cache.get(cache_key)
+        if hit is not None:
+            return hit
         targets = self._resolve_things(key)
-        if not targets:
-            return set()
+        result = frozenset(self._statements_with(targets, attr))
+        self.query_cache.put(cache_key, result, self._key_dependencies(key, targets), len(result))
+        return result
 
+    def _key_dependencies(self, key: Key, targets: Iterable[Thing]) -> List[Dependency]:
+        """Internal: what a lookup by `key` that resolved to `targets` depends on."""
+        deps = list(key_dependencies(key))
+        deps.extend(("id", t.id) for t in targets)
+        return deps
+
+    def _statements_with(self, targets: set[Thing], attr: str) -> set[Statement]:
+        """Internal: Statements whose `attr` is one of `targets`, via the index."""
+        by_id = self._statements_by[attr]
         result: set[Statement] = set()
-        for t in self.things:
-            if isinstance(t, Statement) and getattr(t, attr) in targets:
-                result.add(t)
+        for target in targets:
+            result.update(by_id.get(target.id, ()))
         return result
 
-    # --- pretty-print helper for a single Thing (recursive on Statement) ---
+    def _pair_slice(self, attr: str, predicate_id: int, component_id: int) -> set[Statement]:
+        """Internal: Statements with this predicate and this subject/obj."""
+        return self._statements_by_pair[attr].get(predicate_id, {}).get(component_id, set())
+
+    # --- statistics and multi-pattern queries ---
+
+    def statement_count(self) -> int:
+        return sum(len(s) for s in self._statements_by["predicate"].values())
+
+    def predicate_stats(self, predicate_id: int) -> tuple[int, int, int]:
+        """(statements, distinct subjects, distinct objects) for a predicate."""
+        return (
+            len(self._statements_by["predicate"].get(predicate_id, ())),
+            len(self._statements_by_pair["subject"].get(predicate_id, ())),
+            len(self._statements_by_pair["obj"].get(predicate_id, ())),
+        )
+
+    def query(self, patterns: Iterable[Pattern]) -> Iterable[Binding]:
+        """
+        Lazily yield every variable binding that satisfies all patterns,
+        e.g. [("?x", "livesIn", "?c"), ("?x", "type", "Human")].
+        Terms are "?variables" or keys resolved like show(); see query.py.
+        """
+        patterns = [tuple(p) for p in patterns]
+        cache_key = ("query", tuple(
+            tuple(t if is_variable(t) else normalize_key(t) for t in p) for p in patterns
+        ))
+        hit = self.query_cache.get(cache_key)
+        if hit is not None:
+            return (dict(b) for b in hit)
+        query = Query(self, patterns)
+        return self._record_query(cache_key, query)
+
+    def _record_query(self, cache_key: Hashable, query: Query) -> Iterator[Binding]:
+        """Internal: yield the query's bindings, caching them once exhausted."""
+        generation = self.query_cache.generation
+        # A change to the results needs a new Statement matching some pattern,
+        # and that Statement touches every constant of the pattern it matches.
+        deps: List[Dependency] = []
+        for p, terms in zip(query.patterns, query._terms):
+            constants = [(key, term) for key, term in zip(p, terms) if term.var is None]
+            if not constants:
+                deps = [ANY]
+                break
+            for key, term in constants:
+                deps.extend(key_dependencies(key))
+                deps.extend(("id", i) for i in term.ids)
+        results: List[Binding] = []
+        for binding in query:
+            results.append(binding)
+            yield dict(binding)
+        self.query_cache.put(cache_key, results, deps, len(results), generation=generation)
+
+    # --- pretty-print helper for a single Thing (see render.py) ---
 
     def _pretty_print_thing(self, t: Thing, indent: int = 0) -> None:
-        pad = " " * indent
-
-        if isinstance(t, Statement):
-            print(f"{pad}Statement(label={t.label!r}, id={t.id})")
-            print(f"{pad}  subject:")
-            self._pretty_print_thing(t.subject, indent + 4)
-            print(f"{pad}  predicate:")
-            self._pretty_print_thing(t.predicate, indent + 4)
-            print(f"{pad}  object:")
-            self._pretty_print_thing(t.obj, indent + 4)
-        else:
-            print(pad + repr(t))
+        renderer = Renderer(sys.stdout)
+        renderer.render(t, indent)
+        renderer.flush()
 
     # --- universal show() ---
 
@@ -127,9 +485,91 @@ class Ontology:
         subject: Key | None = None,
         predicate: Key | None = None,
         object: Key | None = None,
-    ) -> None:
+        limit: Optional[int] = None,
+        offset: int = 0,
+        cursor: Optional[int] = None,
+        file: Optional[TextIO] = None,
+        max_depth: Optional[int] = DEFAULT_MAX_DEPTH,
+    ) -> Optional[int]:
+        """
+        Print the matching Things to `file` (default: stdout), expanding
+        Statements down to `max_depth` levels (None: no limit).
+
+        Things come in show order (see ordering.py). `cursor` is the id
+        of the last Thing of a previous page: printing resumes after it.
+        Then `offset` Things are skipped and at most `limit` printed.
+        Returns the cursor of the next page if `limit` cut the listing
+        short, else None.
+        """
+        if (limit is not None and limit < 1) or offset < 0:
+            raise ValueError("limit must be positive and offset not negative")
+        renderer = Renderer(sys.stdout if file is None else file, max_depth)
+        fetch = None if limit is None else limit + 1     # one more tells if there is a next page
+        last: Optional[Thing] = None
+        printed = 0
+        for t in self._show_page(key, subject, predicate, object, fetch, offset, cursor):
+            if printed == limit:
+                renderer.flush()
+                return last.id
+            renderer.render(t)
+            renderer.blank()
+            last = t
+            printed += 1
+        renderer.flush()
+        return None
+
+    def _show_page(
+        self,
+        key: Key | None,
+        subject: Key | None,
+        predicate: Key | None,
+        object: Key | None,
+        limit: Optional[int],
+        offset: int,
+        cursor: Optional[int],
+    ) -> Iterator[Thing]:
+        """
+        Internal: the Things show() prints, in order, lazily. Unfiltered
+        listings stream from the ordered index; filtered ones use a cached
+        full result if there is one, a heap-based top-k when only the
+        first `offset + limit` are wanted, and a full sort otherwise.
+        """
+        after = None
+        if cursor is not None:
+            last = self._by_id.get(cursor)
+            if last is None:
+                raise ValueError(f"Unknown cursor: {cursor!r}")
+            after = show_key(last)
+        stop = None if limit is None else offset + limit
+
+        by_id = self._by_id
+        if key is None and subject is None and predicate is None and object is None:
+            keys = islice(self._show_order.after(self.things, after), offset, stop)
+            return (by_id[k[2]] for k in keys)
+
+        cache_key = ("show",) + tuple(normalize_key(k) for k in (key, subject, predicate, object))
+        ordered = self.query_cache.get(cache_key)
+        if ordered is None and stop is None:
+            ordered = self._show_results(key, subject, predicate, object)
+        if ordered is not None:
+            first = 0 if after is None else bisect_right(ordered, after, key=show_key)
+            return iter(ordered[first + offset : None if stop is None else first + stop])
+
+        matches, _ = self._show_matches(key, subject, predicate, object)
+        if after is not None:
+            matches = [t for t in matches if show_key(t) > after]
+        return iter(heapq.nsmallest(stop, matches, key=show_key)[offset:])
+
+    def _show_matches(
+        self,
+        key: Key | None,
+        subject: Key | None,
+        predicate: Key | None,
+        object: Key | None,
+    ) -> tuple[set[Thing], List[Dependency]]:
+        """Internal: the Things show() prints, unordered, and what they depend on."""
         results: set[Thing] = set()
-        stmt_filters: list[set[Statement]] = []
+        stmt_filters: list[frozenset[Statement]] = []
 
         if subject is not None:
             stmt_filters.append(self._slice(subject, "subject"))
@@ -147,46 +587,150 @@ class Ontology:
         if key is not None:
             targets = self._resolve_things(key)
             results.update(targets)
-            for t in self.things:
-                if isinstance(t, Statement):
-                    if (
-                        t.subject in targets
-                        or t.predicate in targets
-                        or t.obj in targets
-                    ):
-                        results.add(t)
+            for attr in POSITIONS:
+                results.update(self._statements_with(targets, attr))
 
         if not results and key is None and not stmt_filters:
             results = set(self.things)
 
-        def sort_key(x: Thing):
-            if isinstance(x, Statement):
-                kind_rank = 2
-            elif isinstance(x, Predicate):
-                kind_rank = 1
-            else:
-                kind_rank = 0
-            return (kind_rank, x.label, x.id)
-
-        for t in sorted(results, key=sort_key):
-            self._pretty_print_thing(t)
-            print()
+        deps: List[Dependency] = []
+        for k in (key, subject, predicate, object):
+            if k is not None:
+                deps.extend(self._key_dependencies(k, self._resolve_things(k)))
+        if not deps:
+            deps.append(ANY)
+        return results, deps
 
-    # --- pickle persistence ---
+    def _show_results(
+        self,
+        key: Key | None,
+        subject: Key | None,
+        predicate: Key | None,
+        object: Key | None,
+    ) -> tuple[Thing, ...]:
+        """Internal: every Thing show() prints, sorted, through the query cache."""
+        cache_key = ("show",) + tuple(normalize_key(k) for k in (key, subject, predicate, object))
+        hit = self.query_cache.get(cache_key)
+        if hit is not None:
+            return hit
+
+        results, deps = self._show_matches(key, subject, predicate, object)
+        ordered = tuple(sorted(results, key=show_key))
+        self.query_cache.put(cache_key, ordered, deps, len(ordered))
+        return ordered
+
+    # --- persistence: binary snapshot (default) or pickle ---
+
+    def save(self, path: str, format: str = "snapshot") -> None:
+        """
+        Save the ontology to `path`.
+
+        format="snapshot" writes the versioned binary snapshot format (see
+        snapshot.py); format="pickle" writes the older pickle store. A
+        label search index that was built is saved next to it.
+        """
+        if format not in ("snapshot", "pickle"):
+            raise ValueError(f"Unknown store format: {format!r}")
+        with StoreLock(path):
+            if format == "snapshot":
+                write_snapshot(self.things, path)
+            else:
+                with open(path, "wb") as f:
+                    pickle.dump(self, f)
+            # The store now holds everything; a log left next to it would be
+            # replayed on top of unrelated contents.
+            journal = Journal(path)
+            if self._journal is not None and self._journal.path == journal.path:
+                journal = self._journal     # also drop its uncommitted records
+            journal.clear()
+
+        index_path = labels_path(path)
+        if self._labels is not None:
+            self._labels.save(index_path, path)
+        elif os.path.exists(index_path):
+            os.remove(index_path)     # describes the store just replaced
 
-    def save(self, path: str) -> None:
-        with open(path, "wb") as f:
-            pickle.dump(self, f)
+    @classmethod
+    def open(cls, path: str) -> Ontology:
+        """
+        Open a binary snapshot through mmap.
+
+        Records are read directly from the mapped file (no unpickling) and
+        the id counter is reset from the max-id stored in the header.
+        """
+        with Snapshot(path) as snap:
+            onto = cls(set(snap.things()))
+            reset_counter(snap.max_id + 1)
+        onto._labels_store = path
+        onto._replay(path)
+        return onto
 
     @classmethod
     def load(cls, path: str) -> Ontology:
+        """Load a store written by save(), in either format."""
+        if is_snapshot(path):
+            return cls.open(path)
+
         with open(path, "rb") as f:
             onto: Ontology = pickle.load(f)
 
         max_id = max((t.id for t in onto.things), default=-1)
         reset_counter(max_id + 1 if max_id >= 0 else 0)
+        onto._labels_store = path
+        onto._replay(path)
         return onto
 
+    # --- append-only log (see journal.py) ---
+
+    def _replay(self, path: str) -> None:
+        """Internal: register the Things recorded in the store's log."""
+        max_id = -1
+        for rec in Journal(path).records():
+            max_id = max(max_id, rec.id)
+            if rec.id in self._by_id:
+                continue        # already folded into the store
+            if rec.kind == STATEMENT_KIND:
+                thing = object.__new__(Statement)
+                object.__setattr__(thing, "subject", self._by_id[rec.subject])
+                object.__setattr__(thing, "predicate", self._by_id[rec.predicate])
+                object.__setattr__(thing, "obj", self._by_id[rec.obj])
+            else:
+                thing = object.__new__(KIND_CLASSES[rec.kind])
+            object.__setattr__(thing, "label", rec.label)
+            object.__setattr__(thing, "id", rec.id)
+            self._register(thing)
+        if max_id >= 0:
+            max_stored = max(self._by_id, default=-1)
+            reset_counter(max(max_id, max_stored) + 1)
+
+    def attach_journal(self, path: str) -> None:
+        """
+        Record every Thing registered from now on in the log of the store
+        at `path`, instead of rewriting the store on each change. The
+        records become durable on commit().
+        """
+        self._journal = Journal(path)
+
+    def commit(self) -> None:
+        """Write and fsync the log records of changes since the last commit."""
+        if self._journal is None:
+            raise ValueError("No journal attached; use save() or attach_journal()")
+        self._journal.commit()
+
+    @classmethod
+    def compact(cls, path: str) -> int:
+        """
+        Fold the log of the store at `path` into a new snapshot and drop
+        the log. Returns the number of log records folded in.
+        """
+        with StoreLock(path):       # no appends between reading and replacing
+            records = sum(1 for _ in Journal(path).records())
+            onto = cls.load(path)
+            if os.path.exists(labels_path(path)):
+                onto._label_index()     # keep the saved label index, brought up to date
+            onto.save(path)
+        return records
+
     # --- portable JSON export/import ---
 
     def to_dict(self) -> Dict[str, Any]:
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from ._gc import paused_gc
+from .predicate import Predicate
+from .statement import Statement
+from .thing import Thing
+
+# show() lists Things atoms first, then Predicates, then Statements, each
+# group by label and then id. ShowKey is that order as a tuple.
+
+ShowKey = Tuple[int, str, int]
+
+
+def show_key(t: Thing) -> ShowKey:
+    if isinstance(t, Statement):
+        kind_rank = 2
+    elif isinstance(t, Predicate):
+        kind_rank = 1
+    else:
+        kind_rank = 0
+    return (kind_rank, t.label, t.id)
+
+
+class OrderedIndex:
+    """
+    The show_key of every Thing of an ontology, sorted, so unfiltered
+    listings stream in order from any position instead of sorting all
+    Things each time.
+
+    Built on first use. New Things are only collected until the next
+    read, which merges them in with one sort; timsort finds the two
+    sorted runs, so that costs O(n + k log k) for k new Things rather
+    than an insertion into the list per Thing.
+    """
+
+    def __init__(self) -> None:
+        self._keys: Optional[List[ShowKey]] = None
+        self._pending: List[ShowKey] = []
+
+    def add(self, thing: Thing) -> None:
+        if self._keys is not None:
+            self._pending.append(show_key(thing))
+
+    def add_many(self, things: Iterable[Thing]) -> None:
+        if self._keys is not None:
+            self._pending.extend(map(show_key, things))
+
+    def keys(self, things: Iterable[Thing]) -> List[ShowKey]:
+        """The sorted keys; `things` are the ontology's, to build from."""
+        if self._keys is None:
+            with paused_gc():       # one tuple per Thing, nothing cyclic
+                self._keys = sorted(map(show_key, things))
+            self._pending.clear()
+        elif self._pending:
+            self._pending.sort()
+            self._keys.extend(self._pending)
+            self._keys.sort()
+            self._pending.clear()
+        return self._keys
+
+    def after(self, things: Iterable[Thing], key: Optional[ShowKey]) -> Iterator[ShowKey]:
+        """Keys in order, starting after `key` (from the start if None)."""
+        keys = self.keys(things)
+        i = 0 if key is None else bisect_right(keys, key)
+        while i < len(keys):
+            yield keys[i]
+            i += 1
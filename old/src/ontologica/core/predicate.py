@@ -5,7 +5,9 @@ from dataclasses import dataclass
 from .thing import Thing
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Predicate(Thing):
     """Binary predicate; currently shares behavior with Thing."""
-    pass
+
+    __getstate__ = Thing.__getstate__
+    __setstate__ = Thing.__setstate__
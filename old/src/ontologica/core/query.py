@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .statement import Statement
+from .thing import Thing
+
+if TYPE_CHECKING:
+    from .ontology import Key, Ontology
+
+# A pattern is (subject, predicate, obj). Each term is a variable -- a
+# string starting with "?" -- or a Key (Thing, id or label) naming the
+# Thing(s) that position must hold:
+#
+#     [("?x", "livesIn", "?c"), ("?x", "type", "Human")]
+
+Pattern = Tuple["Key", "Key", "Key"]
+Binding = Dict[str, Thing]
+
+
+def is_variable(term: object) -> bool:
+    return isinstance(term, str) and term.startswith("?")
+
+
+class _Term:
+    """One pattern position: a variable name, or the ids a constant resolves to."""
+
+    __slots__ = ("var", "ids")
+
+    def __init__(self, var: Optional[str], ids: frozenset[int]):
+        self.var = var
+        self.ids = ids
+
+
+class Query:
+    """
+    A basic graph pattern: a conjunction of triple patterns, evaluated
+    by index nested-loop joins over the Ontology's statement indexes.
+
+    The join order is chosen once, greedily: at each step the pattern
+    with the fewest estimated matches given the variables bound so far
+    goes next, preferring patterns connected to what is already bound.
+    Estimates come from the per-predicate statistics the Ontology keeps
+    (statement count, distinct subjects, distinct objects), plus exact
+    counts for constant positions.
+    """
+
+    def __init__(self, ontology: Ontology, patterns: Sequence[Pattern]):
+        if not patterns:
+            raise ValueError("A query needs at least one pattern")
+        self.ontology = ontology
+        self.patterns = [tuple(p) for p in patterns]
+        for p in self.patterns:
+            if len(p) != 3:
+                raise ValueError(f"Patterns must have 3 terms (subject, predicate, obj), got {p!r}")
+        self._terms = [tuple(self._term(t) for t in p) for p in self.patterns]
+        self.order = self._plan()
+
+    # --- planning ---
+
+    def _term(self, term: Key) -> _Term:
+        if is_variable(term):
+            return _Term(term, frozenset())
+        return _Term(None, frozenset(t.id for t in self.ontology._resolve_things(term)))
+
+    def estimate(self, i: int, bound: Iterable[str] = ()) -> float:
+        """Estimated matches of pattern i when the variables in `bound` are known."""
+        onto = self.ontology
+        bound = set(bound)
+        s, p, o = self._terms[i]
+        stats = onto.predicate_stats
+
+        if p.var is None:
+            # Exact for constant subject/obj, average fan-out for bound variables.
+            best = 0.0
+            for pid in p.ids:
+                count, n_subjects, n_objects = stats(pid)
+                est = float(count)
+                if s.var is None:
+                    est = min(est, sum(len(onto._pair_slice("subject", pid, sid)) for sid in s.ids))
+                elif s.var in bound:
+                    est = min(est, count / max(1, n_subjects))
+                if o.var is None:
+                    est = min(est, sum(len(onto._pair_slice("obj", pid, oid)) for oid in o.ids))
+                elif o.var in bound:
+                    est = min(est, count / max(1, n_objects))
+                best += est
+            return best
+
+        total = float(onto.statement_count())
+        est = total
+        for term, attr in ((s, "subject"), (o, "obj")):
+            index = onto._statements_by[attr]
+            if term.var is None:
+                est = min(est, sum(len(index.get(i, ())) for i in term.ids))
+            elif term.var in bound:
+                est = min(est, total / max(1, len(index)))
+        if p.var in bound:
+            est = est / max(1, len(onto._statements_by["predicate"]))
+        return est
+
+    def _plan(self) -> List[int]:
+        remaining = list(range(len(self.patterns)))
+        bound: set[str] = set()
+        order: List[int] = []
+        while remaining:
+            def cost(i: int) -> Tuple[bool, float]:
+                vars_ = {t.var for t in self._terms[i] if t.var}
+                disconnected = bool(bound) and bool(vars_) and not (vars_ & bound)
+                return (disconnected, self.estimate(i, bound))
+
+            best = min(remaining, key=cost)
+            remaining.remove(best)
+            order.append(best)
+            bound.update(t.var for t in self._terms[best] if t.var)
+        return order
+
+    # --- evaluation ---
+
+    def __iter__(self) -> Iterator[Binding]:
+        steps = [self._terms[i] for i in self.order]
+        yield from self._solve(steps, 0, {})
+
+    def _solve(self, steps, depth: int, binding: Binding) -> Iterator[Binding]:
+        if depth == len(steps):
+            yield dict(binding)
+            return
+        terms = steps[depth]
+        for stmt in self._candidates(terms, binding):
+            added: List[str] = []
+            ok = True
+            for term, value in zip(terms, (stmt.subject, stmt.predicate, stmt.obj)):
+                if term.var is None:
+                    if value.id not in term.ids:
+                        ok = False
+                        break
+                    continue
+                current = binding.get(term.var)
+                if current is None:
+                    binding[term.var] = value
+                    added.append(term.var)
+                elif current.id != value.id:
+                    ok = False
+                    break
+            if ok:
+                yield from self._solve(steps, depth + 1, binding)
+            for var in added:
+                del binding[var]
+
+    def _ids(self, term: _Term, binding: Binding) -> Optional[Iterable[int]]:
+        """Ids the position is restricted to, or None if it is free."""
+        if term.var is None:
+            return term.ids
+        value = binding.get(term.var)
+        return None if value is None else (value.id,)
+
+    def _candidates(self, terms, binding: Binding) -> Iterable[Statement]:
+        """Statements that can match, from the narrowest index available."""
+        onto = self.ontology
+        s_ids, p_ids, o_ids = (self._ids(t, binding) for t in terms)
+
+        if p_ids is not None:
+            for pid in p_ids:
+                if s_ids is not None and (o_ids is None or len(s_ids) <= len(o_ids)):
+                    for sid in s_ids:
+                        yield from onto._pair_slice("subject", pid, sid)
+                elif o_ids is not None:
+                    for oid in o_ids:
+                        yield from onto._pair_slice("obj", pid, oid)
+                else:
+                    yield from onto._statements_by["predicate"].get(pid, ())
+            return
+
+        for ids, attr in ((s_ids, "subject"), (o_ids, "obj")):
+            if ids is not None:
+                index = onto._statements_by[attr]
+                for i in ids:
+                    yield from index.get(i, ())
+                return
+
+        for stmts in onto._statements_by["predicate"].values():
+            yield from stmts
+
+    def explain(self) -> List[Tuple[Pattern, float]]:
+        """The patterns in evaluation order with their estimates."""
+        bound: set[str] = set()
+        out = []
+        for i in self.order:
+            out.append((self.patterns[i], self.estimate(i, bound)))
+            bound.update(t.var for t in self._terms[i] if t.var)
+        return out
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from typing import List, Optional, Set, TextIO
+
+from .statement import Statement
+from .thing import Thing
+
+# Text layout of Ontology.show(), one Thing at a time:
+#
+#   Statement(label='a p b', id=7)
+#     subject:
+#       Thing(label='a', id=1)
+#     predicate:
+#       Predicate(label='p', id=2)
+#     object:
+#       Thing(label='b', id=3)
+#
+# Every level of nesting indents by INDENT. A Statement deeper than the
+# depth limit is shown as its header followed by TRUNCATED, one that
+# (through corrupted data) contains itself by its header and CYCLE.
+
+INDENT = 4
+DEFAULT_MAX_DEPTH = 100
+TRUNCATED = " ..."
+CYCLE = " <cycle>"
+
+# Lines buffered before a write to the output stream.
+FLUSH_LINES = 4096
+
+# Work items of the explicit stack.
+_THING, _TEXT, _END = 0, 1, 2
+
+
+class Renderer:
+    """
+    Renders Things in the show() layout to a text stream, iteratively.
+
+    Statements are expanded with an explicit stack rather than recursion,
+    so nesting depth is limited only by `max_depth` (None for no limit).
+    Every stack item produces a line, so the work is linear in the size
+    of the output, and a Statement shared by several others is simply
+    expanded again wherever it appears.
+
+    Lines go to the output stream as they are produced, through a buffer
+    of at most FLUSH_LINES; call flush() when done. Besides that buffer,
+    memory holds only the stack and the Statements being expanded: a few
+    entries per level of nesting.
+    """
+
+    def __init__(self, out: TextIO, max_depth: Optional[int] = DEFAULT_MAX_DEPTH):
+        self.out = out
+        self.max_depth = max_depth
+        self._buffer: List[str] = []
+
+    # --- rendering ---
+
+    def render(self, thing: Thing, indent: int = 0) -> None:
+        emit, max_depth = self._emit, self.max_depth
+        active: Set[int] = set()    # Statements being expanded (for cycles)
+        stack: list = [(_THING, thing, indent, 0)]
+
+        while stack:
+            item = stack.pop()
+            kind = item[0]
+
+            if kind == _TEXT:
+                emit(item[1], item[2])
+                continue
+
+            if kind == _END:
+                active.discard(item[1])
+                continue
+
+            _, t, ind, depth = item
+            if not isinstance(t, Statement):
+                emit(ind, repr(t))
+                continue
+
+            header = f"Statement(label={t.label!r}, id={t.id})"
+            if t.id in active:
+                emit(ind, header + CYCLE)
+                continue
+            if max_depth is not None and depth >= max_depth:
+                emit(ind, header + TRUNCATED)
+                continue
+
+            active.add(t.id)
+            emit(ind, header)
+            inner, child = ind + INDENT, depth + 1
+            stack.append((_END, t.id))
+            stack.append((_THING, t.obj, inner, child))
+            stack.append((_TEXT, ind + 2, "object:"))
+            stack.append((_THING, t.predicate, inner, child))
+            stack.append((_TEXT, ind + 2, "predicate:"))
+            stack.append((_THING, t.subject, inner, child))
+            stack.append((_TEXT, ind + 2, "subject:"))
+
+    def blank(self) -> None:
+        """An empty line (between the Things show() prints)."""
+        self._emit(0, "")
+
+    # --- output ---
+
+    def _emit(self, indent: int, text: str) -> None:
+        buffer = self._buffer
+        buffer.append(" " * indent + text + "\n")
+        if len(buffer) >= FLUSH_LINES:
+            self.out.write("".join(buffer))
+            buffer.clear()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self.out.write("".join(self._buffer))
+            self._buffer.clear()
+        self.out.flush()
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Iterable, Iterator, Optional
+
+from .predicate import Predicate
+from .statement import Statement
+from .thing import Thing
+
+# Binary snapshot layout (all integers int64 in native little-endian order):
+#
+#   header       HEADER struct, see below
+#   string table (n_strings + 1) offsets into the blob, then the UTF-8 blob
+#   nodes        n_nodes records of      (id, label, kind)
+#   statements   n_statements records of (id, label, subject, predicate, obj)
+#
+# `label` fields are string-table indexes, `kind` is one of NODE_KINDS and
+# subject/predicate/obj are Thing ids. Node and statement records are
+# sorted by id, so a single record can be found by binary search straight
+# from the mapped file. Every section starts on an 8-byte boundary so it
+# can be viewed as an int64 array without copying.
+
+MAGIC = b"ONTSNAP\x00"
+VERSION = 1
+HEADER = struct.Struct("<8sIIqqqqqqq")
+NODE_FIELDS = 3
+STATEMENT_FIELDS = 5
+
+NODE_KINDS = {Thing: 0, Predicate: 1}
+KIND_CLASSES = {code: cls for cls, code in NODE_KINDS.items()}
+
+
+def is_snapshot(path: str) -> bool:
+    """True if the file at `path` starts with the snapshot magic bytes."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def _pad(n: int) -> int:
+    return -n % 8
+
+
+def write_snapshot(things: Iterable[Thing], path: str) -> None:
+    """
+    Write `things` to `path` in the binary snapshot format.
+
+    The file is written next to `path` and renamed over it, so a crash
+    mid-write never leaves a truncated store behind.
+    """
+    strings: dict[str, int] = {}
+    nodes: list[Thing] = []
+    statements: list[Statement] = []
+
+    for t in things:
+        (statements if isinstance(t, Statement) else nodes).append(t)
+    nodes.sort(key=lambda t: t.id)
+    statements.sort(key=lambda t: t.id)
+
+    def intern(label: str) -> int:
+        idx = strings.get(label)
+        if idx is None:
+            idx = strings[label] = len(strings)
+        return idx
+
+    node_records = array("q")
+    for t in nodes:
+        node_records.extend((t.id, intern(t.label), NODE_KINDS[type(t)]))
+
+    stmt_records = array("q")
+    for s in statements:
+        stmt_records.extend(
+            (s.id, intern(s.label), s.subject.id, s.predicate.id, s.obj.id)
+        )
+
+    encoded = [label.encode("utf-8") for label in strings]
+    offsets = array("q", [0])
+    for b in encoded:
+        offsets.append(offsets[-1] + len(b))
+    blob = b"".join(encoded)
+
+    max_id = max(
+        (nodes[-1].id if nodes else -1, statements[-1].id if statements else -1)
+    )
+
+    strings_offset = HEADER.size + _pad(HEADER.size)
+    nodes_offset = strings_offset + offsets.itemsize * len(offsets) + len(blob)
+    nodes_offset += _pad(nodes_offset)
+    statements_offset = nodes_offset + node_records.itemsize * len(node_records)
+
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        0,  # flags, reserved
+        max_id,
+        len(encoded),
+        len(nodes),
+        len(statements),
+        strings_offset,
+        nodes_offset,
+        statements_offset,
+    )
+
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(b"\x00" * (strings_offset - HEADER.size))
+        offsets.tofile(f)
+        f.write(blob)
+        f.write(b"\x00" * _pad(f.tell()))
+        node_records.tofile(f)
+        stmt_records.tofile(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class Snapshot:
+    """
+    Read-only, memory-mapped view of a snapshot file.
+
+    Opening only parses the header; records and strings are read
+    straight from the mapping on demand, so only the pages a lookup
+    touches are ever faulted in.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError(f"{path!r} is too small to be an ontology snapshot")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            magic,
+            version,
+            _flags,
+            self.max_id,
+            self.n_strings,
+            self.n_nodes,
+            self.n_statements,
+            strings_offset,
+            nodes_offset,
+            statements_offset,
+        ) = HEADER.unpack_from(self._mmap, 0)
+
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path!r} is not an ontology snapshot")
+        if version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"Unsupported snapshot version {version} in {path!r}")
+
+        view = memoryview(self._mmap)
+        offsets_end = strings_offset + 8 * (self.n_strings + 1)
+        self._offsets = view[strings_offset:offsets_end].cast("q")
+        self._blob_start = offsets_end
+        self._nodes_offset = nodes_offset
+        self._statements_offset = statements_offset
+        self._nodes = view[
+            nodes_offset : nodes_offset + 8 * NODE_FIELDS * self.n_nodes
+        ].cast("q")
+        self._statements = view[
+            statements_offset : statements_offset + 8 * STATEMENT_FIELDS * self.n_statements
+        ].cast("q")
+
+    # --- context manager / cleanup ---
+
+    def close(self) -> None:
+        for v in (self._offsets, self._nodes, self._statements):
+            v.release()
+        self._mmap.close()
+
+    def __enter__(self) -> Snapshot:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # --- zero-copy record access ---
+
+    def string(self, index: int) -> str:
+        start = self._blob_start + self._offsets[index]
+        end = self._blob_start + self._offsets[index + 1]
+        return self._mmap[start:end].decode("utf-8")
+
+    def node(self, row: int) -> tuple[int, str, int]:
+        """(id, label, kind) of the node record at `row`."""
+        base = row * NODE_FIELDS
+        n = self._nodes
+        return n[base], self.string(n[base + 1]), n[base + 2]
+
+    def statement(self, row: int) -> tuple[int, str, int, int, int]:
+        """(id, label, subject_id, predicate_id, obj_id) of the record at `row`."""
+        base = row * STATEMENT_FIELDS
+        s = self._statements
+        return (
+            s[base],
+            self.string(s[base + 1]),
+            s[base + 2],
+            s[base + 3],
+            s[base + 4],
+        )
+
+    def _search(self, records: memoryview, width: int, count: int, thing_id: int) -> int:
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if records[mid * width] < thing_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < count and records[lo * width] == thing_id:
+            return lo
+        return -1
+
+    def find(self, thing_id: int) -> Optional[tuple]:
+        """
+        The node or statement record with this id, or None.
+        O(log n) and reads only the pages along the binary search.
+        """
+        row = self._search(self._nodes, NODE_FIELDS, self.n_nodes, thing_id)
+        if row >= 0:
+            return self.node(row)
+        row = self._search(self._statements, STATEMENT_FIELDS, self.n_statements, thing_id)
+        if row >= 0:
+            return self.statement(row)
+        return None
+
+    # --- materialization ---
+
+    def things(self) -> Iterator[Thing]:
+        """
+        Build every Thing/Predicate/Statement in the snapshot, components
+        before the Statements that use them.
+        """
+        by_id: dict[int, Thing] = {}
+        labels = [self.string(i) for i in range(self.n_strings)]
+        nodes, statements = self._nodes, self._statements
+
+        # Slot descriptors set fields directly, bypassing the frozen
+        # __setattr__ and the id counter that __init__ would draw from.
+        new = object.__new__
+        set_label, set_id = Thing.label.__set__, Thing.id.__set__
+        set_subject = Statement.subject.__set__
+        set_predicate = Statement.predicate.__set__
+        set_obj = Statement.obj.__set__
+
+        for base in range(0, self.n_nodes * NODE_FIELDS, NODE_FIELDS):
+            thing_id = nodes[base]
+            t = new(KIND_CLASSES[nodes[base + 2]])
+            set_label(t, sys.intern(labels[nodes[base + 1]]))
+            set_id(t, thing_id)
+            by_id[thing_id] = t
+            yield t
+
+        # Statements are sorted by id, and a Statement is always newer than
+        # its components, so a single pass normally suffices; anything whose
+        # components are still missing is retried until no progress is made.
+        pending = range(0, self.n_statements * STATEMENT_FIELDS, STATEMENT_FIELDS)
+        while pending:
+            deferred = []
+            for base in pending:
+                s_id, p_id, o_id = statements[base + 2 : base + 5]
+                if s_id in by_id and p_id in by_id and o_id in by_id:
+                    pred = by_id[p_id]
+                    if not isinstance(pred, Predicate):
+                        raise ValueError(f"Expected Predicate, got {type(pred)}")
+                    thing_id = statements[base]
+                    stmt = new(Statement)
+                    set_label(stmt, labels[statements[base + 1]])
+                    set_id(stmt, thing_id)
+                    set_subject(stmt, by_id[s_id])
+                    set_predicate(stmt, pred)
+                    set_obj(stmt, by_id[o_id])
+                    by_id[thing_id] = stmt
+                    yield stmt
+                else:
+                    deferred.append(base)
+            if len(deferred) == len(pending):
+                raise ValueError(
+                    f"Snapshot {self.path!r} has statements with missing components"
+                )
+            pending = deferred
+
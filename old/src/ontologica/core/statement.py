@@ -7,12 +7,17 @@ from .predicate import Predicate
 from .thing import Thing
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Statement(Thing):
     subject: Thing
     predicate: Predicate
     obj: Thing
 
+    # Hashing and equality are inherited from Thing (by id), so a deeply
+    # reified Statement hashes in O(1) rather than walking its components.
+    __getstate__ = Thing.__getstate__
+    __setstate__ = Thing.__setstate__
+
     def __init__(self, label: str, subject: Thing, predicate: Predicate, obj: Thing):
         # Work around frozen dataclass by using object.__setattr__ and manual ids.
         object.__setattr__(self, "label", label)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
+from typing import Any
 
 from .identifiers import next_id
 
@@ -9,7 +11,7 @@ def thing_set_factory() -> set[Thing]:  # pragma: no cover - trivial helper
     return set()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Thing:
     label: str
     id: int = field(default_factory=next_id, init=False)
@@ -17,3 +19,28 @@ class Thing:
     def __post_init__(self) -> None:
         if not self.label:
             raise ValueError("label cannot be empty")
+        object.__setattr__(self, "label", sys.intern(self.label))
+
+    # --- identity: ids are unique, so compare and hash by id alone ---
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.id == other.id  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    # --- pickling (slots, so no instance __dict__) ---
+
+    def __getstate__(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, f.name) for f in fields(self))
+
+    def __setstate__(self, state: tuple[Any, ...] | dict[str, Any]) -> None:
+        # Pickles written before Things had slots carry the instance __dict__.
+        if isinstance(state, dict):
+            items = state.items()
+        else:
+            items = zip((f.name for f in fields(self)), state)
+        for name, value in items:
+            object.__setattr__(self, name, value)
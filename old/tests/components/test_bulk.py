@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+
+from ontologica import Ontology, Predicate, Statement
+from ontologica.core.identifiers import next_id, reserve_ids
+
+
+def test_reserve_ids_returns_a_contiguous_block() -> None:
+    block = reserve_ids(5)
+
+    assert len(block) == 5
+    assert next_id() == block[-1] + 1
+
+
+def test_add_many_reuses_existing_and_dedupes(empty_ontology: Ontology) -> None:
+    alice = empty_ontology.add("Alice")
+
+    things = empty_ontology.add_many(["Alice", "Bob", "Bob", "Carol"])
+
+    assert things[0] is alice
+    assert things[1] is things[2]
+    assert [t.label for t in things] == ["Alice", "Bob", "Bob", "Carol"]
+    assert len(empty_ontology.things) == 3
+    assert empty_ontology.find_one("Carol") is things[3]
+
+
+def test_add_predicate_many_keeps_kinds_apart(empty_ontology: Ontology) -> None:
+    atom = empty_ontology.add("likes")
+
+    (pred,) = empty_ontology.add_predicate_many(["likes"])
+
+    assert isinstance(pred, Predicate)
+    assert pred is not atom
+
+
+def test_add_many_rejects_empty_labels(empty_ontology: Ontology) -> None:
+    with pytest.raises(ValueError):
+        empty_ontology.add_many(["ok", ""])
+
+
+def test_bind_many_matches_bind(simple_ontology) -> None:
+    onto, alice, bob, likes = simple_ontology
+    expected = Ontology()
+    e_alice, e_bob, e_likes = expected.add("Alice"), expected.add("Bob"), expected.add_predicate("likes")
+    expected.bind(e_alice, e_likes, e_bob)
+    expected.bind(e_bob, expected.add_predicate("knows"), expected.add("Carol"))
+
+    stmts = onto.bind_many([(alice, likes, bob), ("Bob", "knows", "Carol")])
+
+    assert [s.label for s in stmts] == ["Alice likes Bob", "Bob knows Carol"]
+    assert all(isinstance(s, Statement) for s in stmts)
+    assert sorted(t.label for t in onto.things) == sorted(t.label for t in expected.things)
+    assert onto._slice("Bob", "subject") == {stmts[1]}
+    assert onto._pair_slice("obj", likes.id, bob.id) == {stmts[0]}
+    assert len(onto.candidates().unasserted()) == len(onto.candidates()) - 2
+
+
+def test_bind_many_registers_unregistered_components(empty_ontology: Ontology) -> None:
+    from ontologica import Thing
+
+    loose = Thing("Loose")
+    (stmt,) = empty_ontology.bind_many([(loose, "is", "Free")])
+
+    assert empty_ontology.find_one(loose.id) is loose
+    assert stmt.subject is loose
+
+
+def test_bind_many_invalidates_cached_slices(simple_ontology) -> None:
+    onto, alice, bob, likes = simple_ontology
+    assert onto._slice("Alice", "subject") == set()
+
+    onto.bind_many([(alice, likes, bob)])
+
+    assert len(onto._slice("Alice", "subject")) == 1
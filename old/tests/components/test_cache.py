@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import pytest
+
+from ontologica import Ontology
+from ontologica.core.cache import QueryCache
+
+
+@pytest.fixture
+def onto() -> Ontology:
+    onto = Ontology()
+    alice, bob, paris = onto.add("Alice"), onto.add("Bob"), onto.add("Paris")
+    lives_in, knows = onto.add_predicate("livesIn"), onto.add_predicate("knows")
+    onto.bind(alice, lives_in, paris)
+    onto.bind(alice, knows, bob)
+    return onto
+
+
+def test_repeated_slice_is_served_from_cache(onto: Ontology) -> None:
+    first = onto._slice("Alice", "subject")
+    second = onto._slice("Alice", "subject")
+
+    assert second is first
+    assert onto.query_cache.hits == 1
+    assert onto.query_cache.misses == 1
+
+
+def test_mutation_invalidates_only_touched_entries(onto: Ontology) -> None:
+    onto._slice("Alice", "subject")
+    onto._slice("Bob", "subject")
+
+    carol, knows = onto.add("Carol"), onto.find_one("knows")
+    onto.bind(onto.find_one("Alice"), knows, carol)
+
+    assert len(onto._slice("Alice", "subject")) == 3
+    assert onto.query_cache.invalidations == 1
+    onto._slice("Bob", "subject")
+    assert onto.query_cache.hits == 1
+
+
+def test_new_thing_with_cached_label_invalidates(onto: Ontology) -> None:
+    assert len(onto._slice("Dave", "subject")) == 0
+
+    dave = onto.add("Dave")
+    onto.bind(dave, onto.find_one("knows"), onto.find_one("Bob"))
+
+    assert len(onto._slice("Dave", "subject")) == 1
+
+
+def test_show_results_are_cached_and_refreshed(onto: Ontology, capsys) -> None:
+    onto.show(predicate="livesIn")
+    onto.show(predicate="livesIn")
+    assert onto.query_cache.stats()["hits"] >= 1
+
+    onto.bind(onto.find_one("Bob"), onto.find_one("livesIn"), onto.find_one("Paris"))
+    capsys.readouterr()
+    onto.show(predicate="livesIn")
+
+    assert "Bob livesIn Paris" in capsys.readouterr().out
+
+
+def test_query_is_cached_only_when_fully_consumed(onto: Ontology) -> None:
+    patterns = [("?x", "knows", "?y")]
+    next(iter(onto.query(patterns)))
+    assert len(onto.query_cache) == 0
+
+    first = list(onto.query(patterns))
+    first[0]["?x"] = None        # callers get copies
+    second = list(onto.query(patterns))
+
+    assert [b["?y"].label for b in second] == ["Bob"]
+    assert onto.query_cache.hits == 1
+
+
+def test_entry_stored_with_older_generation_is_stale(onto: Ontology) -> None:
+    cache = onto.query_cache
+    onto._slice("Bob", "subject")          # something cached, so mutations count
+    started = cache.generation
+    onto.bind(onto.find_one("Alice"), onto.find_one("knows"), onto.add("Erin"))
+
+    cache.put("late", ["result"], [("id", onto.find_one("Alice").id)], 1, generation=started)
+
+    assert cache.get("late") is None
+    assert cache.invalidations == 1
+
+
+def test_bind_while_a_query_is_consumed_on_an_empty_cache(onto: Ontology) -> None:
+    cache = onto.query_cache
+    alice, bob, paris = (onto.find_one(label) for label in ("Alice", "Bob", "Paris"))
+    lives_in, knows = onto.find_one("livesIn"), onto.find_one("knows")
+    onto.bind(bob, lives_in, paris)
+    for name in ("Carol", "Dan", "Erin"):       # so the query starts from livesIn
+        onto.bind(onto.add(name), knows, bob)
+    patterns = [("?x", "livesIn", "Paris"), ("?x", "knows", "?y")]
+    assert len(cache) == 0
+    started = cache.generation
+
+    pending = iter(onto.query(patterns))
+    next(pending)
+    onto.bind(bob, knows, alice)     # a new result the query may not see
+    list(pending)
+
+    assert cache.generation > started
+    assert sorted(b["?x"].label for b in onto.query(patterns)) == ["Alice", "Bob"]
+
+
+def test_lru_eviction_respects_item_bound() -> None:
+    cache = QueryCache(max_entries=10, max_items=3)
+    cache.put("a", [1, 2], (), 2)
+    cache.put("b", [3], (), 1)
+    cache.get("a")
+    cache.put("c", [4], (), 1)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [1, 2]
+    assert cache.evictions == 1
+    assert cache.stats()["items"] == 3
+
+
+def test_cache_is_not_pickled(onto: Ontology, tmp_path) -> None:
+    onto._slice("Alice", "subject")
+    path = tmp_path / "onto.pkl"
+    onto.save(str(path), format="pickle")
+
+    loaded = Ontology.load(str(path))
+
+    assert len(loaded.query_cache) == 0
+    assert len(loaded._slice("Alice", "subject")) == 2
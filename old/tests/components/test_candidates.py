@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from ontologica import Ontology, Predicate, Statement
+from ontologica.core import CandidateSpace
+
+
+def test_candidates_are_lazy_and_sized_arithmetically(simple_ontology: tuple[Ontology, object, object, Predicate]) -> None:
+    onto, alice, bob, likes = simple_ontology
+    before = set(onto.things)
+
+    space = onto.candidates()
+
+    assert len(space) == 3 * 1 * 3
+    assert onto.things == before
+    assert len(list(space)) == len(space)
+    assert onto.things == before  # iterating binds nothing
+
+
+def test_candidate_index_matches_iteration_order(simple_ontology: tuple[Ontology, object, object, Predicate]) -> None:
+    onto, *_ = simple_ontology
+    onto.add_predicate("knows")
+    space = onto.candidates()
+
+    listed = list(space)
+    assert [space[i] for i in range(len(space))] == listed
+    assert space[-1] == listed[-1]
+    with pytest.raises(IndexError):
+        space[len(space)]
+
+
+def test_filter_narrows_axes(simple_ontology: tuple[Ontology, object, object, Predicate]) -> None:
+    onto, alice, bob, likes = simple_ontology
+    space = onto.candidates(subject="Alice", predicate=likes)
+
+    assert len(space) == 3
+    assert {c.subject for c in space} == {alice}
+    assert (alice, likes, bob) in space
+    assert (bob, likes, alice) not in space
+    assert len(space.filter(object=bob.id)) == 1
+
+
+def test_unasserted_skips_existing_statements(simple_ontology: tuple[Ontology, object, object, Predicate]) -> None:
+    onto, alice, bob, likes = simple_ontology
+    onto.bind(alice, likes, bob)
+    space = onto.candidates(subject=alice, predicate=likes)
+
+    missing = space.unasserted()
+
+    assert len(missing) == len(space) - 1
+    assert (alice, likes, bob) not in missing
+    assert (alice, likes, alice) in missing
+    assert list(missing) == [missing[i] for i in range(len(missing))]
+    assert all(c.label != "Alice likes Bob" for c in missing)
+
+
+def test_sample_draws_distinct_candidates(simple_ontology: tuple[Ontology, object, object, Predicate]) -> None:
+    onto, *_ = simple_ontology
+    space = onto.candidates()
+
+    picked = space.sample(4, rng=random.Random(0))
+
+    assert len(set(picked)) == 4
+    assert all(c in space for c in picked)
+
+
+def test_binding_a_candidate_creates_statement(simple_ontology: tuple[Ontology, object, object, Predicate]) -> None:
+    onto, alice, bob, likes = simple_ontology
+    candidate = onto.candidates(subject=alice, predicate=likes, object=bob)[0]
+
+    stmt = onto.bind(*candidate)
+
+    assert isinstance(stmt, Statement)
+    assert stmt.label == candidate.label == "Alice likes Bob"
+
+
+def test_large_space_is_not_materialized() -> None:
+    onto = Ontology()
+    things = [onto.add(f"t{i}") for i in range(2000)]
+    preds = [onto.add_predicate(f"p{i}") for i in range(20)]
+
+    space = CandidateSpace(onto, things, preds, things)
+
+    assert len(space) == 2000 * 20 * 2000
+    last = space[len(space) - 1]
+    assert (last.subject, last.predicate, last.obj) == (things[-1], preds[-1], things[-1])
+    assert len(onto.things) == 2020
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import ontologica
+from ontologica import Ontology, Predicate, Statement
+from ontologica.core.journal import AppendSession, Journal, _rows_with_field, journal_path
+from ontologica.core.snapshot import Snapshot
+
+
+def make_store(tmp_path: Path) -> str:
+    onto = Ontology()
+    alice, bob = onto.add("Alice"), onto.add("Bob")
+    onto.bind(alice, onto.add_predicate("knows"), bob)
+    path = (tmp_path / "store.snap").as_posix()
+    onto.save(path)
+    return path
+
+
+def test_append_session_records_only_new_things(tmp_path: Path) -> None:
+    path = make_store(tmp_path)
+
+    with AppendSession(path) as store:
+        assert store.add("Alice").label == "Alice"          # existing, not logged
+        carol = store.add("Carol")
+        stmt = store.bind(store.find_one("Bob"), store.find_one("knows"), carol)
+
+    records = list(Journal(path).records())
+    assert [r.label for r in records] == ["Carol", "Bob knows Carol"]
+    assert isinstance(stmt, Statement)
+
+
+def test_open_replays_log_on_top_of_snapshot(tmp_path: Path) -> None:
+    path = make_store(tmp_path)
+    with AppendSession(path) as store:
+        store.add_predicate("likes")
+        store.bind(store.find_one("Alice"), store.find_one("likes"), store.add("Dave"))
+
+    onto = Ontology.load(path)
+
+    stmt = onto.find_one("Alice likes Dave")
+    assert isinstance(stmt, Statement)
+    assert isinstance(stmt.predicate, Predicate)
+    assert onto.add("Erin").id > stmt.id
+
+
+def test_ontology_journal_commits_per_batch(tmp_path: Path) -> None:
+    path = make_store(tmp_path)
+    onto = Ontology.load(path)
+    onto.attach_journal(path)
+
+    onto.bind(onto.find_one("Alice"), onto.find_one("knows"), onto.add("Frank"))
+    assert list(Journal(path).records()) == []
+    onto.commit()
+
+    assert Ontology.load(path).find_one("Alice knows Frank") is not None
+
+
+def test_torn_tail_is_ignored_and_cut_off(tmp_path: Path) -> None:
+    path = make_store(tmp_path)
+    with AppendSession(path) as store:
+        store.add("Gina")
+    with open(journal_path(path), "ab") as f:
+        f.write(b"\x01\x02\x03")                              # half-written record
+
+    with AppendSession(path) as store:
+        store.add("Hank")
+
+    assert [r.label for r in Journal(path).records()] == ["Gina", "Hank"]
+
+
+def test_compact_folds_log_into_snapshot(tmp_path: Path) -> None:
+    path = make_store(tmp_path)
+    with AppendSession(path) as store:
+        store.add("Ivy")
+
+    assert Ontology.compact(path) == 1
+    assert not Path(journal_path(path)).exists()
+    assert Ontology.load(path).find_one("Ivy") is not None
+
+
+def test_append_to_pickle_store_uses_log_too(tmp_path: Path) -> None:
+    onto = Ontology()
+    onto.add("Alice")
+    path = (tmp_path / "store.pkl").as_posix()
+    onto.save(path, format="pickle")
+    before = Path(path).read_bytes()
+
+    with AppendSession(path) as store:
+        store.add("Jill")
+
+    assert Path(path).read_bytes() == before
+    assert Ontology.load(path).find_one("Jill") is not None
+
+
+def test_field_search_ignores_other_fields_with_the_same_bytes(tmp_path: Path) -> None:
+    onto = Ontology()
+    onto.add_many(["Alice", *(f"T{i}" for i in range(200))])   # kind 0 everywhere
+    path = (tmp_path / "store.snap").as_posix()
+    onto.save(path)
+
+    with Snapshot(path) as snap:
+        assert list(_rows_with_field(snap, False, 1, 0)) == [0]
+        assert list(_rows_with_field(snap, False, 2, 0)) == list(range(201))
+    with AppendSession(path) as store:
+        assert store.find_one("Alice").label == "Alice"
+
+
+def test_concurrent_appends_get_distinct_ids(tmp_path: Path) -> None:
+    path = make_store(tmp_path)
+    script = (
+        "import sys\n"
+        "from ontologica.core.journal import AppendSession\n"
+        "for i in range(20):\n"
+        "    with AppendSession(sys.argv[1]) as store:\n"
+        "        store.add(f'{sys.argv[2]}{i}')\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(ontologica.__file__)))
+    procs = [subprocess.Popen([sys.executable, "-c", script, path, name], env=env) for name in "ABCD"]
+    assert all(p.wait(timeout=60) == 0 for p in procs)
+
+    added = [t for t in Ontology.load(path).things if t.label[0] in "ABCD" and t.label[1:].isdigit()]
+    assert len(added) == 80
+    assert len({t.id for t in added}) == 80
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from ontologica import Ontology
+from ontologica.core.labels import LabelIndex, labels_path, tokens
+
+
+@pytest.fixture
+def onto() -> Ontology:
+    onto = Ontology()
+    onto.add_many(["Department of Health", "Departure Lounge", "Health Department", "Apartment", "Parthenon"])
+    livesIn = onto.add_predicate("livesIn")
+    onto.bind(onto.find_one("Apartment"), livesIn, onto.find_one("Parthenon"))
+    return onto
+
+
+def _labels(found) -> list[str]:
+    return [t.label for t in found]
+
+
+def test_tokens_split_words_and_camel_case() -> None:
+    assert tokens("livesIn") == ["lives", "in"]
+    assert tokens("Department of_Health, department") == ["department", "of", "health"]
+
+
+def test_token_mode_needs_every_word(onto: Ontology) -> None:
+    assert _labels(onto.search("health DEPARTMENT", mode="token")) == ["Health Department", "Department of Health"]
+    assert _labels(onto.search("lives", mode="token")) == ["livesIn"]
+    assert onto.search("depart", mode="token") == []
+
+
+def test_prefix_mode_matches_word_starts(onto: Ontology) -> None:
+    assert _labels(onto.search("depart", mode="prefix")) == ["Departure Lounge", "Department of Health", "Health Department"]
+    assert _labels(onto.search("dep he", mode="prefix")) == ["Health Department", "Department of Health"]
+
+
+def test_substring_mode_matches_anywhere(onto: Ontology) -> None:
+    assert _labels(onto.search("partment")) == ["Apartment", "Health Department", "Department of Health"]
+    assert _labels(onto.search("ar")) == ["Apartment", "Parthenon", "Departure Lounge", "Health Department", "Department of Health"]
+    assert _labels(onto.search("part", limit=2)) == ["Parthenon", "Apartment"]
+
+
+def test_statement_labels_are_not_indexed(onto: Ontology) -> None:
+    assert _labels(onto.search("Apartment livesIn")) == []
+
+
+def test_fuzzy_mode_tolerates_typos(onto: Ontology) -> None:
+    assert _labels(onto.search("deprtment of helth", mode="fuzzy", limit=1)) == ["Department of Health"]
+    assert _labels(onto.search("Parthenom", mode="fuzzy", limit=1)) == ["Parthenon"]
+    assert onto.search("zzzz", mode="fuzzy", min_score=0.2) == []
+
+
+def test_unknown_mode_is_rejected(onto: Ontology) -> None:
+    with pytest.raises(ValueError):
+        onto.search("x", mode="regex")
+
+
+def test_index_follows_additions(onto: Ontology) -> None:
+    onto.search("anything")     # build the index
+
+    onto.add("Parliament")
+    onto.add_many(["Parlour"])
+
+    assert _labels(onto.search("parl", mode="prefix")) == ["Parlour", "Parliament"]
+
+
+def test_saved_index_is_reused_until_the_store_changes(onto: Ontology, tmp_path: Path) -> None:
+    store = (tmp_path / "onto.snap").as_posix()
+    onto.search("anything")
+    onto.save(store)
+    assert os.path.exists(labels_path(store))
+
+    restored = Ontology.open(store)
+    restored.add("Departed")      # appended to the log, not the snapshot
+
+    assert _labels(restored.search("depart", mode="prefix")) == [
+        "Departed", "Departure Lounge", "Department of Health", "Health Department",
+    ]
+    assert LabelIndex.load(labels_path(store), store) is not None
+
+    Ontology().save(store)          # store replaced, no index built
+    assert not os.path.exists(labels_path(store))
+
+
+def test_stale_index_is_ignored(tmp_path: Path) -> None:
+    store = tmp_path / "onto.snap"
+    store.write_bytes(b"store")
+    index = LabelIndex()
+    index.add("Alice")
+    index.save(labels_path(store.as_posix()), store.as_posix())
+
+    store.write_bytes(b"changed store")
+
+    assert LabelIndex.load(labels_path(store.as_posix()), store.as_posix()) is None
@@ -44,3 +44,47 @@ def test_find_one_resolves_by_label_and_id(simple_ontology: tuple[Ontology, obje
     assert onto.find_one(alice.id) is alice
     assert onto.find_one(alice) is alice
     assert onto.find_one("Missing") is None
+
+
+def test_slice_uses_statement_index(simple_ontology: tuple[Ontology, object, object, Predicate]) -> None:
+    onto, alice, bob, likes = simple_ontology
+    knows = onto.add_predicate("knows")
+    s1 = onto.bind(alice, likes, bob)
+    s2 = onto.bind(bob, likes, alice)
+    s3 = onto.bind(alice, knows, bob)
+
+    assert onto._slice("likes", "predicate") == {s1, s2}
+    assert onto._slice(alice, "subject") == {s1, s3}
+    assert onto._slice(bob.id, "obj") == {s1, s3}
+    assert onto._slice("Missing", "subject") == set()
+
+
+def test_statement_index_survives_pickle(simple_ontology: tuple[Ontology, object, object, Predicate], tmp_path) -> None:
+    onto, alice, bob, likes = simple_ontology
+    onto.bind(alice, likes, bob)
+    path = tmp_path / "onto.pkl"
+    onto.save(path.as_posix(), format="pickle")
+
+    restored = Ontology.load(path.as_posix())
+
+    assert {s.label for s in restored._slice("likes", "predicate")} == {"Alice likes Bob"}
+
+
+def test_add_is_get_or_create(empty_ontology: Ontology) -> None:
+    alice = empty_ontology.add("Alice")
+    likes = empty_ontology.add_predicate("likes")
+
+    assert empty_ontology.add("Alice") is alice
+    assert empty_ontology.add_predicate("likes") is likes
+    assert empty_ontology.add("likes") is not likes
+    assert len(empty_ontology.things) == 3
+
+
+def test_resolve_things_uses_id_and_label_indexes(simple_ontology: tuple[Ontology, object, object, Predicate]) -> None:
+    onto, alice, bob, likes = simple_ontology
+    stmt = onto.bind(alice, likes, bob)
+
+    assert onto._resolve_things(stmt.id) == {stmt}
+    assert onto._resolve_things("Alice likes Bob") == {stmt}
+    assert onto._resolve_things(10_000) == set()
+    assert onto.find_one(likes.id) is likes
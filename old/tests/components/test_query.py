@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pytest
+
+from ontologica import Ontology
+from ontologica.core.query import Query
+
+
+@pytest.fixture
+def city_ontology() -> Ontology:
+    onto = Ontology()
+    alice, bob, rex = onto.add("Alice"), onto.add("Bob"), onto.add("Rex")
+    paris, human, dog = onto.add("Paris"), onto.add("Human"), onto.add("Dog")
+    type_, lives_in = onto.add_predicate("type"), onto.add_predicate("livesIn")
+    onto.bind(alice, type_, human)
+    onto.bind(bob, type_, human)
+    onto.bind(rex, type_, dog)
+    onto.bind(alice, lives_in, paris)
+    onto.bind(rex, lives_in, paris)
+    return onto
+
+
+def labels(bindings) -> list[dict[str, str]]:
+    rows = [{var: t.label for var, t in b.items()} for b in bindings]
+    return sorted(rows, key=lambda r: sorted(r.items()))
+
+
+def test_query_joins_patterns_on_shared_variables(city_ontology: Ontology) -> None:
+    result = city_ontology.query([("?x", "livesIn", "?c"), ("?x", "type", "Human")])
+
+    assert labels(result) == [{"?x": "Alice", "?c": "Paris"}]
+
+
+def test_query_with_variable_predicate(city_ontology: Ontology) -> None:
+    result = city_ontology.query([("Rex", "?p", "?o")])
+
+    assert labels(result) == [
+        {"?p": "type", "?o": "Dog"},
+        {"?p": "livesIn", "?o": "Paris"},
+    ]
+
+
+def test_query_repeated_variable_must_agree(city_ontology: Ontology) -> None:
+    knows = city_ontology.add_predicate("knows")
+    alice = city_ontology.find_one("Alice")
+    city_ontology.bind(alice, knows, alice)
+    city_ontology.bind(alice, knows, city_ontology.find_one("Bob"))
+
+    assert labels(city_ontology.query([("?x", "knows", "?x")])) == [{"?x": "Alice"}]
+
+
+def test_query_unknown_constant_matches_nothing(city_ontology: Ontology) -> None:
+    assert list(city_ontology.query([("?x", "type", "Cat")])) == []
+
+
+def test_plan_starts_with_most_selective_pattern(city_ontology: Ontology) -> None:
+    q = Query(city_ontology, [("?x", "type", "?k"), ("?x", "livesIn", "?c"), ("?k", "type", "Dog")])
+
+    # nothing has type Dog as a *subject* -> estimate 0, evaluated first
+    assert q.order[0] == 2
+    assert list(q) == []
+
+
+def test_predicate_stats_track_statements(city_ontology: Ontology) -> None:
+    type_ = city_ontology.find_one("type")
+
+    assert city_ontology.predicate_stats(type_.id) == (3, 3, 2)
+    assert city_ontology.statement_count() == 5
+
+
+def test_query_needs_patterns(city_ontology: Ontology) -> None:
+    with pytest.raises(ValueError):
+        Query(city_ontology, [])
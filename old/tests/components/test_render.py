@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import io
+
+from ontologica import Ontology, Predicate, Statement, Thing
+from ontologica.core.render import CYCLE, FLUSH_LINES, TRUNCATED, Renderer
+
+
+def _render(thing: Thing, max_depth: int | None = None) -> str:
+    out = io.StringIO()
+    renderer = Renderer(out, max_depth)
+    renderer.render(thing)
+    renderer.flush()
+    return out.getvalue()
+
+
+def test_show_layout_for_reified_statement(simple_ontology, capsys) -> None:
+    onto, alice, bob, likes = simple_ontology
+    inner = onto.bind(alice, likes, bob)
+    onto.bind(inner, likes, alice)
+
+    onto.show(subject=inner)
+
+    assert capsys.readouterr().out.splitlines() == [
+        f"Statement(label={'Alice likes Bob likes Alice'!r}, id={inner.id + 1})",
+        "  subject:",
+        f"    Statement(label='Alice likes Bob', id={inner.id})",
+        "      subject:",
+        f"        {alice!r}",
+        "      predicate:",
+        f"        {likes!r}",
+        "      object:",
+        f"        {bob!r}",
+        "  predicate:",
+        f"    {likes!r}",
+        "  object:",
+        f"    {alice!r}",
+        "",
+    ]
+
+
+def test_deep_reification_does_not_hit_the_recursion_limit(simple_ontology) -> None:
+    onto, alice, _, likes = simple_ontology
+    stmt = onto.bind(alice, likes, alice)
+    for _ in range(1500):
+        stmt = onto.bind(stmt, likes, alice)
+
+    text = _render(stmt)
+    limited = _render(stmt, max_depth=3)
+
+    assert text.count("Statement(") == 1501
+    assert limited.count("Statement(") == 4
+    assert limited.count(TRUNCATED) == 1
+
+
+def test_shared_sub_statements_render_the_same_at_every_indent(simple_ontology) -> None:
+    onto, alice, bob, likes = simple_ontology
+    shared = onto.bind(alice, likes, bob)
+    outer = onto.bind(shared, likes, onto.bind(bob, likes, shared))
+
+    lines = _render(outer).splitlines()
+    blocks = [i for i, line in enumerate(lines) if line.strip().startswith(f"Statement(label='Alice likes Bob', id={shared.id})")]
+
+    assert len(blocks) == 2
+    first, second = (lines[i : i + 7] for i in blocks)
+    indent = lambda line: len(line) - len(line.lstrip())
+    assert [l.strip() for l in first] == [l.strip() for l in second]
+    assert [indent(l) - indent(first[0]) for l in first] == [indent(l) - indent(second[0]) for l in second]
+
+
+def test_cycles_are_cut(simple_ontology) -> None:
+    onto, alice, _, likes = simple_ontology
+    stmt = onto.bind(alice, likes, alice)
+    object.__setattr__(stmt, "obj", stmt)   # only corrupted data can do this
+
+    text = _render(stmt)
+
+    assert text.count(CYCLE) == 1
+
+
+def test_show_writes_to_a_given_stream(empty_ontology: Ontology, capsys) -> None:
+    empty_ontology.add("Alice")
+    out = io.StringIO()
+
+    empty_ontology.show("Alice", file=out)
+
+    assert "Alice" in out.getvalue()
+    assert capsys.readouterr().out == ""
+
+
+def test_lines_are_written_as_they_are_rendered(simple_ontology) -> None:
+    onto, alice, _, likes = simple_ontology
+    stmt = onto.bind(alice, likes, alice)
+    for _ in range(FLUSH_LINES // 4):
+        stmt = onto.bind(stmt, likes, alice)
+    out = io.StringIO()
+    renderer = Renderer(out, max_depth=None)
+
+    renderer.render(stmt)
+    written = out.getvalue().count("\n")
+    renderer.flush()
+
+    assert written >= FLUSH_LINES
+    assert len(renderer._buffer) == 0
+    assert out.getvalue().count("\n") - written < FLUSH_LINES
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from ontologica import Ontology, Statement
+from ontologica.core.ordering import show_key
+from ontologica.core.render import TRUNCATED
+
+
+@pytest.fixture
+def onto() -> Ontology:
+    onto = Ontology()
+    people = onto.add_many(["Dana", "Alice", "Carol", "Bob", "Eve"])
+    knows = onto.add_predicate("knows")
+    onto.bind_many([(a, knows, b) for a, b in zip(people, people[1:])])
+    return onto
+
+
+def _shown(onto: Ontology, **kwargs) -> tuple[list[str], int | None]:
+    out = io.StringIO()
+    cursor = onto.show(file=out, max_depth=0, **kwargs)
+    headers = [line for line in out.getvalue().splitlines() if line and not line.startswith(" ")]
+    return headers, cursor
+
+
+def test_unfiltered_show_streams_in_show_order(onto: Ontology) -> None:
+    headers, cursor = _shown(onto)
+
+    expected = [
+        f"Statement(label={t.label!r}, id={t.id}){TRUNCATED}" if isinstance(t, Statement) else repr(t)
+        for t in sorted(onto.things, key=show_key)
+    ]
+    assert cursor is None
+    assert headers == expected
+
+
+@pytest.mark.parametrize("filters", [{}, {"predicate": "knows"}, {"key": "Carol"}])
+def test_pages_joined_by_cursor_equal_the_full_listing(onto: Ontology, filters: dict) -> None:
+    full, _ = _shown(onto, **filters)
+
+    pages, cursor = [], None
+    while True:
+        page, cursor = _shown(onto, limit=2, cursor=cursor, **filters)
+        pages.extend(page)
+        if cursor is None:
+            break
+
+    assert pages == full
+
+
+def test_offset_skips_within_the_ordering(onto: Ontology) -> None:
+    full, _ = _shown(onto, predicate="knows")
+
+    page, cursor = _shown(onto, predicate="knows", limit=2, offset=1)
+
+    assert page == full[1:3]
+    assert cursor is not None
+
+
+def test_things_added_later_are_merged_into_the_order(onto: Ontology) -> None:
+    _shown(onto)    # builds the ordered index
+    onto.add("Aaron")
+
+    page, _ = _shown(onto, limit=1)
+
+    assert page == [repr(onto.find_one("Aaron"))]
+
+
+def test_bad_pagination_arguments(onto: Ontology) -> None:
+    with pytest.raises(ValueError):
+        onto.show(limit=0)
+    with pytest.raises(ValueError):
+        onto.show(cursor=10**9)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ontologica import Ontology, Predicate, Statement
+from ontologica.core.snapshot import Snapshot, is_snapshot
+
+
+def test_snapshot_round_trip_keeps_ids_and_reification(
+    simple_ontology: tuple[Ontology, object, object, Predicate], tmp_path: Path
+) -> None:
+    onto, alice, bob, likes = simple_ontology
+    stmt = onto.bind(alice, likes, bob)
+    meta = onto.bind(stmt, likes, alice)
+    path = tmp_path / "onto.snap"
+
+    onto.save(path.as_posix())
+    restored = Ontology.open(path.as_posix())
+
+    assert is_snapshot(path.as_posix())
+    assert {(type(t), t.id, t.label) for t in restored.things} == {
+        (type(t), t.id, t.label) for t in onto.things
+    }
+    restored_meta = restored.find_one(meta.id)
+    assert isinstance(restored_meta, Statement)
+    assert restored_meta.subject.obj.label == "Bob"
+    assert restored.add("Carol").id > meta.id
+
+
+def test_snapshot_reads_single_records_without_materializing(
+    simple_ontology: tuple[Ontology, object, object, Predicate], tmp_path: Path
+) -> None:
+    onto, alice, bob, likes = simple_ontology
+    stmt = onto.bind(alice, likes, bob)
+    path = tmp_path / "onto.snap"
+    onto.save(path.as_posix())
+
+    with Snapshot(path.as_posix()) as snap:
+        assert snap.max_id == stmt.id
+        assert snap.find(bob.id) == (bob.id, "Bob", 0)
+        assert snap.find(stmt.id) == (stmt.id, "Alice likes Bob", alice.id, likes.id, bob.id)
+        assert snap.find(10_000) is None
+
+
+def test_load_accepts_snapshot_and_pickle(
+    simple_ontology: tuple[Ontology, object, object, Predicate], tmp_path: Path
+) -> None:
+    onto, *_ = simple_ontology
+    snap_path = tmp_path / "onto.snap"
+    pickle_path = tmp_path / "onto.pkl"
+
+    onto.save(snap_path.as_posix())
+    onto.save(pickle_path.as_posix(), format="pickle")
+
+    for path in (snap_path, pickle_path):
+        assert {t.label for t in Ontology.load(path.as_posix()).things} == {"Alice", "Bob", "likes"}
+    with pytest.raises(ValueError):
+        onto.save(snap_path.as_posix(), format="yaml")
@@ -14,3 +14,13 @@ def test_statement_fuses_subject_predicate_object() -> None:
     assert stmt.predicate is likes
     assert stmt.obj is bob
     assert stmt.label == "Alice likes Bob"
+
+
+def test_deeply_reified_statement_hashes_by_id() -> None:
+    likes = Predicate("likes")
+    stmt = Statement("base", Thing("Alice"), likes, Thing("Bob"))
+    for depth in range(5000):
+        stmt = Statement(f"level {depth}", stmt, likes, stmt)
+
+    assert hash(stmt) == hash(stmt.id)
+    assert stmt in {stmt}
@@ -13,3 +13,13 @@ def test_thing_requires_non_empty_label() -> None:
 
     with pytest.raises(ValueError):
         Thing("")
+
+
+def test_thing_is_slotted_and_hashed_by_id() -> None:
+    atom = Thing("Alice")
+    twin = Thing("Alice")
+
+    assert not hasattr(atom, "__dict__")
+    assert atom.label is twin.label  # interned
+    assert atom != twin
+    assert hash(atom) == hash(atom.id)
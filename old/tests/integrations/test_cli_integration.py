@@ -39,3 +39,105 @@ def test_cli_show_filters_by_predicate(tmp_path: Path, capsys: pytest.CaptureFix
     assert "adjacent_to" in captured.out
     assert "City" in captured.out
     assert "Park" in captured.out
+
+
+def test_cli_query_joins_patterns(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    store = tmp_path / "cli_query.snap"
+    run_cli("--file", store.as_posix(), "new")
+    for label in ("Alice", "Bob", "Paris", "Human"):
+        run_cli("--file", store.as_posix(), "add", label)
+    run_cli("--file", store.as_posix(), "add-predicate", "type")
+    run_cli("--file", store.as_posix(), "add-predicate", "livesIn")
+    run_cli("--file", store.as_posix(), "bind", "Alice", "type", "Human")
+    run_cli("--file", store.as_posix(), "bind", "Alice", "livesIn", "Paris")
+    run_cli("--file", store.as_posix(), "bind", "Bob", "livesIn", "Paris")
+    capsys.readouterr()
+
+    run_cli(
+        "--file", store.as_posix(), "query",
+        "--where", "?x", "livesIn", "?c",
+        "--where", "?x", "type", "Human",
+    )
+
+    out = capsys.readouterr().out
+    assert "?c='Paris'  ?x='Alice'" in out
+    assert "Bob" not in out
+
+
+def test_cli_mutations_append_to_log_until_compacted(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    store = tmp_path / "cli_log.snap"
+    run_cli("--file", store.as_posix(), "new")
+    snapshot = store.read_bytes()
+
+    run_cli("--file", store.as_posix(), "add", "Alice")
+    run_cli("--file", store.as_posix(), "add", "Bob")
+    run_cli("--file", store.as_posix(), "add-predicate", "likes")
+    run_cli("--file", store.as_posix(), "bind", "Alice", "likes", "Bob")
+
+    assert store.read_bytes() == snapshot
+    assert Ontology.load(store.as_posix()).find_one("Alice likes Bob") is not None
+
+    capsys.readouterr()
+    run_cli("--file", store.as_posix(), "compact")
+
+    assert "Compacted 4 log records" in capsys.readouterr().out
+    assert not Path(f"{store}.log").exists()
+    assert Ontology.load(store.as_posix()).find_one("Alice likes Bob") is not None
+
+
+def test_cli_show_pages_with_cursor(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    store = tmp_path / "cli_pages.snap"
+    run_cli("--file", store.as_posix(), "new")
+    for label in ("Cedar", "Ash", "Birch"):
+        run_cli("--file", store.as_posix(), "add", label)
+    capsys.readouterr()
+
+    run_cli("--file", store.as_posix(), "show", "--limit", "2")
+    first = capsys.readouterr()
+    cursor = first.err.split("--cursor ")[1].strip()
+    run_cli("--file", store.as_posix(), "show", "--limit", "2", "--cursor", cursor)
+    second = capsys.readouterr()
+
+    assert "Ash" in first.out and "Birch" in first.out and "Cedar" not in first.out
+    assert "Cedar" in second.out and second.err == ""
+
+
+def test_cli_search_and_show_suggestions(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    store = tmp_path / "cli_search.snap"
+    run_cli("--file", store.as_posix(), "new")
+    for label in ("Department of Health", "Departure Lounge"):
+        run_cli("--file", store.as_posix(), "add", label)
+    capsys.readouterr()
+
+    run_cli("--file", store.as_posix(), "search", "depart", "--mode", "prefix", "--limit", "1")
+    found = capsys.readouterr()
+    run_cli("--file", store.as_posix(), "show", "--key", "Departmnt of Health")
+    hint = capsys.readouterr()
+
+    assert "Departure Lounge" in found.out and "Department of Health" not in found.out
+    assert "Did you mean: 'Department of Health'" in hint.err
+
+
+def test_cli_default_store_keeps_an_existing_pickle(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    legacy = Ontology()
+    legacy.add("Alice")
+    legacy.save("ontology.pkl", format="pickle")
+
+    run_cli("add", "Bob")
+    capsys.readouterr()
+    run_cli("show", "--key", "Alice")
+
+    assert "Alice" in capsys.readouterr().out
+    assert not (tmp_path / "ontology.snap").exists()
+    assert Ontology.load("ontology.pkl").find_one("Bob") is not None
+
+
+def test_cli_default_store_is_a_snapshot(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    run_cli("add", "Alice")
+
+    assert Ontology.open("ontology.snap").find_one("Alice") is not None
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import ontologica
+from ontologica import Ontology
+from ontologica.cli.cli import main as cli_main
+from ontologica.cli.daemon import Client, send_frame, socket_path
+
+
+@pytest.fixture
+def daemon(tmp_path: Path):
+    store = (tmp_path / "served.snap").as_posix()
+    cli_main(["--file", store, "new"])
+    src = os.path.dirname(os.path.dirname(ontologica.__file__))
+    env = dict(os.environ, PYTHONPATH=src)
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "ontologica.cli.cli", "--file", store, "serve"],
+        env=env, stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 10
+    while not os.path.exists(socket_path(store)):
+        if time.monotonic() > deadline or proc.poll() is not None:
+            proc.kill()
+            pytest.fail("daemon did not start")
+        time.sleep(0.02)
+    yield store
+    if proc.poll() is None:
+        proc.terminate()
+    proc.wait(timeout=10)
+
+
+def test_cli_forwards_to_running_daemon(daemon: str, capsys: pytest.CaptureFixture[str]) -> None:
+    cli_main(["--file", daemon, "add", "Alice"])
+    cli_main(["--file", daemon, "add", "Paris"])
+    cli_main(["--file", daemon, "add-predicate", "livesIn"])
+    cli_main(["--file", daemon, "bind", "Alice", "livesIn", "Paris"])
+    capsys.readouterr()
+
+    cli_main(["--file", daemon, "query", "--where", "?x", "livesIn", "?c"])
+
+    assert "?c='Paris'  ?x='Alice'" in capsys.readouterr().out
+    # Every mutation was logged before the daemon replied.
+    assert Ontology.load(daemon).find_one("Alice livesIn Paris") is not None
+
+
+def test_daemon_reports_command_errors(daemon: str) -> None:
+    with Client(daemon) as client:
+        response = client.run("bind", "Nobody", "knows", "Nothing")
+
+    assert response.code == 1
+    assert "Could not find subject" in response.err
+
+
+def test_client_reuses_one_connection(daemon: str) -> None:
+    with Client(daemon) as client:
+        for i in range(50):
+            assert client.run("add", f"T{i}").code == 0
+        shown = client.run("show", "--key", "T49")
+
+    assert "T49" in shown.out
+
+
+def test_client_leaving_before_the_reply_does_not_kill_the_daemon(daemon: str) -> None:
+    for argv in (["add", "Quitter"], ["show"]):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(socket_path(daemon))
+        send_frame(sock, {"argv": argv, "cwd": os.getcwd()})
+        sock.close()
+
+    with Client(daemon) as client:
+        assert client.run("add", "Stayer").code == 0
+        assert "Quitter" in client.run("show", "--key", "Quitter").out
+
+
+def test_silent_client_does_not_block_others(daemon: str) -> None:
+    silent = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    silent.connect(socket_path(daemon))
+    silent.sendall(b"\x00\x00")       # half a frame header, then nothing
+    try:
+        with Client(daemon) as client:
+            assert client.run("add", "Alice").code == 0
+    finally:
+        silent.close()
+
+
+def test_serve_stop_shuts_daemon_down(daemon: str) -> None:
+    cli_main(["--file", daemon, "serve", "--stop"])
+
+    deadline = time.monotonic() + 10
+    while os.path.exists(socket_path(daemon)) and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert not os.path.exists(socket_path(daemon))
@@ -0,0 +1,62 @@
+# encoding.py
+
+from typing import Dict, List, Union
+
+from .models import Atom, Predicate
+
+
+# -------------------------------------------------------------
+# DICTIONARY ENCODING OF LABELS -> NODE IDS
+# -------------------------------------------------------------
+
+class NodeEncoder:
+    """
+    Assigns natural-number ids to node labels on first sight.
+
+    Shared by the loaders whose sources name things by label (CSV,
+    Turtle, RDF/XML) instead of by id. Atoms and predicates are kept in
+    separate namespaces, so the same label used as a predicate and as an
+    atom becomes one Predicate node and one Atom node.
+
+    Nodes created since the last `drain()` are buffered in `fresh`, so a
+    loader can emit each node right before the first triple that uses it.
+
+    Fields:
+        next_id: the next id to hand out (nodes and triples share it)
+        atoms: label -> id of every Atom seen so far
+        predicates: label -> id of every Predicate seen so far
+        fresh: nodes created and not yet drained
+    """
+
+    def __init__(self, start_id: int = 0):
+        self.next_id = start_id
+        self.atoms: Dict[str, int] = {}
+        self.predicates: Dict[str, int] = {}
+        self.fresh: List[Union[Atom, Predicate]] = []
+
+    def take_id(self) -> int:
+        """Reserve one id (e.g. for a triple)."""
+        i = self.next_id
+        self.next_id += 1
+        return i
+
+    def atom(self, label: str) -> int:
+        """Id of the Atom with this label, creating it if needed."""
+        i = self.atoms.get(label)
+        if i is None:
+            i = self.atoms[label] = self.take_id()
+            self.fresh.append(Atom(i, label))
+        return i
+
+    def predicate(self, label: str) -> int:
+        """Id of the Predicate with this label, creating it if needed."""
+        i = self.predicates.get(label)
+        if i is None:
+            i = self.predicates[label] = self.take_id()
+            self.fresh.append(Predicate(i, label))
+        return i
+
+    def drain(self) -> List[Union[Atom, Predicate]]:
+        """Return and forget the nodes created since the last drain."""
+        fresh, self.fresh = self.fresh, []
+        return fresh
@@ -0,0 +1,132 @@
+# indexes.py
+
+from typing import Dict, Iterator, List, Optional
+
+from .models import Triple
+
+
+# -------------------------------------------------------------
+# PERMUTATION INDEXES: SPO, POS, OSP
+# -------------------------------------------------------------
+
+class TripleIndex:
+    """
+    Three maintained permutation indexes over triple ids.
+
+        spo[subject][predicate]  -> [triple id, ...]
+        pos[predicate][object]   -> [triple id, ...]
+        osp[object][subject]     -> [triple id, ...]
+
+    Any pattern with one or two bound positions is answered from a
+    single index walk, so the cost is proportional to the result and
+    not to the size of the graph.
+
+    Leaves are lists rather than sets: most hold one or two ids, a list
+    is a third of the size of a set, and appending is cheaper.
+    """
+
+    def __init__(self):
+        self.spo: Dict[int, Dict[int, List[int]]] = {}
+        self.pos: Dict[int, Dict[int, List[int]]] = {}
+        self.osp: Dict[int, Dict[int, List[int]]] = {}
+        self.objects: Dict[int, int] = {}   # triple id -> object id
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    # ---- maintenance ----
+
+    def add(self, t: Triple) -> None:
+        """Index a triple under all three permutations."""
+        tid, s, p, o = t.id, t.subject, t.predicate, t.object
+        for index, a, b in ((self.spo, s, p), (self.pos, p, o), (self.osp, o, s)):
+            inner = index.get(a)
+            if inner is None:
+                index[a] = {b: [tid]}
+                continue
+            tids = inner.get(b)
+            if tids is None:
+                inner[b] = [tid]
+            else:
+                tids.append(tid)
+        self.objects[tid] = o
+
+    # ---- lookup ----
+
+    def ids(
+        self,
+        subject: Optional[int] = None,
+        predicate: Optional[int] = None,
+        object: Optional[int] = None,
+    ) -> Iterator[int]:
+        """
+        Yield the ids of every triple matching the pattern.
+        None means "unbound" for that position.
+        """
+        s, p, o = subject, predicate, object
+
+        if s is not None:
+            by_p = self.spo.get(s, {})
+            if p is not None:
+                tids = by_p.get(p, ())
+                if o is None:
+                    yield from tids
+                else:
+                    objects = self.objects
+                    for tid in tids:
+                        if objects[tid] == o:
+                            yield tid
+            elif o is not None:
+                yield from self.osp.get(o, {}).get(s, ())
+            else:
+                for tids in by_p.values():
+                    yield from tids
+
+        elif p is not None:
+            by_o = self.pos.get(p, {})
+            if o is not None:
+                yield from by_o.get(o, ())
+            else:
+                for tids in by_o.values():
+                    yield from tids
+
+        elif o is not None:
+            for tids in self.osp.get(o, {}).values():
+                yield from tids
+
+        else:
+            yield from self.objects
+
+    def has(self, subject: int, predicate: int, object: int) -> bool:
+        """True if the fully bound triple (subject, predicate, object) is indexed."""
+        tids = self.spo.get(subject, {}).get(predicate)
+        if not tids:
+            return False
+        objects = self.objects
+        for tid in tids:
+            if objects[tid] == object:
+                return True
+        return False
+
+    def count(
+        self,
+        subject: Optional[int] = None,
+        predicate: Optional[int] = None,
+        object: Optional[int] = None,
+    ) -> int:
+        """Number of triples matching the pattern."""
+        if subject is None and predicate is None and object is None:
+            return len(self.objects)
+        if subject is not None and predicate is not None and object is not None:
+            return sum(1 for _ in self.ids(subject, predicate, object))
+        if subject is not None and predicate is not None:
+            return len(self.spo.get(subject, {}).get(predicate, ()))
+        if predicate is not None and object is not None:
+            return len(self.pos.get(predicate, {}).get(object, ()))
+        if subject is not None and object is not None:
+            return len(self.osp.get(object, {}).get(subject, ()))
+        if subject is not None:
+            return sum(len(v) for v in self.spo.get(subject, {}).values())
+        if predicate is not None:
+            return sum(len(v) for v in self.pos.get(predicate, {}).values())
+        return sum(len(v) for v in self.osp.get(object, {}).values())
@@ -0,0 +1,294 @@
+# instrument.py
+
+import cProfile
+import json
+import logging
+import os
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+
+# Stages of a single-file load, in pipeline order:
+#   validate_path, detect_format, load_raw   inside loaders.load_any
+#   normalize   pulling records out of the normalizer (with JSON, CSV,
+#               Turtle and RDF/XML this includes reading and decoding
+#               the file, since all of them stream)
+#   index       putting records into the tables and indexes
+# and of Ontology.from_sources:
+#   encode      waiting for the worker processes' encoded shards
+#   merge       turning shards into records with global ids
+#   index       as above
+LOAD_STAGES = ("validate_path", "detect_format", "load_raw", "normalize", "index")
+SOURCES_STAGES = ("encode", "merge", "index")
+
+
+# -------------------------------------------------------------
+# RESULTS
+# -------------------------------------------------------------
+
+class StageStats:
+    """
+    Measurements of one pipeline stage.
+
+    Fields:
+        name: the stage, see LOAD_STAGES / SOURCES_STAGES
+        wall: seconds of wall time (time.perf_counter)
+        cpu: seconds of CPU time of this process (time.process_time)
+        items: records (or shards, for "encode") the stage produced
+        peak_bytes: highest memory traced by tracemalloc while the stage
+                    ran, or None when memory tracing was off
+        profile: pstats.Stats of the stage, or None when profiling was off
+    """
+
+    __slots__ = ("name", "wall", "cpu", "items", "peak_bytes", "profile")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.items = 0
+        self.peak_bytes: Optional[int] = None
+        self.profile: Optional[pstats.Stats] = None
+
+    def to_dict(self) -> dict:
+        """JSON-safe fields (the profile is left out)."""
+        return {"wall": self.wall, "cpu": self.cpu, "items": self.items,
+                "peak_bytes": self.peak_bytes}
+
+    def __repr__(self) -> str:
+        return (f"StageStats({self.name!r}, wall={self.wall:.6f}, cpu={self.cpu:.6f}, "
+                f"items={self.items}, peak_bytes={self.peak_bytes})")
+
+
+class LoadStats(dict):
+    """
+    Ontology.load_stats: the summary keys it always had ("format",
+    "seconds", "nodes", "triples", ...), plus `stages`, which maps stage
+    name to StageStats in pipeline order when the load was instrumented
+    and is empty otherwise.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stages: Dict[str, StageStats] = {}
+
+    def to_dict(self) -> dict:
+        out = dict(self)
+        out["stages"] = {name: s.to_dict() for name, s in self.stages.items()}
+        return out
+
+
+# -------------------------------------------------------------
+# SINKS
+# -------------------------------------------------------------
+#
+# A sink is any callable taking the LoadStats of a finished load.
+
+class LogSink:
+    """Logs one line per load, with wall/cpu/items (and peak) per stage."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO):
+        self.logger = logger or logging.getLogger("ontology.load")
+        self.level = level
+
+    def __call__(self, stats: LoadStats) -> None:
+        parts = []
+        for s in stats.stages.values():
+            part = f"{s.name}={s.wall:.4f}s/{s.cpu:.4f}cpu/{s.items}"
+            if s.peak_bytes is not None:
+                part += f"/{s.peak_bytes}B"
+            parts.append(part)
+        self.logger.log(self.level, "load %s: %d nodes, %d triples in %.4fs [%s]",
+                        stats.get("format"), stats.get("nodes", 0), stats.get("triples", 0),
+                        stats.get("seconds", 0.0), " ".join(parts))
+
+
+class JsonFileSink:
+    """Appends each load's stats to `path` as one line of JSON."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def __call__(self, stats: LoadStats) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(stats.to_dict()) + "\n")
+
+
+Sink = Callable[[LoadStats], None]
+
+
+# -------------------------------------------------------------
+# INSTRUMENTATION
+# -------------------------------------------------------------
+
+class Instrumentation:
+    """
+    What to measure during loads and where to send the results.
+
+    Pass one to Ontology(..., instrument=...) or Ontology.from_sources,
+    or install it for every load with set_default().
+
+    Fields:
+        memory: trace allocations with tracemalloc for peak_bytes (slow;
+                tracing started here is stopped when the load ends)
+        profile: run each stage under its own cProfile profiler
+        profile_dir: if set, each stage's profile is also written there
+                     as <stage>.prof, for snakeviz / pstats
+        sinks: callables given the LoadStats of every finished load, see
+               LogSink and JsonFileSink
+
+    Wall and CPU time of normalize and index are split per record, which
+    costs a microsecond or two per record on top of the load itself.
+    """
+
+    def __init__(
+        self,
+        memory: bool = False,
+        profile: bool = False,
+        profile_dir: Optional[str] = None,
+        sinks: Iterable[Sink] = (),
+    ):
+        self.memory = memory
+        self.profile = profile or profile_dir is not None
+        self.profile_dir = profile_dir
+        self.sinks: List[Sink] = list(sinks)
+
+    def start(self) -> "LoadMeter":
+        return LoadMeter(self)
+
+
+_default: Optional[Instrumentation] = None
+
+
+def set_default(instrumentation: Optional[Instrumentation]) -> None:
+    """Instrument every load that is not given its own Instrumentation
+    (None switches this off again)."""
+    global _default
+    _default = instrumentation
+
+
+def start_meter(instrumentation: Optional[Instrumentation]) -> Optional["LoadMeter"]:
+    """A LoadMeter for one load, or None when loads are not instrumented."""
+    if instrumentation is None:
+        instrumentation = _default
+    return instrumentation.start() if instrumentation is not None else None
+
+
+class LoadMeter:
+    """
+    Measurements of one load in progress.
+
+    Time is charged to one stage at a time: entering a stage (stage(),
+    or each step of a timed() iterator) charges the time so far to the
+    stage that was running, and leaving it switches back.
+    """
+
+    def __init__(self, config: Instrumentation):
+        self.config = config
+        self.stages: Dict[str, StageStats] = {}
+        self._running: List[StageStats] = []
+        self._profilers: Dict[str, cProfile.Profile] = {}
+        self._started_tracing = False
+        if config.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+
+    def _stage(self, name: str) -> StageStats:
+        s = self.stages.get(name)
+        if s is None:
+            s = self.stages[name] = StageStats(name)
+            if self.config.memory:
+                s.peak_bytes = 0
+        return s
+
+    def _switch(self, enter: Optional[StageStats], leave: Optional[StageStats]) -> None:
+        """Charge the time since the last switch to `leave`, then run `enter`."""
+        wall, cpu = time.perf_counter(), time.process_time()
+        if leave is not None:
+            leave.wall += wall - self._wall
+            leave.cpu += cpu - self._cpu
+            if self.config.memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                if peak > leave.peak_bytes:
+                    leave.peak_bytes = peak
+            if self.config.profile:
+                self._profilers[leave.name].disable()
+        if self.config.memory:
+            tracemalloc.reset_peak()
+        if enter is not None and self.config.profile:
+            profiler = self._profilers.get(enter.name)
+            if profiler is None:
+                profiler = self._profilers[enter.name] = cProfile.Profile()
+            profiler.enable()
+        self._wall, self._cpu = wall, cpu
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageStats]:
+        s = self._stage(name)
+        outer = self._running[-1] if self._running else None
+        self._switch(s, outer)
+        self._running.append(s)
+        try:
+            yield s
+        finally:
+            self._running.pop()
+            self._switch(outer, s)
+
+    def timed(self, iterable: Iterable, name: str) -> Iterator:
+        """Yield from `iterable`, charging the time spent producing each
+        item to stage `name` and counting the items."""
+        s = self._stage(name)
+        it = iter(iterable)
+        switch = self._switch
+        running = self._running
+        while True:
+            outer = running[-1] if running else None
+            switch(s, outer)
+            try:
+                item = next(it)
+            except StopIteration:
+                switch(outer, s)
+                return
+            except BaseException:
+                switch(outer, s)
+                raise
+            switch(outer, s)
+            s.items += 1
+            yield item
+
+    def discard(self) -> None:
+        """End a load that failed: stop tracing, report nothing."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def finish(self, summary: dict) -> LoadStats:
+        """The LoadStats of the finished load, after sending it to the sinks."""
+        self.discard()
+        stats = LoadStats(summary)
+        order = {name: i for i, name in enumerate(LOAD_STAGES + SOURCES_STAGES)}
+        stats.stages = {s.name: s for s in sorted(self.stages.values(),
+                                                  key=lambda s: order.get(s.name, len(order)))}
+        for name, profiler in self._profilers.items():
+            self.stages[name].profile = pstats.Stats(profiler)
+            if self.config.profile_dir is not None:
+                os.makedirs(self.config.profile_dir, exist_ok=True)
+                profiler.dump_stats(os.path.join(self.config.profile_dir, f"{name}.prof"))
+        for sink in self.config.sinks:
+            sink(stats)
+        return stats
+
+
+def stage(meter: Optional[LoadMeter], name: str):
+    """meter.stage(name), or a no-op context when not instrumented."""
+    return meter.stage(name) if meter is not None else nullcontext()
+
+
+def timed(meter: Optional[LoadMeter], iterable: Iterable, name: str) -> Iterable:
+    """meter.timed(iterable, name), or `iterable` itself when not instrumented."""
+    return meter.timed(iterable, name) if meter is not None else iterable
@@ -0,0 +1,123 @@
+# integrity.py
+
+from typing import Iterable, List, NamedTuple, Optional
+
+from .models import Triple
+
+
+# The invariants of smartAddTriple in ontologica.hs:
+#   - subject, predicate and object must be declared: an Atom, a
+#     Predicate, or (reification) a Triple of the ontology
+#   - the predicate must be typed predicate, which here means it is a
+#     Predicate node
+UNDECLARED = "undeclared"
+NOT_A_PREDICATE = "not a predicate"
+
+
+class Violation(NamedTuple):
+    """
+    One broken invariant.
+
+    Fields:
+        triple: id of the offending triple (None for a triple that was
+                refused before it got an id)
+        field: "subject", "predicate" or "object"
+        node: the id that field refers to
+        problem: UNDECLARED or NOT_A_PREDICATE
+    """
+    triple: Optional[int]
+    field: str
+    node: int
+    problem: str
+
+    def __str__(self) -> str:
+        where = f"Triple {self.triple}" if self.triple is not None else "Triple"
+        if self.problem == UNDECLARED:
+            return f"{where} uses undeclared {self.field} {self.node}."
+        return f"{where}: predicate {self.node} is not a Predicate."
+
+
+class IntegrityError(ValueError):
+    """
+    Raised by strict ontologies when a triple would break an invariant.
+
+    Fields:
+        violations: list of Violation
+    """
+
+    def __init__(self, violations: List[Violation]):
+        self.violations = violations
+        super().__init__("\n".join(str(v) for v in violations))
+
+    def __reduce__(self):
+        return (type(self), (self.violations,))
+
+
+# -------------------------------------------------------------
+# BULK: THE WHOLE GRAPH
+# -------------------------------------------------------------
+
+def check(onto) -> List[Violation]:
+    """
+    Every violation in `onto`, ordered by triple id, then field.
+
+    The ids used in each position are the keys of the SPO/POS/OSP
+    indexes, so the distinct ids are compared against the node tables
+    with set differences rather than triple by triple; only triples that
+    use an offending id are visited. A consistent graph costs one pass
+    over its distinct ids.
+    """
+    index = onto._index
+    atoms, predicates = onto.atoms.keys(), onto.predicates.keys()
+    triple_ids = index.objects.keys()
+
+    violations: List[Violation] = []
+    for field, used in (("subject", index.spo), ("object", index.osp)):
+        for node in used.keys() - atoms - predicates - triple_ids:
+            for tid in index.ids(**{field: node}):
+                violations.append(Violation(tid, field, node, UNDECLARED))
+
+    for node in index.pos.keys() - predicates:
+        declared = node in atoms or node in triple_ids
+        problem = NOT_A_PREDICATE if declared else UNDECLARED
+        for tid in index.ids(predicate=node):
+            violations.append(Violation(tid, "predicate", node, problem))
+
+    order = {"subject": 0, "predicate": 1, "object": 2}
+    violations.sort(key=lambda v: (v.triple, order[v.field]))
+    return violations
+
+
+# -------------------------------------------------------------
+# INCREMENTAL: ONLY NEW TRIPLES
+# -------------------------------------------------------------
+
+def check_triple(
+    onto, subject: int, predicate: int, object: int, triple_id: Optional[int] = None
+) -> List[Violation]:
+    """
+    Violations of one (possibly not yet added) triple: a handful of dict
+    lookups, independent of the size of the ontology. Used by strict
+    ontologies on every add_triple.
+    """
+    atoms, predicates, triples = onto.atoms, onto.predicates, onto.triples
+    violations = []
+    if predicate not in predicates:
+        declared = predicate in atoms or predicate in triples
+        violations.append(Violation(triple_id, "predicate", predicate,
+                                    NOT_A_PREDICATE if declared else UNDECLARED))
+    for field, node in (("subject", subject), ("object", object)):
+        if node not in atoms and node not in predicates and node not in triples:
+            violations.append(Violation(triple_id, field, node, UNDECLARED))
+    if len(violations) > 1:
+        order = {"subject": 0, "predicate": 1, "object": 2}
+        violations.sort(key=lambda v: order[v.field])
+    return violations
+
+
+def check_triples(onto, triples: Iterable[Triple]) -> List[Violation]:
+    """Violations of the given triples only, e.g. a batch just added."""
+    violations: List[Violation] = []
+    for t in triples:
+        violations.extend(check_triple(onto, t.subject, t.predicate, t.object, t.id))
+    return violations
@@ -12,14 +12,209 @@ from pathlib import Path
 
 
 
+import csv
 import json
+import re
+from itertools import islice
+from typing import Any, Iterator, Tuple
+
+from .instrument import stage
+from .rdfxml import RdfXmlSource
+from .turtle import TurtleSource
+
+
+# Bytes of text pulled from disk per read while streaming JSON.
+JSON_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+# A decode error this close to the end of the buffer may just be a value
+# cut short ("tru", "-", "\u00", "Infinit").
+_JSON_EDGE = 8
+
+
+def _cut_off(e: json.JSONDecodeError, buffered: int) -> bool:
+    """True if `e` may only mean the text ran out, not that it is invalid."""
+    # An unterminated string is reported where it starts, however long.
+    return buffered - e.pos <= _JSON_EDGE or e.msg.startswith("Unterminated string")
+
+
+class _JsonReader:
+    """
+    A forward-only cursor over a JSON text file.
+
+    Only the unconsumed tail of the text is kept in memory; values are
+    decoded one at a time with `JSONDecoder.raw_decode`, pulling in more
+    chunks whenever a value runs past the end of the buffer.
+    """
+
+    def __init__(self, f, path: Path, chunk_size: int = JSON_CHUNK_SIZE):
+        self.f = f
+        self.path = path
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.line = 1      # line number of buf[0]
+        self.eof = False
+
+    def _fill(self, size: int) -> bool:
+        """Drop the consumed prefix and append up to `size` more characters."""
+        if self.pos:
+            self.line += self.buf.count("\n", 0, self.pos)
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        chunk = self.f.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf += chunk
+        return True
+
+    def error(self, msg: str, pos=None):
+        pos = self.pos if pos is None else pos
+        line = self.line + self.buf.count("\n", 0, pos)
+        raise ValueError(f"Invalid JSON in '{self.path}': {msg} at line {line}")
+
+    def peek(self) -> str:
+        """Next non-whitespace character without consuming it ('' at EOF)."""
+        if self.pos < len(self.buf):
+            c = self.buf[self.pos]
+            if c not in " \t\n\r":
+                return c
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill(self.chunk_size):
+                return ""
+
+    def expect(self, ch: str) -> None:
+        if self.peek() != ch:
+            self.error(f"Expecting '{ch}' delimiter" if ch in ",:" else f"Expecting '{ch}'")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        if self.peek() == "":
+            self.error("Expecting value")
+        while True:
+            try:
+                obj, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                # Only a value cut off by the buffer edge is worth reading
+                # more for (doubling the read so large values are not
+                # re-decoded often); any other error is reported at once.
+                if not _cut_off(e, len(self.buf)):
+                    self.error(e.msg, e.pos)
+                # _fill drops the consumed prefix, which shifts e.pos.
+                dropped = self.pos
+                if self._fill(max(self.chunk_size, len(self.buf))):
+                    continue
+                self.error(e.msg, e.pos - dropped)
+            # A number may continue in the next chunk ("12" + "34").
+            if end == len(self.buf) and not self.eof:
+                if self._fill(self.chunk_size):
+                    continue
+            self.pos = end
+            return obj
+
+
+class JsonArray:
+    """
+    Lazy view of one JSON array inside a `JsonObjectStream`.
+    Items are decoded as they are iterated; it can be iterated once.
+    """
+
+    def __init__(self, reader: _JsonReader):
+        self._reader = reader
+        self.done = False
+
+    def __iter__(self) -> Iterator[Any]:
+        r = self._reader
+        if self.done:
+            return
+        r.expect("[")
+        if r.peek() == "]":
+            r.pos += 1
+            self.done = True
+            return
+        while True:
+            yield r.value()
+            c = r.peek()
+            if c == "]":
+                r.pos += 1
+                self.done = True
+                return
+            r.expect(",")
+
+
+class JsonObjectStream:
+    """
+    Incremental reader for a top-level JSON object.
+
+    Iterating yields (key, value) pairs in file order. Array values are
+    returned as lazy `JsonArray`s, so the items of "nodes" and "triples"
+    can be consumed one by one without the whole document in memory.
+    """
+
+    def __init__(self, path: Path, chunk_size: int = JSON_CHUNK_SIZE):
+        self.path = path
+        self.chunk_size = chunk_size
+
+    def _open(self):
+        try:
+            return self.path.open("r", encoding="utf-8")
+        except OSError as e:
+            # covers permission denied, unreadable file, etc.
+            raise OSError(f"Could not open '{self.path}': {e.strerror}") from e
+
+    def is_object(self) -> bool:
+        """True if the document starts with '{' (checks the first chunk only)."""
+        with self._open() as f:
+            r = _JsonReader(f, self.path, self.chunk_size)
+            c = r.peek()
+            if c == "":
+                r.error("Expecting value")
+            return c == "{"
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        with self._open() as f:
+            r = _JsonReader(f, self.path, self.chunk_size)
+            r.expect("{")
+            if r.peek() == "}":
+                r.pos += 1
+            else:
+                while True:
+                    if r.peek() != '"':
+                        r.error("Expecting property name enclosed in double quotes")
+                    key = r.value()
+                    r.expect(":")
+
+                    if r.peek() == "[":
+                        arr = JsonArray(r)
+                        yield key, arr
+                        for _ in arr:   # drain whatever the consumer skipped
+                            pass
+                    else:
+                        yield key, r.value()
+
+                    if r.peek() == "}":
+                        r.pos += 1
+                        break
+                    r.expect(",")
+
+            if r.peek() != "":
+                r.error("Extra data")
 
 
 def load_json(path: Path):
     """
     Load ontology data from a JSON file.
     Returns whatever Python structure is inside the JSON (dict, list, etc).
-    
+    The whole document is decoded at once; see stream_json for large files.
+
     Raises:
         ValueError: if JSON is syntactically invalid
         OSError: if file cannot be opened
@@ -30,21 +225,165 @@ def load_json(path: Path):
 
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in '{path}': {e.msg} at line {e.lineno}") from e
-    
+
     except OSError as e:
         # covers permission denied, unreadable file, etc.
         raise OSError(f"Could not open '{path}': {e.strerror}") from e
 
 
+def stream_json(path: Path):
+    """
+    Open ontology data from a JSON file for streaming.
+
+    Returns a JsonObjectStream; nothing is decoded until it is iterated,
+    and then only one node/triple at a time. Whole-document decoding
+    (`json.load`) is deliberately avoided so that large exports can be
+    ingested in bounded memory. This is what load_any uses for .json.
+
+    Raises (while iterating):
+        ValueError: if JSON is syntactically invalid
+        OSError: if file cannot be opened
+    """
+    return JsonObjectStream(path)
+
+
+
+# Rows handed to the normalizer per batch while streaming CSV.
+CSV_CHUNK_SIZE = 10_000
+
+CSV_FIELDS = ("subject", "predicate", "object", "label", "id")
+
 
-def load_csv(path: Path):
-    raise NotImplementedError
+class CsvTripleSource:
+    """
+    Lazy, chunked reader for CSV edge lists.
+
+    Iterating yields batches (lists) of at most `chunk_size` rows, each
+    reduced to a (subject, predicate, object, label, id) tuple of strings;
+    label and id are None when those columns are not mapped.
+
+    Fields:
+        path: the CSV file
+        columns: field -> column name (needs header) or 0-based index.
+                 Defaults to the header names subject/predicate/object
+                 (+ label, id if present), or to columns 0, 1, 2 without
+                 a header.
+        mode: "label" - cells are labels, dictionary-encoded to node ids
+              "id"    - cells are integer node ids, used as-is
+                        (an "id" column for triple ids is then required)
+        header: whether the first row is a header
+        rows: number of data rows read so far
+    """
 
-def load_turtle(path: Path):
-    raise NotImplementedError
+    def __init__(
+        self,
+        path: Path,
+        columns=None,
+        mode: str = "label",
+        header: bool = True,
+        delimiter: str = ",",
+        chunk_size: int = CSV_CHUNK_SIZE,
+    ):
+        if mode not in ("label", "id"):
+            raise ValueError(f"CSV mode must be 'label' or 'id', got {mode!r}")
+        if columns is not None:
+            unknown = set(columns) - set(CSV_FIELDS)
+            if unknown:
+                raise ValueError(f"Unknown CSV column mapping: {sorted(unknown)}")
+        self.path = path
+        self.columns = columns
+        self.mode = mode
+        self.header = header
+        self.delimiter = delimiter
+        self.chunk_size = chunk_size
+        self.rows = 0
+
+    def _resolve_columns(self, header_row):
+        """Map each field to a column index (None if unmapped)."""
+        columns = self.columns
+        if columns is None:
+            if header_row is None:
+                columns = {"subject": 0, "predicate": 1, "object": 2}
+            else:
+                columns = {f: f for f in CSV_FIELDS if f in header_row}
+
+        positions = {}
+        for field in CSV_FIELDS:
+            col = columns.get(field)
+            if col is None:
+                positions[field] = None
+            elif isinstance(col, int):
+                positions[field] = col
+            elif header_row is None:
+                raise ValueError(f"CSV column {col!r} given by name but the file has no header.")
+            elif col not in header_row:
+                raise ValueError(f"CSV column {col!r} not found in header of '{self.path}'.")
+            else:
+                positions[field] = header_row.index(col)
+
+        for field in ("subject", "predicate", "object"):
+            if positions[field] is None:
+                raise ValueError(f"CSV column mapping is missing '{field}'.")
+        if self.mode == "id" and positions["id"] is None:
+            raise ValueError("CSV id mode needs an 'id' column for triple ids.")
+        return positions
+
+    def __iter__(self) -> Iterator[list]:
+        try:
+            f = self.path.open("r", encoding="utf-8", newline="")
+        except OSError as e:
+            raise OSError(f"Could not open '{self.path}': {e.strerror}") from e
+
+        with f:
+            reader = csv.reader(f, delimiter=self.delimiter)
+            header_row = next(reader, None) if self.header else None
+            pos = self._resolve_columns(header_row)
+            s, p, o = pos["subject"], pos["predicate"], pos["object"]
+            lab, tid = pos["label"], pos["id"]
+            width = 1 + max(i for i in pos.values() if i is not None)
+
+            while True:
+                batch = list(islice(reader, self.chunk_size))
+                if not batch:
+                    return
+                out = []
+                for k, row in enumerate(batch):
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        raise ValueError(
+                            f"Invalid CSV in '{self.path}': expected at least {width} "
+                            f"columns in data row {self.rows + k + 1}"
+                        )
+                    out.append((
+                        row[s], row[p], row[o],
+                        row[lab] if lab is not None else None,
+                        row[tid] if tid is not None else None,
+                    ))
+                self.rows += len(batch)
+                yield out
+
+
+def load_csv(path: Path, **options):
+    """
+    Open a CSV edge list for chunked streaming (see CsvTripleSource for
+    the options). Nothing is read until the source is iterated.
+    """
+    return CsvTripleSource(path, **options)
 
-def load_rdfxml(path: Path):
-    raise NotImplementedError
+def load_turtle(path: Path, **options):
+    """
+    Open a Turtle file for streaming (see turtle.TurtleSource).
+    Nothing is read until the source is iterated.
+    """
+    return TurtleSource(path, **options)
+
+def load_rdfxml(path: Path, **options):
+    """
+    Open an RDF/XML file for streaming (see rdfxml.RdfXmlSource).
+    Nothing is read until the source is iterated.
+    """
+    return RdfXmlSource(path, **options)
 
 
 SUPPORTED_EXTENSIONS = {
@@ -55,7 +394,7 @@ SUPPORTED_EXTENSIONS = {
 }
 
 PARSERS = {
-    ".json": load_json,
+    ".json": stream_json,
     ".csv": load_csv,
     ".ttl": load_turtle,     # Turtle RDF
     ".rdf": load_rdfxml,     # RDF/XML
@@ -100,22 +439,30 @@ def detect_format(path: Path) -> str:
 # 4. LOAD RAW DATA
 # ---------------------------------------------------------
 
-def load_raw(path: Path, filetype: str):
-    """Use the correct parser for the given file type."""
+def load_raw(path: Path, filetype: str, **options):
+    """Use the correct parser for the given file type, passing it any
+    format-specific options (e.g. CSV column mapping)."""
     parser = PARSERS[filetype]
-    return parser(path)
+    return parser(path, **options)
 
 
 # ---------------------------------------------------------
 # 5. HIGH-LEVEL LOADER (the one Ontology.__init__ will call)
 # ---------------------------------------------------------
 
-def load_any(source):
+def load_any(source, meter=None, **options):
+    """
+    Returns (format, raw source) for `source`. `meter` is the LoadMeter
+    of an instrumented load (see instrument.py), timing each step.
+    """
     if source is None:
         return ("none", None)
 
-    path = validate_path(source)
-    ext = detect_format(path)
-    raw = load_raw(path, ext)
+    with stage(meter, "validate_path"):
+        path = validate_path(source)
+    with stage(meter, "detect_format"):
+        ext = detect_format(path)
+    with stage(meter, "load_raw"):
+        raw = load_raw(path, ext, **options)
 
     return (ext, raw)
\ No newline at end of file
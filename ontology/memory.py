@@ -0,0 +1,26 @@
+# memory.py
+
+import gc
+from contextlib import contextmanager
+from typing import Iterator
+
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    """
+    Keep the cyclic garbage collector off for the duration of the block.
+
+    Bulk work such as loading, saturating rules or building an index
+    allocates millions of small containers and nothing cyclic. Every
+    allocation counts towards the next collection, so the GC would
+    rescan all of them again and again, for nothing. Reference counting
+    still frees everything as usual. The GC is turned back on afterwards
+    only if it was on before, so blocks can nest.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
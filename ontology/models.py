@@ -1,48 +1,78 @@
 # models.py
 
+import sys
 from dataclasses import dataclass
+from typing import ClassVar
+
+
+# -------------------------------------------------------------
+# SHARED BEHAVIOUR
+# -------------------------------------------------------------
+
+class _Identified:
+    """
+    Equality and hashing by id.
+
+    Ids are unique within an ontology, so comparing or hashing a model
+    never has to look at labels or nested fields: both are O(1).
+    """
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self):
+        return hash(self.id)
 
 
 # -------------------------------------------------------------
 # NODE TYPES: Atom and Predicate
 # -------------------------------------------------------------
 
-@dataclass
-class Atom:
+@dataclass(slots=True, eq=False)
+class Atom(_Identified):
     """
     A basic ontology node representing an atomic symbol.
     
     Fields:
         id: natural number identifier
-        label: human-readable label (string)
-        kind: always "Atom"
+        label: human-readable label (string, interned)
+        kind: always "Atom" (class attribute)
     """
     id: int
     label: str
-    kind: str = "Atom"
+    kind: ClassVar[str] = "Atom"
+
+    def __post_init__(self):
+        self.label = sys.intern(self.label)
 
 
-@dataclass
-class Predicate:
+@dataclass(slots=True, eq=False)
+class Predicate(_Identified):
     """
     A node that represents a relationship type (binary predicate).
     
     Fields:
         id: natural number identifier
-        label: predicate label (string)
-        kind: always "Predicate"
+        label: predicate label (string, interned)
+        kind: always "Predicate" (class attribute)
     """
     id: int
     label: str
-    kind: str = "Predicate"
+    kind: ClassVar[str] = "Predicate"
+
+    def __post_init__(self):
+        self.label = sys.intern(self.label)
 
 
 # -------------------------------------------------------------
 # TRIPLE TYPE
 # -------------------------------------------------------------
 
-@dataclass
-class Triple:
+@dataclass(slots=True, eq=False)
+class Triple(_Identified):
     """
     A reifiable triple: (subject, predicate, object)
 
@@ -52,11 +82,11 @@ class Triple:
         predicate: id of predicate node
         object: id of object node/triple
         label: human-readable description of the triple
-        kind: always "Triple"
+        kind: always "Triple" (class attribute)
     """
     id: int
     subject: int
     predicate: int
     object: int
     label: str
-    kind: str = "Triple"
\ No newline at end of file
+    kind: ClassVar[str] = "Triple"
@@ -1,130 +1,392 @@
 # normalize.py
 
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Iterator, Optional, Union
+from .encoding import NodeEncoder
+from .loaders import CsvTripleSource, JsonArray, JsonObjectStream
 from .models import Atom, Predicate, Triple   # <-- import your real classes
 
 
 # -------------------------------------------------------------------
-# (1) VALIDATE JSON SCHEMA
+# (0) VALIDATION ERRORS
 # -------------------------------------------------------------------
 
-def validate_json_schema(raw: dict) -> None:
+class OntologyValidationError(ValueError):
     """
-    Validate that the raw JSON dict conforms to the Ontologica JSON structure.
-    Raises ValueError if anything is invalid.
+    Raised when ontology JSON is invalid.
+
+    Fields:
+        errors: list of (position, message) pairs, e.g.
+                ("triples[4]", "Triple 'object' refers to unknown id 17.")
+                Holds one entry when stopping at the first problem, and
+                every problem found in collect-all-errors mode.
     """
 
-    # Top-level must be a dict
-    if not isinstance(raw, dict):
-        raise ValueError("Ontology JSON must be a dictionary.")
+    def __init__(self, errors: List[Tuple[str, str]]):
+        self.errors = errors
+        lines = [f"{where}: {msg}" if where else msg for where, msg in errors]
+        super().__init__("\n".join(lines))
+
+    def __reduce__(self):
+        # Rebuild from `errors` (not the message) when sent between processes.
+        return (type(self), (self.errors,))
+
 
-    # Required top-level keys
-    if "nodes" not in raw:
-        raise ValueError("Ontology JSON missing required field: 'nodes'.")
-    if "triples" not in raw:
-        raise ValueError("Ontology JSON missing required field: 'triples'.")
+# -------------------------------------------------------------------
+# (1) RECORD CHECKS
+# -------------------------------------------------------------------
 
-    nodes = raw["nodes"]
-    triples = raw["triples"]
+def _node_problem(node) -> Optional[str]:
+    """Return what is wrong with a node record, or None if it is well-formed."""
+    if not isinstance(node, dict):
+        return "Each node must be a dict."
 
-    # ---- Validate nodes ----
-    if not isinstance(nodes, list):
-        raise ValueError("'nodes' must be a list.")
+    for key in ("id", "kind", "label"):
+        if key not in node:
+            return f"Node missing required field: '{key}'."
 
-    for node in nodes:
-        if not isinstance(node, dict):
-            raise ValueError("Each node must be a dict.")
+    # id
+    if not isinstance(node["id"], int) or node["id"] < 0:
+        return f"Node id must be a non-negative integer, got {node['id']}."
 
-        for key in ("id", "kind", "label"):
-            if key not in node:
-                raise ValueError(f"Node missing required field: '{key}'.")
+    # kind
+    kind = node["kind"]
+    if kind not in ("Atom", "Predicate"):
+        return f"Node kind must be 'Atom' or 'Predicate', got '{kind}'."
 
-        # id
-        if not isinstance(node["id"], int) or node["id"] < 0:
-            raise ValueError(f"Node id must be a non-negative integer, got {node['id']}.")
+    # label
+    if not isinstance(node["label"], str):
+        return "Node 'label' must be a string."
 
-        # kind
-        kind = node["kind"]
-        if kind not in ("Atom", "Predicate"):
-            raise ValueError(f"Node kind must be 'Atom' or 'Predicate', got '{kind}'.")
+    return None
 
-        # label
-        if not isinstance(node["label"], str):
-            raise ValueError("Node 'label' must be a string.")
 
-    # ---- Validate triples ----
-    if not isinstance(triples, list):
-        raise ValueError("'triples' must be a list.")
+def _triple_problem(t) -> Optional[str]:
+    """Return what is wrong with a triple record, or None if it is well-formed."""
+    if not isinstance(t, dict):
+        return "Each triple must be a dict."
 
-    for t in triples:
-        if not isinstance(t, dict):
-            raise ValueError("Each triple must be a dict.")
+    for key in ("id", "kind", "subject", "predicate", "object", "label"):
+        if key not in t:
+            return f"Triple missing required field: '{key}'."
 
-        for key in ("id", "kind", "subject", "predicate", "object", "label"):
-            if key not in t:
-                raise ValueError(f"Triple missing required field: '{key}'.")
+    if not isinstance(t["id"], int) or t["id"] < 0:
+        return f"Triple id must be a non-negative integer, got {t['id']}."
 
-        if not isinstance(t["id"], int) or t["id"] < 0:
-            raise ValueError(f"Triple id must be a non-negative integer, got {t['id']}.")
+    if t["kind"] != "Triple":
+        return f"Triple 'kind' must be 'Triple', got '{t['kind']}'."
 
-        if t["kind"] != "Triple":
-            raise ValueError(f"Triple 'kind' must be 'Triple', got '{t['kind']}'.")
+    # subject / predicate / object
+    for field in ("subject", "predicate", "object"):
+        if not isinstance(t[field], int) or t[field] < 0:
+            return f"Triple '{field}' must be a non-negative integer id, got {t[field]}"
 
-        # subject / predicate / object
-        for field in ("subject", "predicate", "object"):
-            if not isinstance(t[field], int) or t[field] < 0:
-                raise ValueError(
-                    f"Triple '{field}' must be a non-negative integer id, got {t[field]}"
-                )
+    if not isinstance(t["label"], str):
+        return "Triple 'label' must be a string."
 
-        if not isinstance(t["label"], str):
-            raise ValueError("Triple 'label' must be a string.")
+    return None
 
 
 # -------------------------------------------------------------------
-# (2) NORMALIZE RAW JSON → INTERNAL OBJECTS
+# (2) FUSED VALIDATE + BUILD
 # -------------------------------------------------------------------
 
-def normalize_json(raw: dict) -> Tuple[List[Atom], List[Predicate], List[Triple]]:
+def iter_normalize_json(raw, collect_errors: bool = False) -> Iterator[Union[Atom, Predicate, Triple]]:
     """
-    Fully validate + convert JSON ontology data into internal Python objects.
-    
-    Returns:
-        (atoms, predicates, triples)
+    Validate + convert JSON ontology data in a single pass.
+
+    `raw` is either a decoded dict or a `JsonObjectStream` from
+    `loaders.stream_json`; in the streaming case only the record being
+    converted is held in memory. Objects are yielded in file order.
+
+    Besides the shape of each record, this checks with hash sets that:
+        - ids are unique across nodes and triples
+        - every triple subject/object id exists (node or triple)
+        - every triple predicate id is a Predicate node
+
+    References to ids that have not been seen yet (forward references,
+    or triples listed before nodes) are checked once the input ends.
+
+    With collect_errors=False the first problem raises an
+    OntologyValidationError. With collect_errors=True invalid records are
+    skipped and every problem is reported together, with its position,
+    after the whole input has been read.
+    """
+    return _walk(raw, collect_errors, build=True)
+
+
+def _walk(raw, collect_errors: bool, build: bool):
     """
+    The single validation pass behind iter_normalize_json and
+    validate_json_schema. With build=False records are only checked and
+    None is yielded in place of each model object.
+    """
+    errors: List[Tuple[str, str]] = []
+
+    def fail(where: str, msg: str) -> None:
+        if not collect_errors:
+            raise OntologyValidationError([(where, msg)])
+        errors.append((where, msg))
 
-    # 1. Validate structure
-    validate_json_schema(raw)
+    if isinstance(raw, JsonObjectStream):
+        if not raw.is_object():
+            raise OntologyValidationError([("", "Ontology JSON must be a dictionary.")])
+        pairs = iter(raw)
+    elif isinstance(raw, dict):
+        pairs = iter(raw.items())
+    else:
+        raise OntologyValidationError([("", "Ontology JSON must be a dictionary.")])
+
+    seen = set()
+    ids = set()             # every node and triple id
+    predicate_ids = set()
+    pending = []    # (triple index, field, id) references to ids not seen yet
+
+    for key, value in pairs:
+        if key not in ("nodes", "triples"):
+            continue
+        seen.add(key)
+
+        if not isinstance(value, (list, JsonArray)):
+            fail("", f"'{key}' must be a list.")
+            continue
+
+        # ---- Build node objects ----
+        if key == "nodes":
+            for i, node in enumerate(value):
+                # fast path: well-formed record, one lookup per field
+                try:
+                    node_id, kind, label = node["id"], node["kind"], node["label"]
+                    ok = (
+                        type(node_id) is int and node_id >= 0
+                        and type(label) is str
+                        and (kind == "Atom" or kind == "Predicate")
+                    )
+                except (KeyError, TypeError):
+                    ok = False
+                if not ok:
+                    problem = _node_problem(node)
+                    if problem is not None:
+                        fail(f"nodes[{i}]", problem)
+                        continue
+                    node_id, kind, label = node["id"], node["kind"], node["label"]
+
+                if node_id in ids:
+                    fail(f"nodes[{i}]", f"Duplicate id {node_id}.")
+                    continue
+                ids.add(node_id)
+
+                if kind == "Atom":
+                    yield Atom(node_id, label) if build else None
+                else:  # Predicate
+                    predicate_ids.add(node_id)
+                    yield Predicate(node_id, label) if build else None
+
+        # ---- Build triple objects ----
+        else:
+            for i, t in enumerate(value):
+                try:
+                    triple_id, s, p, o, label = (
+                        t["id"], t["subject"], t["predicate"], t["object"], t["label"]
+                    )
+                    ok = (
+                        type(triple_id) is int and triple_id >= 0
+                        and type(s) is int and s >= 0
+                        and type(p) is int and p >= 0
+                        and type(o) is int and o >= 0
+                        and type(label) is str
+                        and t["kind"] == "Triple"
+                    )
+                except (KeyError, TypeError):
+                    ok = False
+                if not ok:
+                    problem = _triple_problem(t)
+                    if problem is not None:
+                        fail(f"triples[{i}]", problem)
+                        continue
+                    triple_id, s, p, o, label = (
+                        t["id"], t["subject"], t["predicate"], t["object"], t["label"]
+                    )
+
+                if triple_id in ids:
+                    fail(f"triples[{i}]", f"Duplicate id {triple_id}.")
+                    continue
+                ids.add(triple_id)
+
+                if s not in ids:
+                    pending.append((i, "subject", s))
+                if p not in predicate_ids:
+                    if p in ids:
+                        fail(f"triples[{i}]", f"Triple 'predicate' {p} is not a Predicate node.")
+                    else:
+                        pending.append((i, "predicate", p))
+                if o not in ids:
+                    pending.append((i, "object", o))
+
+                if build:
+                    yield Triple(triple_id, s, p, o, label)   # positional: measurably faster
+                else:
+                    yield None
+
+    for key in ("nodes", "triples"):
+        if key not in seen:
+            fail("", f"Ontology JSON missing required field: '{key}'.")
+
+    # ---- Deferred (forward) references ----
+    for i, field, ref in pending:
+        if field == "predicate":
+            if ref in predicate_ids:
+                continue
+            if ref in ids:
+                fail(f"triples[{i}]", f"Triple 'predicate' {ref} is not a Predicate node.")
+                continue
+        elif ref in ids:
+            continue
+        fail(f"triples[{i}]", f"Triple '{field}' refers to unknown id {ref}.")
+
+    if errors:
+        raise OntologyValidationError(errors)
+
+
+def validate_json_schema(raw, collect_errors: bool = False) -> None:
+    """
+    Validate that the raw JSON conforms to the Ontologica JSON structure,
+    including referential integrity (see iter_normalize_json).
+    Raises OntologyValidationError (a ValueError) if anything is invalid.
+    """
+    for _ in _walk(raw, collect_errors, build=False):
+        pass
 
-    # 2. Extract raw lists
-    raw_nodes = raw["nodes"]
-    raw_triples = raw["triples"]
 
+def normalize_json(raw, collect_errors: bool = False) -> Tuple[List[Atom], List[Predicate], List[Triple]]:
+    """
+    Fully validate + convert JSON ontology data into internal Python objects.
+
+    Returns:
+        (atoms, predicates, triples)
+    """
     atoms: List[Atom] = []
     predicates: List[Predicate] = []
     triples: List[Triple] = []
 
-    # ---- Build node objects ----
-    for node in raw_nodes:
-        kind = node["kind"]
-        node_id = node["id"]
-        label = node["label"]
-
-        if kind == "Atom":
-            atoms.append(Atom(id=node_id, label=label))
-        else:  # Predicate
-            predicates.append(Predicate(id=node_id, label=label))
-
-    # ---- Build triple objects ----
-    for t in raw_triples:
-        triples.append(
-            Triple(
-                id=t["id"],
-                subject=t["subject"],
-                predicate=t["predicate"],
-                object=t["object"],
-                label=t["label"]
-            )
-        )
-
-    return atoms, predicates, triples
\ No newline at end of file
+    for obj in iter_normalize_json(raw, collect_errors):
+        if isinstance(obj, Atom):
+            atoms.append(obj)
+        elif isinstance(obj, Predicate):
+            predicates.append(obj)
+        else:
+            triples.append(obj)
+
+    return atoms, predicates, triples
+
+
+# -------------------------------------------------------------------
+# (3) NORMALIZE CSV EDGE LISTS → INTERNAL OBJECTS
+# -------------------------------------------------------------------
+
+def iter_normalize_csv(source: CsvTripleSource, start_id: int = 0) -> Iterator[Union[Atom, Predicate, Triple]]:
+    """
+    Convert a chunked CSV edge list into model objects, batch by batch.
+
+    In "label" mode subject/object cells become Atoms and predicate cells
+    Predicates, dictionary-encoded so each distinct label gets one id
+    (allocated from `start_id`); any "id" column is ignored. In "id" mode
+    cells are integer node ids used as-is, nodes are labelled with their
+    id, and triple ids come from the "id" column.
+
+    Each new node is yielded right before the first triple that uses it.
+    Triples without a label cell get a fused "subject predicate object"
+    label.
+    """
+    if source.mode == "id":
+        yield from _iter_csv_ids(source)
+        return
+
+    enc = NodeEncoder(start_id)
+    atoms, predicates = enc.atoms, enc.predicates
+
+    for batch in source:
+        for s, p, o, label, _ in batch:
+            # dict hits inline; the encoder is only called for new labels
+            si = atoms.get(s)
+            if si is None:
+                si = enc.atom(s)
+            pi = predicates.get(p)
+            if pi is None:
+                pi = enc.predicate(p)
+            oi = atoms.get(o)
+            if oi is None:
+                oi = enc.atom(o)
+            if enc.fresh:
+                yield from enc.drain()
+            yield Triple(enc.take_id(), si, pi, oi, label or f"{s} {p} {o}")
+
+
+def _iter_csv_ids(source: CsvTripleSource) -> Iterator[Union[Atom, Predicate, Triple]]:
+    """The "id" mode of iter_normalize_csv."""
+    atom_ids = set()
+    predicate_ids = set()
+    triple_ids = set()
+    row = 0
+
+    def as_id(cell: str, field: str) -> int:
+        try:
+            value = int(cell)
+        except ValueError:
+            value = -1
+        if value < 0:
+            raise ValueError(f"CSV row {row}: '{field}' must be a non-negative integer id, got {cell!r}.")
+        return value
+
+    for batch in source:
+        for s, p, o, label, tid in batch:
+            row += 1
+            ids = (as_id(s, "subject"), as_id(p, "predicate"), as_id(o, "object"), as_id(tid, "id"))
+            si, pi, oi, ti = ids
+
+            for node_id in (si, oi):
+                if node_id not in atom_ids:
+                    if node_id in predicate_ids or node_id in triple_ids:
+                        raise ValueError(f"CSV row {row}: id {node_id} is already used by a predicate or triple.")
+                    atom_ids.add(node_id)
+                    yield Atom(node_id, str(node_id))
+            if pi not in predicate_ids:
+                if pi in atom_ids or pi in triple_ids:
+                    raise ValueError(f"CSV row {row}: id {pi} is already used by an atom or triple.")
+                predicate_ids.add(pi)
+                yield Predicate(pi, str(pi))
+            if ti in triple_ids or ti in atom_ids or ti in predicate_ids:
+                raise ValueError(f"CSV row {row}: duplicate id {ti}.")
+            triple_ids.add(ti)
+
+            yield Triple(ti, si, pi, oi, label or f"{s} {p} {o}")
+
+
+# -------------------------------------------------------------------
+# (4) NORMALIZE RDF TERM TRIPLES (TURTLE, RDF/XML) → INTERNAL OBJECTS
+# -------------------------------------------------------------------
+
+def iter_normalize_terms(source, start_id: int = 0) -> Iterator[Union[Atom, Predicate, Triple]]:
+    """
+    Convert a stream of (subject, predicate, object) term strings, as
+    produced by the RDF readers, into model objects.
+
+    Subjects and objects become Atoms and predicates become Predicates,
+    dictionary-encoded through NodeEncoder exactly like CSV labels. Each
+    new node is yielded right before the first triple that uses it.
+    """
+    enc = NodeEncoder(start_id)
+    atoms, predicates = enc.atoms, enc.predicates
+
+    for s, p, o in source:
+        si = atoms.get(s)
+        if si is None:
+            si = enc.atom(s)
+        pi = predicates.get(p)
+        if pi is None:
+            pi = enc.predicate(p)
+        oi = atoms.get(o)
+        if oi is None:
+            oi = enc.atom(o)
+        if enc.fresh:
+            yield from enc.drain()
+        yield Triple(enc.take_id(), si, pi, oi, f"{s} {p} {o}")
@@ -1,28 +1,313 @@
 # ontology.py
 
+import time
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from .indexes import TripleIndex
+from .integrity import IntegrityError, Violation, check, check_triple
+from .instrument import Instrumentation, LoadStats, stage, start_meter, timed
 from .loaders import load_any
-from .normalize import normalize_json
+from .memory import paused_gc
+from .models import Atom, Triple
+from .normalize import iter_normalize_csv, iter_normalize_json, iter_normalize_terms
+from .parallel import ShardMerger, encode_sources
+from .reachability import ReachabilityIndex
+from .rules import Rule, forward_chain
+from .store import ColumnarTriples
+
+
+# How Ontology.triples is stored:
+#   "dict"      id -> Triple dataclass (default)
+#   "columnar"  parallel int64 arrays, Triples built on access
+STORAGE_MODES = ("dict", "columnar")
+
 
 class Ontology:
-    def __init__(self, source=None):
+    def __init__(
+        self,
+        source=None,
+        storage: str = "dict",
+        instrument: Optional[Instrumentation] = None,
+        strict: bool = False,
+        **load_options,
+    ):
+        """
+        An ontology, loaded from `source` (JSON, CSV, Turtle or RDF/XML)
+        if one is given; `load_options` go to its loader.
+
+        `instrument` measures the load stages (see instrument.py); by
+        default the one installed with instrument.set_default() is used,
+        if any. The result is in load_stats.stages.
+
+        With `strict`, add_triple refuses triples that break the
+        integrity invariants (see integrity.py); check_integrity()
+        audits the whole graph either way.
+        """
+
+        if storage not in STORAGE_MODES:
+            raise ValueError(f"Unknown storage mode: {storage!r}")
+
+        self._index = TripleIndex()
+        self.atoms = {}
+        self.predicates = {}
+        self.triples = ColumnarTriples() if storage == "columnar" else {}
+        self._next_id = 0
+        self.load_stats = None
+        self.derived = set()    # ids of triples produced by infer()
+        self._reachability = {}  # predicate id -> ReachabilityIndex
+        self.strict = strict
 
         if source is None:
-            self.atoms = {}
-            self.predicates = {}
-            self.triples = {}
             return
 
-        # load_any now returns (format, raw_data)
-        fmt, raw = load_any(source)
+        meter = start_meter(instrument)
+        try:
+            # load_any now returns (format, raw_data)
+            fmt, raw = load_any(source, meter, **load_options)
+
+            # ---- Format dispatch ----
+            if fmt == ".json":
+                records = iter_normalize_json(raw)
+
+            elif fmt == ".csv":
+                records = iter_normalize_csv(raw, self._next_id)
+
+            elif fmt in (".ttl", ".rdf"):
+                records = iter_normalize_terms(raw, self._next_id)
+
+            else:
+                raise ValueError(f"No normalizer available for format {fmt}")
+
+            start = time.perf_counter()
+            with stage(meter, "index") as index_stage:
+                self._ingest(timed(meter, records, "normalize"))
+            seconds = time.perf_counter() - start
+        except BaseException:
+            if meter is not None:
+                meter.discard()
+            raise
+
+        stats = {
+            "format": fmt,
+            "seconds": seconds,
+            "nodes": len(self.atoms) + len(self.predicates),
+            "triples": len(self.triples),
+        }
+        if fmt == ".csv":
+            stats["rows"] = raw.rows
+            stats["rows_per_sec"] = raw.rows / seconds if seconds else 0.0
+        elif fmt in (".ttl", ".rdf"):
+            stats["statements"] = raw.statements
+            stats["statements_per_sec"] = raw.statements / seconds if seconds else 0.0
+        self.load_stats = self._finish_stats(stats, meter, index_stage)
+
+    @classmethod
+    def from_sources(
+        cls,
+        sources: Sequence,
+        workers: Optional[int] = None,
+        policy: str = "remap",
+        storage: str = "dict",
+        instrument: Optional[Instrumentation] = None,
+        **load_options,
+    ) -> "Ontology":
+        """
+        Load many JSON/CSV/Turtle/RDF-XML files into one ontology.
+
+        Files are parsed and validated in parallel by `workers` processes
+        (default: one per CPU), each through the same load_any/normalize
+        pipeline as Ontology(source), and handed back as compact encoded
+        shards (see parallel.EncodedShard). Shards are merged in the
+        order given, while later ones are still being parsed.
+
+        Every file must be self-contained: its triples may only refer to
+        its own nodes and triples. Ids that collide across files are
+        handled by `policy`, see parallel.MERGE_POLICIES. `load_options`
+        are passed to the loader of every file (e.g. CSV columns).
+        `instrument` is as for Ontology(); the stages are encode, merge
+        and index (CPU time is this process's only, not the workers').
+
+        Raises:
+            OntologyValidationError: if a file is invalid (positions are
+                prefixed with the file name)
+            ValueError: on an id collision under policy="error"
+        """
+        onto = cls(storage=storage)
+        merger = ShardMerger(policy)
+        sources = list(sources)
+
+        meter = start_meter(instrument)
+        start = time.perf_counter()
+        rows = 0
+        try:
+            with stage(meter, "index") as index_stage:
+                for shard in timed(meter, encode_sources(sources, workers, load_options), "encode"):
+                    onto._ingest(timed(meter, merger.merge(shard), "merge"))
+                    rows += shard.rows or 0
+        except BaseException:
+            if meter is not None:
+                meter.discard()
+            raise
+        seconds = time.perf_counter() - start
+
+        stats = {
+            "format": "multi",
+            "sources": len(sources),
+            "seconds": seconds,
+            "nodes": len(onto.atoms) + len(onto.predicates),
+            "triples": len(onto.triples),
+            "remapped": merger.remapped,
+            "reconciled": merger.reconciled,
+        }
+        if rows:
+            stats["rows"] = rows
+        onto.load_stats = onto._finish_stats(stats, meter, index_stage)
+        return onto
+
+    def _finish_stats(self, stats: dict, meter, index_stage) -> LoadStats:
+        if meter is None:
+            return LoadStats(stats)
+        index_stage.items = stats["nodes"] + stats["triples"]
+        return meter.finish(stats)
+
+    def _ingest(self, records) -> None:
+        """
+        Put normalized Atom/Predicate/Triple objects straight into the
+        lookup tables and indexes, one at a time, as they are produced.
+        """
+        atoms, predicates, triples = self.atoms, self.predicates, self.triples
+        index = self._index
+        max_id = self._next_id - 1
+
+        # Ingest allocates millions of small containers and nothing cyclic;
+        # letting the cyclic GC rescan them all repeatedly doubles load time.
+        with paused_gc():
+            for obj in records:
+                if isinstance(obj, Triple):
+                    triples[obj.id] = obj
+                    index.add(obj)
+                elif isinstance(obj, Atom):
+                    atoms[obj.id] = obj
+                else:
+                    predicates[obj.id] = obj
+                if obj.id > max_id:
+                    max_id = obj.id
+
+        self._next_id = max_id + 1
+
+    # ---------------------------------------------------------
+    # ADDING TRIPLES
+    # ---------------------------------------------------------
+
+    def _label_of(self, node_id: int) -> str:
+        """Label of an atom, predicate or (reified) triple."""
+        for table in (self.atoms, self.predicates, self.triples):
+            if node_id in table:
+                return table[node_id].label
+        raise KeyError(f"Unknown node id: {node_id}")
+
+    def add_triple(
+        self,
+        subject: int,
+        predicate: int,
+        object: int,
+        label: Optional[str] = None,
+    ) -> Triple:
+        """
+        Create a new triple from node ids and add it to the ontology.
+
+        If no label is given, one is fused from the component labels,
+        e.g. "Alice livesIn Paris".
+
+        Raises:
+            IntegrityError: if the ontology is strict and a component is
+                undeclared, or the predicate is not a Predicate
+        """
+        if self.strict:
+            violations = check_triple(self, subject, predicate, object)
+            if violations:
+                raise IntegrityError(violations)
+        if label is None:
+            label = " ".join(self._label_of(i) for i in (subject, predicate, object))
+
+        t = Triple(
+            id=self._next_id,
+            subject=subject,
+            predicate=predicate,
+            object=object,
+            label=label,
+        )
+        self._next_id += 1
+        self.triples[t.id] = t
+        self._index.add(t)
+        closure = self._reachability.get(predicate)
+        if closure is not None:
+            closure.add_edge(subject, object)
+        return t
+
+    # ---------------------------------------------------------
+    # INTEGRITY
+    # ---------------------------------------------------------
+
+    def check_integrity(self) -> List[Violation]:
+        """Every triple that uses an undeclared node or a predicate that
+        is not a Predicate; empty if the graph is consistent."""
+        return check(self)
+
+    # ---------------------------------------------------------
+    # PATTERN LOOKUP
+    # ---------------------------------------------------------
+
+    def match(
+        self,
+        subject: Optional[int] = None,
+        predicate: Optional[int] = None,
+        object: Optional[int] = None,
+    ) -> Iterator[Triple]:
+        """
+        Yield every triple matching the pattern (None = wildcard),
+        answered from the SPO/POS/OSP indexes.
+        """
+        triples = self.triples
+        for tid in self._index.ids(subject, predicate, object):
+            yield triples[tid]
+
+    def count(
+        self,
+        subject: Optional[int] = None,
+        predicate: Optional[int] = None,
+        object: Optional[int] = None,
+    ) -> int:
+        """Number of triples matching the pattern."""
+        return self._index.count(subject, predicate, object)
+
+    # ---------------------------------------------------------
+    # HIERARCHIES
+    # ---------------------------------------------------------
 
-        # ---- Format dispatch ----
-        if fmt == ".json":
-            atoms, predicates, triples = normalize_json(raw)
+    def reachability(self, predicate: int) -> ReachabilityIndex:
+        """
+        Transitive-closure index over one predicate (e.g. "type"), built
+        on first request and kept up to date by add_triple afterwards.
+        """
+        closure = self._reachability.get(predicate)
+        if closure is None:
+            if predicate not in self.predicates:
+                raise KeyError(f"Unknown predicate id: {predicate}")
+            triples = self.triples
+            edges = ((triples[tid].subject, o)
+                     for o, tids in self._index.pos.get(predicate, {}).items()
+                     for tid in tids)
+            closure = self._reachability[predicate] = ReachabilityIndex(predicate, edges)
+        return closure
 
-        else:
-            raise ValueError(f"No normalizer available for format {fmt}")
+    # ---------------------------------------------------------
+    # INFERENCE
+    # ---------------------------------------------------------
 
-        # build lookup tables
-        self.atoms = {a.id: a for a in atoms}
-        self.predicates = {p.id: p for p in predicates}
-        self.triples = {t.id: t for t in triples}
\ No newline at end of file
+    def infer(self, rules: Iterable[Rule], max_rounds: Optional[int] = None) -> List[Triple]:
+        """
+        Forward-chain `rules` to a fixpoint (see rules.forward_chain).
+        Returns the newly derived triples; their ids are also in `derived`.
+        """
+        return forward_chain(self, rules, max_rounds)
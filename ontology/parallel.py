@@ -0,0 +1,300 @@
+# parallel.py
+
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .loaders import load_any
+from .models import Atom, Predicate, Triple
+from .normalize import (
+    OntologyValidationError,
+    iter_normalize_csv,
+    iter_normalize_json,
+    iter_normalize_terms,
+)
+
+
+# How colliding ids from different shards are merged:
+#   "remap"  keep every node and triple; ids already taken by an earlier
+#            shard are moved to fresh ids (default)
+#   "label"  like "remap", but a node whose kind and label match a node
+#            already merged becomes that node
+#   "error"  raise ValueError on the first collision (for shards cut from
+#            one global id space)
+MERGE_POLICIES = ("remap", "label", "error")
+
+NODE_ATOM = 0
+NODE_PREDICATE = 1
+
+# Files handed to each worker ahead of the merge (see encode_sources).
+IN_FLIGHT_PER_WORKER = 2
+
+
+# -------------------------------------------------------------
+# ENCODED SHARDS
+# -------------------------------------------------------------
+
+class EncodedShard:
+    """
+    One parsed and validated source file, flattened into int64 columns
+    plus one string per label column, which pickles as a few large
+    buffers instead of one object per record.
+
+    Fields:
+        source: path of the file
+        format: its extension, e.g. ".json"
+        node_ids, node_kinds: one entry per node (NODE_ATOM / NODE_PREDICATE)
+        node_labels: the node labels, concatenated
+        node_label_ends: end offset of each node label in node_labels
+        triple_ids, subjects, predicates, objects: one entry per triple
+        triple_labels, triple_label_ends: as for nodes
+        rows: data rows or statements read (CSV, Turtle, RDF/XML), else None
+    """
+
+    __slots__ = (
+        "source", "format",
+        "node_ids", "node_kinds", "node_labels", "node_label_ends",
+        "triple_ids", "subjects", "predicates", "objects",
+        "triple_labels", "triple_label_ends", "rows",
+    )
+
+    def __init__(self, source: str, fmt: str):
+        self.source = source
+        self.format = fmt
+        self.node_ids = array("q")
+        self.node_kinds = array("b")
+        self.node_labels = ""
+        self.node_label_ends = array("q")
+        self.triple_ids = array("q")
+        self.subjects = array("q")
+        self.predicates = array("q")
+        self.objects = array("q")
+        self.triple_labels = ""
+        self.triple_label_ends = array("q")
+        self.rows = None
+
+    def max_id(self) -> int:
+        return max(max(self.node_ids, default=-1), max(self.triple_ids, default=-1))
+
+    def nodes(self) -> Iterator[Tuple[int, int, str]]:
+        """(id, kind, label) of each node, in file order."""
+        labels, start = self.node_labels, 0
+        for node_id, kind, end in zip(self.node_ids, self.node_kinds, self.node_label_ends):
+            yield node_id, kind, labels[start:end]
+            start = end
+
+    def triples(self) -> Iterator[Tuple[int, int, int, int, str]]:
+        """(id, subject, predicate, object, label) of each triple, in file order."""
+        labels, start = self.triple_labels, 0
+        for row in zip(self.triple_ids, self.subjects, self.predicates,
+                       self.objects, self.triple_label_ends):
+            end = row[4]
+            yield row[0], row[1], row[2], row[3], labels[start:end]
+            start = end
+
+
+def _records(path: Path, options: dict):
+    """The model objects of one file, through the single-file pipeline."""
+    fmt, raw = load_any(path, **options)
+    if fmt == ".json":
+        return fmt, raw, iter_normalize_json(raw)
+    if fmt == ".csv":
+        return fmt, raw, iter_normalize_csv(raw, 0)
+    if fmt in (".ttl", ".rdf"):
+        return fmt, raw, iter_normalize_terms(raw, 0)
+    raise ValueError(f"No normalizer available for format {fmt}")
+
+
+def encode_source(path: Union[str, Path], options: Optional[dict] = None) -> EncodedShard:
+    """
+    Parse and validate one file and flatten it into an EncodedShard.
+    Runs in the worker processes of encode_sources.
+
+    Raises:
+        OntologyValidationError: with the file name in front of every
+            position, if the file is invalid
+    """
+    path = Path(path)
+    try:
+        fmt, raw, records = _records(path, options or {})
+        shard = EncodedShard(str(path), fmt)
+
+        node_ids, node_kinds, node_ends = shard.node_ids, shard.node_kinds, shard.node_label_ends
+        t_ids, subj, pred, obj, t_ends = (shard.triple_ids, shard.subjects, shard.predicates,
+                                          shard.objects, shard.triple_label_ends)
+        node_labels: List[str] = []
+        triple_labels: List[str] = []
+        node_len = triple_len = 0
+
+        for rec in records:
+            if type(rec) is Triple:
+                t_ids.append(rec.id)
+                subj.append(rec.subject)
+                pred.append(rec.predicate)
+                obj.append(rec.object)
+                triple_labels.append(rec.label)
+                triple_len += len(rec.label)
+                t_ends.append(triple_len)
+            else:
+                node_ids.append(rec.id)
+                node_kinds.append(NODE_ATOM if type(rec) is Atom else NODE_PREDICATE)
+                node_labels.append(rec.label)
+                node_len += len(rec.label)
+                node_ends.append(node_len)
+    except OntologyValidationError as e:
+        raise OntologyValidationError(
+            [(f"{path} {where}" if where else str(path), msg) for where, msg in e.errors]
+        ) from None
+
+    shard.node_labels = "".join(node_labels)
+    shard.triple_labels = "".join(triple_labels)
+    shard.rows = getattr(raw, "rows", None) or getattr(raw, "statements", None)
+    return shard
+
+
+def _encode_task(task: Tuple[str, dict]) -> EncodedShard:
+    return encode_source(*task)
+
+
+def encode_sources(
+    sources: Sequence[Union[str, Path]],
+    workers: Optional[int] = None,
+    options: Optional[dict] = None,
+) -> Iterator[EncodedShard]:
+    """
+    EncodedShards of `sources`, in the order given. Files are parsed in
+    a process pool of `workers` processes (default: one per CPU); with
+    one worker, or one file, they are parsed in this process instead.
+
+    At most IN_FLIGHT_PER_WORKER files per worker are submitted ahead
+    of the consumer, so finished shards do not pile up in this process
+    when merging is slower than parsing. If a file fails (or the
+    consumer stops early), files not yet started are cancelled and the
+    error is raised at once, without waiting for the rest.
+    """
+    tasks = [(str(s), options or {}) for s in sources]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(tasks))
+    if workers <= 1:
+        for task in tasks:
+            yield _encode_task(task)
+        return
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = iter(tasks)
+        # Futures are consumed in submission order, so merging stays
+        # deterministic.
+        window = deque(pool.submit(_encode_task, task)
+                       for task in islice(pending, workers * IN_FLIGHT_PER_WORKER))
+        while window:
+            shard = window.popleft().result()
+            for task in islice(pending, 1):
+                window.append(pool.submit(_encode_task, task))
+            yield shard
+    except BaseException:
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
+
+
+# -------------------------------------------------------------
+# MERGING SHARDS INTO ONE ID SPACE
+# -------------------------------------------------------------
+
+class ShardMerger:
+    """
+    Turns EncodedShards into model objects with ids that are unique
+    across all of them, under one of MERGE_POLICIES.
+
+    Ids of a shard are kept when nothing merged before used them.
+    Colliding ids are moved to fresh ids above every id seen so far, and
+    every id placed is remembered, so ids stay unique whatever order
+    they arrive in. References inside a shard follow their targets' new
+    ids.
+
+    Fields:
+        policy: one of MERGE_POLICIES
+        remapped: number of nodes and triples that got a fresh id
+        reconciled: number of nodes merged into an earlier one by label
+    """
+
+    def __init__(self, policy: str, taken: Iterable[int] = (), next_id: int = 0):
+        if policy not in MERGE_POLICIES:
+            raise ValueError(f"Unknown merge policy: {policy!r}")
+        self.policy = policy
+        self.remapped = 0
+        self.reconciled = 0
+        self._taken = set(taken)
+        self._next_id = next_id
+        self._by_label: Tuple[Dict[str, int], Dict[str, int]] = ({}, {})
+
+    def reserve_above(self, max_id: int) -> None:
+        """Make sure fresh ids start above `max_id`."""
+        if max_id >= self._next_id:
+            self._next_id = max_id + 1
+
+    def merge(self, shard: EncodedShard) -> Iterator[Union[Atom, Predicate, Triple]]:
+        """Model objects of `shard`, with global ids; nodes before triples."""
+        self.reserve_above(shard.max_id())
+        mapping: Dict[int, int] = {}
+
+        # 1. Under "label", nodes whose label is known (from an earlier
+        #    shard, or earlier in this one) become that node.
+        nodes = list(shard.nodes())
+        same_as: Dict[int, int] = {}        # node id -> earlier node id in this shard
+        if self.policy == "label":
+            by_label = self._by_label
+            first: Tuple[Dict[str, int], Dict[str, int]] = ({}, {})
+            kept = []
+            for node in nodes:
+                node_id, kind, label = node
+                known = by_label[kind].get(label)
+                if known is not None:
+                    mapping[node_id] = known
+                elif label in first[kind]:
+                    same_as[node_id] = first[kind][label]
+                else:
+                    first[kind][label] = node_id
+                    kept.append(node)
+            self.reconciled += len(nodes) - len(kept)
+            nodes = kept
+
+        # 2. Ids already taken move to a block of fresh ids. The common
+        #    cases (no clash, or a shard whose ids all clash) are handled
+        #    with set operations rather than per id.
+        placed = [n[0] for n in nodes]
+        placed.extend(shard.triple_ids)
+        clash = self._taken.intersection(placed)
+        if clash:
+            if self.policy == "error":
+                raise ValueError(
+                    f"Id {min(clash)} in '{shard.source}' is already used by an earlier source."
+                )
+            fresh = range(self._next_id, self._next_id + len(clash))
+            self._next_id += len(clash)
+            mapping.update(zip(sorted(clash), fresh))
+            self._taken.update(fresh)
+            self.remapped += len(clash)
+        self._taken.update(placed)
+        for node_id, target in same_as.items():
+            mapping[node_id] = mapping.get(target, target)
+
+        # 3. Build the objects, rewriting references only if anything moved.
+        get = mapping.get
+        for node_id, kind, label in nodes:
+            new_id = get(node_id, node_id)
+            if self.policy == "label":
+                self._by_label[kind][label] = new_id
+            yield Atom(new_id, label) if kind == NODE_ATOM else Predicate(new_id, label)
+        if not mapping:
+            for tid, s, p, o, label in shard.triples():
+                yield Triple(tid, s, p, o, label)
+            return
+        for tid, s, p, o, label in shard.triples():
+            yield Triple(get(tid, tid), get(s, s), get(p, p), get(o, o), label)
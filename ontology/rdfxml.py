@@ -0,0 +1,254 @@
+# rdfxml.py
+
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from .turtle import RDF, RDF_FIRST, RDF_NIL, RDF_REST, RDF_TYPE
+
+
+# -------------------------------------------------------------
+# STREAMING RDF/XML READER
+# -------------------------------------------------------------
+#
+# ElementTree.iterparse reports start/end events while the file is read
+# in small chunks.
+# Subjects are known at "start" (from the attributes), literal text at
+# "end"; every element is cleared and detached from its parent as soon as
+# its end event has been handled, so the tree never holds more than the
+# current path from the root. Terms come out as in turtle.py:
+#
+#   IRIs           -> the absolute IRI (xml:base resolved)
+#   blank nodes    -> "_:nodeID" (unnamed ones get "_:genidN")
+#   literals       -> the text, with "@lang" appended if xml:lang applies;
+#                     rdf:datatype is dropped
+
+XML = "http://www.w3.org/XML/1998/namespace"
+
+_RDF_RDF = f"{{{RDF}}}RDF"
+_RDF_DESCRIPTION = f"{{{RDF}}}Description"
+_RDF_LI = f"{{{RDF}}}li"
+_RDF_ABOUT = f"{{{RDF}}}about"
+_RDF_ID = f"{{{RDF}}}ID"
+_RDF_NODE_ID = f"{{{RDF}}}nodeID"
+_RDF_RESOURCE = f"{{{RDF}}}resource"
+_RDF_PARSE_TYPE = f"{{{RDF}}}parseType"
+_RDF_TYPE_ATTR = f"{{{RDF}}}type"
+_XML_BASE = f"{{{XML}}}base"
+_XML_LANG = f"{{{XML}}}lang"
+
+# Attributes that are syntax, not property attributes.
+_SYNTAX_ATTRS = {
+    _RDF_ABOUT, _RDF_ID, _RDF_NODE_ID, _RDF_RESOURCE, _RDF_PARSE_TYPE,
+    f"{{{RDF}}}datatype", f"{{{RDF}}}bagID", f"{{{RDF}}}aboutEach",
+}
+
+
+class _Frame:
+    """One open element: a node element, or a property element."""
+
+    __slots__ = ("kind", "elem", "subject", "predicate", "base", "lang", "obj", "items", "li")
+
+    def __init__(self, kind, elem, subject, base, lang, predicate=None):
+        self.kind = kind            # "root", "node", "prop", "collection" or "literal"
+        self.elem = elem
+        self.subject = subject
+        self.predicate = predicate
+        self.base = base
+        self.lang = lang
+        self.obj: Optional[str] = None
+        self.items: List[str] = []
+        self.li = 0
+
+
+class RdfXmlSource:
+    """
+    Lazy streaming RDF/XML reader.
+
+    Iterating yields (subject, predicate, object) term strings as the
+    file is parsed. Memory is bounded by the nesting depth of the
+    document, not by its size.
+
+    Supports rdf:Description and typed node elements, rdf:about, rdf:ID,
+    rdf:nodeID, rdf:resource, property attributes, nested descriptions,
+    rdf:li, and rdf:parseType Resource, Collection and Literal.
+
+    Fields:
+        path: the .rdf file
+        statements: number of triples read so far
+    """
+
+    def __init__(self, path: Path, base: Optional[str] = None):
+        self.path = path
+        self.base = base if base is not None else path.resolve().as_uri()
+        self.statements = 0
+        self._genid = 0
+
+    def __iter__(self) -> Iterator[Tuple[str, str, str]]:
+        try:
+            f = self.path.open("rb")
+        except OSError as e:
+            raise OSError(f"Could not open '{self.path}': {e.strerror}") from e
+
+        with f:
+            out: List[Tuple[str, str, str]] = []
+            stack: List[_Frame] = []
+            literal_depth = 0   # elements open inside a parseType="Literal"
+            try:
+                for event, elem in ET.iterparse(f, events=("start", "end")):
+                    if literal_depth:
+                        literal_depth += 1 if event == "start" else -1
+                        if literal_depth:
+                            continue
+                    if event == "start":
+                        if self._start(elem, stack, out) == "literal":
+                            literal_depth = 1
+                        continue
+                    self._end(elem, stack, out)
+                    if out:
+                        self.statements += len(out)
+                        yield from out
+                        out.clear()
+            except ET.ParseError as e:
+                raise ValueError(f"Invalid RDF/XML in '{self.path}': {e}") from e
+
+    # ---- events ----
+
+    def _start(self, elem, stack: List[_Frame], out) -> str:
+        parent = stack[-1] if stack else None
+        base = parent.base if parent else self.base
+        if _XML_BASE in elem.attrib:
+            base = urljoin(base, elem.attrib[_XML_BASE])
+        lang = elem.get(_XML_LANG, parent.lang if parent else "")
+
+        if parent is None and elem.tag == _RDF_RDF:
+            stack.append(_Frame("root", elem, None, base, lang))
+            return "root"
+
+        if parent is None or parent.kind in ("root", "prop", "collection"):
+            frame = self._node_element(elem, base, lang, out)
+            if parent is not None and parent.kind == "prop":
+                if parent.obj is not None:
+                    self._error(f"Property <{parent.predicate}> has more than one object")
+                parent.obj = frame.subject
+            elif parent is not None and parent.kind == "collection":
+                parent.items.append(frame.subject)
+        else:
+            frame = self._property_element(elem, parent, base, lang, out)
+        stack.append(frame)
+        return frame.kind
+
+    def _end(self, elem, stack: List[_Frame], out) -> None:
+        frame = stack.pop()
+
+        if frame.kind == "prop":
+            if frame.obj is None:
+                frame.obj = self._literal(elem.text or "", frame.lang)
+            out.append((frame.subject, frame.predicate, frame.obj))
+
+        elif frame.kind == "literal":
+            text = (elem.text or "") + "".join(
+                ET.tostring(child, encoding="unicode") for child in elem
+            )
+            out.append((frame.subject, frame.predicate, text))
+
+        elif frame.kind == "collection":
+            head = RDF_NIL
+            prev = None
+            for item in frame.items:
+                node = self._fresh_bnode()
+                if prev is None:
+                    head = node
+                else:
+                    out.append((prev, RDF_REST, node))
+                out.append((node, RDF_FIRST, item))
+                prev = node
+            if prev is not None:
+                out.append((prev, RDF_REST, RDF_NIL))
+            out.append((frame.subject, frame.predicate, head))
+
+        # Drop the finished subtree so the document is never held in memory.
+        elem.clear()
+        if stack:
+            stack[-1].elem.remove(elem)
+
+    # ---- grammar ----
+
+    def _node_element(self, elem, base: str, lang: str, out) -> _Frame:
+        attrib = elem.attrib
+        if _RDF_ABOUT in attrib:
+            subject = urljoin(base, attrib[_RDF_ABOUT])
+        elif _RDF_ID in attrib:
+            subject = urljoin(base, "#" + attrib[_RDF_ID])
+        elif _RDF_NODE_ID in attrib:
+            subject = "_:" + attrib[_RDF_NODE_ID]
+        else:
+            subject = self._fresh_bnode()
+
+        if elem.tag != _RDF_DESCRIPTION:
+            out.append((subject, RDF_TYPE, self._iri(elem.tag)))
+        self._property_attributes(subject, attrib, base, lang, out)
+        return _Frame("node", elem, subject, base, lang)
+
+    def _property_element(self, elem, parent: _Frame, base: str, lang: str, out) -> _Frame:
+        if elem.tag == _RDF_LI:
+            parent.li += 1
+            predicate = f"{RDF}_{parent.li}"
+        else:
+            predicate = self._iri(elem.tag)
+
+        subject = parent.subject
+        attrib = elem.attrib
+        parse_type = attrib.get(_RDF_PARSE_TYPE)
+
+        if parse_type == "Resource":
+            node = self._fresh_bnode()
+            out.append((subject, predicate, node))
+            return _Frame("node", elem, node, base, lang)
+        if parse_type == "Collection":
+            return _Frame("collection", elem, subject, base, lang, predicate)
+        if parse_type is not None:      # "Literal" and unknown types alike
+            return _Frame("literal", elem, subject, base, lang, predicate)
+
+        frame = _Frame("prop", elem, subject, base, lang, predicate)
+        if _RDF_RESOURCE in attrib:
+            frame.obj = urljoin(base, attrib[_RDF_RESOURCE])
+        elif _RDF_NODE_ID in attrib:
+            frame.obj = "_:" + attrib[_RDF_NODE_ID]
+        if any(self._is_property_attribute(k) for k in attrib):
+            # <ex:p ex:q="v"/> is shorthand for a node with property q
+            if frame.obj is None:
+                frame.obj = self._fresh_bnode()
+            self._property_attributes(frame.obj, attrib, base, lang, out)
+        return frame
+
+    def _property_attributes(self, subject: str, attrib, base: str, lang: str, out) -> None:
+        for key, value in attrib.items():
+            if key == _RDF_TYPE_ATTR:
+                out.append((subject, RDF_TYPE, urljoin(base, value)))
+            elif self._is_property_attribute(key):
+                out.append((subject, self._iri(key), self._literal(value, lang)))
+
+    # ---- terms ----
+
+    @staticmethod
+    def _is_property_attribute(key: str) -> bool:
+        # unqualified and xml:* attributes are never properties
+        return key.startswith("{") and key not in _SYNTAX_ATTRS and not key.startswith(f"{{{XML}}}")
+
+    @staticmethod
+    def _iri(tag: str) -> str:
+        ns, _, local = tag[1:].partition("}")
+        return ns + local
+
+    @staticmethod
+    def _literal(text: str, lang: str) -> str:
+        return f"{text}@{lang}" if lang else text
+
+    def _fresh_bnode(self) -> str:
+        self._genid += 1
+        return f"_:genid{self._genid}"
+
+    def _error(self, msg: str):
+        raise ValueError(f"Invalid RDF/XML in '{self.path}': {msg}")
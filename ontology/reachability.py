@@ -0,0 +1,311 @@
+# reachability.py
+
+from bisect import bisect_right
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+from .memory import paused_gc
+
+
+# -------------------------------------------------------------
+# INTERVAL SETS
+# -------------------------------------------------------------
+#
+# A set of post-order numbers stored as sorted, disjoint, non-adjacent
+# (lo, hi) ranges. In a DFS post-order every subtree is one contiguous
+# range, so tree-shaped hierarchies need a single interval per node and
+# DAGs only a few more.
+
+Intervals = List[Tuple[int, int]]
+
+
+def _contains(intervals: Intervals, n: int) -> bool:
+    i = bisect_right(intervals, (n, float("inf"))) - 1
+    return i >= 0 and intervals[i][1] >= n
+
+
+def _coalesce(ranges: Iterable[Tuple[int, int]]) -> Intervals:
+    """Sort and join overlapping or adjacent ranges."""
+    out: Intervals = []
+    for lo, hi in sorted(ranges):
+        if out and lo <= out[-1][1] + 1:
+            if hi > out[-1][1]:
+                out[-1] = (out[-1][0], hi)
+        else:
+            out.append((lo, hi))
+    return out
+
+
+def _merge(a: Intervals, b: Intervals) -> Intervals:
+    if not b:
+        return a
+    if not a:
+        return list(b)
+    # Fast path: b lies after a (new nodes get the highest numbers).
+    last_lo, last_hi = a[-1]
+    if b[0][0] > last_hi + 1:
+        return a + b
+    if b[0][0] == last_hi + 1:
+        return a[:-1] + [(last_lo, b[0][1])] + b[1:]
+    return _coalesce(a + b)
+
+
+# -------------------------------------------------------------
+# REACHABILITY INDEX FOR ONE PREDICATE
+# -------------------------------------------------------------
+
+class ReachabilityIndex:
+    """
+    Transitive closure of one predicate, e.g. "type" or "has as kind".
+
+    The graph has an edge subject -> object for every triple on the
+    predicate. Strongly connected components are collapsed (Tarjan), and
+    each component of the resulting DAG gets a DFS post-order number in
+    both edge directions plus the set of numbers it reaches, kept as
+    intervals. So:
+
+        reaches(x, y)    one binary search        O(log k)
+        ancestors(x)     walk x's intervals       O(k + result)
+        descendants(y)   same, reverse direction  O(k + result)
+
+    where k is the number of intervals of the node (1 for trees).
+
+    Adding an edge a -> b later only extends the intervals of what can
+    reach a and of what b reaches; nothing is rebuilt. New cycles are
+    absorbed the same way (the components stay separate but become
+    mutually reachable).
+
+    Fields:
+        predicate: id of the predicate this index covers
+        edges: number of distinct edges indexed
+    """
+
+    def __init__(self, predicate: int, edges: Iterable[Tuple[int, int]] = ()):
+        self.predicate = predicate
+        self.edges = 0
+        self._succ: Dict[int, Set[int]] = {}
+
+        with paused_gc():
+            succ = self._succ
+            for s, o in edges:
+                targets = succ.get(s)
+                if targets is None:
+                    targets = succ[s] = set()
+                if o not in targets:
+                    targets.add(o)
+                    self.edges += 1
+                if o not in succ:
+                    succ[o] = set()
+            self._build()
+
+    # ---- construction ----
+
+    def _build(self) -> None:
+        succ = self._succ
+        comp = _tarjan(succ)
+        n = max(comp.values(), default=-1) + 1
+
+        members: List[List[int]] = [[] for _ in range(n)]
+        for node, c in comp.items():
+            members[c].append(node)
+        # Condensed DAG; an edge may repeat when several members of one
+        # component point into another, which the labelling tolerates.
+        down: List[List[int]] = [[] for _ in range(n)]
+        up: List[List[int]] = [[] for _ in range(n)]
+        for s, targets in succ.items():
+            cs = comp[s]
+            for o in targets:
+                co = comp[o]
+                if co != cs:
+                    down[cs].append(co)
+                    up[co].append(cs)
+
+        self._comp = comp
+        self._members = members
+        # Forward numbering answers "what does x reach", reverse numbering
+        # "what reaches y".
+        self._fwd_num, self._fwd_order, self._fwd = _label(down)
+        self._rev_num, self._rev_order, self._rev = _label(up)
+
+    # ---- maintenance ----
+
+    def _component(self, node: int) -> int:
+        c = self._comp.get(node)
+        if c is None:
+            c = self._comp[node] = len(self._members)
+            self._members.append([node])
+            self._succ[node] = set()
+            for num, order, reach in ((self._fwd_num, self._fwd_order, self._fwd),
+                                      (self._rev_num, self._rev_order, self._rev)):
+                k = len(order)
+                num.append(k)
+                order.append(c)
+                reach.append([(k, k)])
+        return c
+
+    def add_edge(self, subject: int, object: int) -> None:
+        """Record a new subject -> object edge, updating the closure in place."""
+        targets = self._succ.get(subject)
+        if targets is not None and object in targets:
+            return
+        a = self._component(subject)
+        b = self._component(object)
+        self._succ[subject].add(object)
+        self.edges += 1
+        if _contains(self._fwd[a], self._fwd_num[b]):
+            return      # already implied
+
+        # Every component that reaches a now also reaches all that b reaches.
+        ups = list(self._walk(self._rev[a], self._rev_order))
+        downs = list(self._walk(self._fwd[b], self._fwd_order))
+        b_reach, a_reached_by = self._fwd[b], self._rev[a]
+        for x in ups:
+            self._fwd[x] = _merge(self._fwd[x], b_reach)
+        for y in downs:
+            self._rev[y] = _merge(self._rev[y], a_reached_by)
+
+    # ---- queries ----
+
+    def reaches(self, x: int, y: int) -> bool:
+        """
+        True if y can be reached from x along the predicate, e.g. "x is
+        ultimately a kind of y". Every node reaches itself.
+        """
+        if x == y:
+            return True
+        cx, cy = self._comp.get(x), self._comp.get(y)
+        if cx is None or cy is None:
+            return False
+        return _contains(self._fwd[cx], self._fwd_num[cy])
+
+    def ancestors(self, x: int) -> Iterator[int]:
+        """Every node reachable from x (its kinds, their kinds, ...), x excluded."""
+        c = self._comp.get(x)
+        if c is None:
+            return
+        for d in self._walk(self._fwd[c], self._fwd_order):
+            for node in self._members[d]:
+                if node != x:
+                    yield node
+
+    def descendants(self, y: int) -> Iterator[int]:
+        """
+        Every node that reaches y, y excluded: all instances of kind y,
+        including instances of its subkinds.
+        """
+        c = self._comp.get(y)
+        if c is None:
+            return
+        for d in self._walk(self._rev[c], self._rev_order):
+            for node in self._members[d]:
+                if node != y:
+                    yield node
+
+    @staticmethod
+    def _walk(intervals: Intervals, order: List[int]) -> Iterator[int]:
+        for lo, hi in intervals:
+            yield from order[lo:hi + 1]
+
+    def __len__(self) -> int:
+        """Number of nodes in the predicate's graph."""
+        return len(self._comp)
+
+
+# -------------------------------------------------------------
+# GRAPH ALGORITHMS
+# -------------------------------------------------------------
+
+def _tarjan(succ: Dict[int, Set[int]]) -> Dict[int, int]:
+    """
+    Strongly connected components, iteratively (hierarchies can be far
+    deeper than the recursion limit). Returns node -> component number.
+    """
+    index: Dict[int, int] = {}
+    low: Dict[int, int] = {}
+    on_stack: Set[int] = set()
+    stack: List[int] = []
+    comp: Dict[int, int] = {}
+    counter = 0
+    n_comp = 0
+
+    for root in succ:
+        if root in index:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(succ[root]))]
+        while work:
+            node, it = work[-1]
+            advanced = False
+            for nxt in it:
+                if nxt not in index:
+                    index[nxt] = low[nxt] = counter
+                    counter += 1
+                    stack.append(nxt)
+                    on_stack.add(nxt)
+                    work.append((nxt, iter(succ[nxt])))
+                    advanced = True
+                    break
+                if nxt in on_stack and index[nxt] < low[node]:
+                    low[node] = index[nxt]
+            if advanced:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if low[node] < low[parent]:
+                    low[parent] = low[node]
+            if low[node] == index[node]:
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    comp[member] = n_comp
+                    if member == node:
+                        break
+                n_comp += 1
+    return comp
+
+
+def _label(dag: List[List[int]]) -> Tuple[List[int], List[int], List[Intervals]]:
+    """
+    DFS post-order numbers of a DAG's vertices and, for each vertex, the
+    numbers of everything it reaches (itself included) as intervals.
+
+    Returns (number of each vertex, vertex of each number, intervals).
+    """
+    n = len(dag)
+    num = [-1] * n
+    order: List[int] = []
+    reach: List[Intervals] = [[] for _ in range(n)]
+
+    for root in range(n):
+        if num[root] >= 0:
+            continue
+        num[root] = -2      # on the DFS path
+        work = [(root, iter(dag[root]))]
+        while work:
+            v, it = work[-1]
+            for w in it:
+                if num[w] == -1:
+                    num[w] = -2
+                    work.append((w, iter(dag[w])))
+                    break
+            else:
+                work.pop()
+                k = num[v] = len(order)
+                order.append(v)
+                # Successors are numbered already (post-order of a DAG), so
+                # k is above everything they reach.
+                succs = dag[v]
+                if not succs:
+                    reach[v] = [(k, k)]
+                elif len(succs) == 1:
+                    (w,) = succs
+                    reach[v] = _merge(reach[w], [(k, k)])
+                else:
+                    ranges = [(k, k)]
+                    for w in succs:
+                        ranges.extend(reach[w])
+                    reach[v] = _coalesce(ranges)
+    return num, order, reach
@@ -0,0 +1,315 @@
+# rules.py
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .memory import paused_gc
+from .models import Triple
+
+
+# -------------------------------------------------------------
+# HORN RULES OVER TRIPLE PATTERNS
+# -------------------------------------------------------------
+#
+# A pattern is a (subject, predicate, object) tuple whose terms are
+# either node ids (int) or variables (str starting with "?"):
+#
+#     (?x, has_as_kind, ?k) and (?k, sub_kind_of, ?j)  =>  (?x, has_as_kind, ?j)
+#
+#     Rule(body=[("?x", 5, "?k"), ("?k", 7, "?j")], head=("?x", 5, "?j"))
+
+Term = Union[int, str]
+Pattern = Tuple[Term, Term, Term]
+
+
+def is_var(term: Term) -> bool:
+    return isinstance(term, str) and term.startswith("?")
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    """
+    A Horn rule: when every body pattern matches, the head holds.
+
+    Fields:
+        body: patterns that must all match (a conjunction), non-empty
+        head: the single pattern to derive; every variable in it
+              must also appear in the body
+        name: optional label, shown in errors
+    """
+    body: Tuple[Pattern, ...]
+    head: Pattern
+    name: str = ""
+
+    def __post_init__(self):
+        object.__setattr__(self, "body", tuple(tuple(p) for p in self.body))
+        object.__setattr__(self, "head", tuple(self.head))
+        where = f"Rule {self.name!r}" if self.name else "Rule"
+
+        if not self.body:
+            raise ValueError(f"{where} needs at least one body pattern.")
+        for pattern in (*self.body, self.head):
+            if len(pattern) != 3:
+                raise ValueError(f"{where}: patterns must have 3 terms, got {pattern}.")
+            for term in pattern:
+                if not is_var(term) and not (isinstance(term, int) and term >= 0):
+                    raise ValueError(
+                        f"{where}: terms must be node ids or '?variables', got {term!r}."
+                    )
+
+        body_vars = {t for p in self.body for t in p if is_var(t)}
+        unbound = [t for t in self.head if is_var(t) and t not in body_vars]
+        if unbound:
+            raise ValueError(f"{where}: head variables {unbound} do not appear in the body.")
+
+
+# -------------------------------------------------------------
+# JOIN PLANS
+# -------------------------------------------------------------
+#
+# A rule body is compiled once per join order into steps over a row of
+# variable slots, so matching never has to look at variable names:
+#
+#     terms    per position: (constant id, None) or (None, slot index);
+#              (None, None) for a variable first seen in this pattern
+#     fresh    positions whose values become new slots, in slot order
+#     repeats  (position, earlier position) pairs for a variable that
+#              occurs twice in the same pattern, e.g. (?x, p, ?x)
+
+_Step = Tuple[str, Tuple[Tuple[Optional[int], Optional[int]], ...], Tuple[int, ...],
+              Tuple[Tuple[int, int], ...]]
+
+
+def _compile(body: Sequence[Pattern], views: Sequence[str],
+             head: Pattern) -> Tuple[List[_Step], Tuple[Tuple[Optional[int], Optional[int]], ...]]:
+    slots: Dict[str, int] = {}
+    steps: List[_Step] = []
+    for pattern, view in zip(body, views):
+        terms = []
+        fresh: List[int] = []
+        repeats: List[Tuple[int, int]] = []
+        first_at: Dict[str, int] = {}
+        for pos, term in enumerate(pattern):
+            if not is_var(term):
+                terms.append((term, None))
+            elif term in slots:
+                terms.append((None, slots[term]))
+            elif term in first_at:
+                terms.append((None, None))
+                repeats.append((pos, first_at[term]))
+            else:
+                terms.append((None, None))
+                first_at[term] = pos
+                fresh.append(pos)
+        for pos in fresh:
+            slots[pattern[pos]] = len(slots)
+        steps.append((view, tuple(terms), tuple(fresh), tuple(repeats)))
+    head_terms = tuple((None, slots[t]) if is_var(t) else (t, None) for t in head)
+    return steps, head_terms
+
+
+# -------------------------------------------------------------
+# SEMI-NAIVE FORWARD CHAINING
+# -------------------------------------------------------------
+
+class _Evaluator:
+    """
+    Joins rule bodies against one Ontology's triple indexes.
+
+    Every body pattern is read from one of three views of the graph:
+
+        "delta"  triples derived in the previous round
+        "old"    triples that existed before the previous round
+        "full"   old + delta
+
+    Triples derived during a round are only added when it ends, so the
+    indexes are stable while a round is being joined.
+    """
+
+    def __init__(self, onto):
+        self.onto = onto
+        self.index = onto._index
+        self.triples = onto.triples
+        self.delta_start = 0                         # first id of the delta
+        self.delta_by_predicate: Dict[int, List[Tuple[int, int, int]]] = {}
+        self.delta: List[Tuple[int, int, int]] = []
+        self._plans: Dict[Tuple[Rule, bool], list] = {}
+
+    def _plans_for(self, rule: Rule, first_round: bool) -> list:
+        plans = self._plans.get((rule, first_round))
+        if plans is None:
+            n = len(rule.body)
+            if first_round:
+                view_sets = [(0, ("full",) * n)]
+            else:
+                # body[i] reads the delta, earlier patterns the old graph and
+                # later ones the full graph: each new combination is found once.
+                view_sets = [(i, ("old",) * i + ("delta",) + ("full",) * (n - i - 1))
+                             for i in range(n)]
+            plans = []
+            for i, views in view_sets:
+                # Start from pattern i (the delta, the smallest input), then
+                # take the others in the order written.
+                order = [i] + [j for j in range(n) if j != i]
+                plans.append(_compile([rule.body[j] for j in order],
+                                      [views[j] for j in order], rule.head))
+            self._plans[(rule, first_round)] = plans
+        return plans
+
+    def _candidates(self, view: str, s, p, o) -> Iterable[Tuple[int, int, int]]:
+        """(subject, predicate, object) values of the triples in `view`
+        that may match; delta candidates are only narrowed by predicate."""
+        if view == "delta":
+            return self.delta if p is None else self.delta_by_predicate.get(p, ())
+        index = self.index
+        limit = self.delta_start if view == "old" else None
+        objects = index.objects
+        # Fast paths read the object straight from the index, no Triple needed.
+        if s is not None and p is not None:
+            tids = index.spo.get(s, {}).get(p, ())
+            return [(s, p, objects[tid]) for tid in tids if limit is None or tid < limit]
+        if s is not None and o is None:
+            return [(s, p_, objects[tid])
+                    for p_, tids in index.spo.get(s, {}).items()
+                    for tid in tids if limit is None or tid < limit]
+        triples = self.triples
+        return [(t.subject, t.predicate, t.object)
+                for t in (triples[tid] for tid in index.ids(s, p, o)
+                          if limit is None or tid < limit)]
+
+    def fire(self, rule: Rule, first_round: bool) -> List[Tuple[int, int, int]]:
+        """Head instances produced by `rule` in this round."""
+        heads: List[Tuple[int, int, int]] = []
+        for steps, head_terms in self._plans_for(rule, first_round):
+            rows: List[tuple] = [()]
+            for step in steps:
+                rows = self._step(step, rows)
+                if not rows:
+                    break
+            (hc_s, hs_s), (hc_p, hs_p), (hc_o, hs_o) = head_terms
+            heads.extend(
+                (hc_s if hs_s is None else row[hs_s],
+                 hc_p if hs_p is None else row[hs_p],
+                 hc_o if hs_o is None else row[hs_o])
+                for row in rows
+            )
+        return heads
+
+    def _step(self, step: _Step, rows: List[tuple]) -> List[tuple]:
+        """Extend every row with the matches of one body pattern."""
+        view, terms, fresh, repeats = step
+        (cs, ss), (cp, sp), (co, so) = terms
+        out: List[tuple] = []
+        append = out.append
+
+        # Hot case: subject and predicate known, one new variable in the
+        # object, read from the full graph (a typical chain join).
+        if (view == "full" and not repeats and fresh == (2,)
+                and (cs is not None or ss is not None) and (cp is not None or sp is not None)):
+            spo, objects = self.index.spo, self.index.objects
+            for row in rows:
+                s = cs if ss is None else row[ss]
+                p = cp if sp is None else row[sp]
+                by_p = spo.get(s)
+                if by_p is None:
+                    continue
+                for tid in by_p.get(p, ()):
+                    append(row + (objects[tid],))
+            return out
+
+        candidates = self._candidates
+        for row in rows:
+            s = cs if ss is None else row[ss]
+            p = cp if sp is None else row[sp]
+            o = co if so is None else row[so]
+            for vals in candidates(view, s, p, o):
+                if (s is not None and vals[0] != s) or (o is not None and vals[2] != o):
+                    continue
+                if repeats and any(vals[a] != vals[b] for a, b in repeats):
+                    continue
+                append(row + tuple(vals[pos] for pos in fresh))
+        return out
+
+    def set_delta(self, derived: List[Triple]) -> None:
+        self.delta = [(t.subject, t.predicate, t.object) for t in derived]
+        self.delta_start = derived[0].id if derived else self.onto._next_id
+        by_p: Dict[int, List[Tuple[int, int, int]]] = {}
+        for spo in self.delta:
+            by_p.setdefault(spo[1], []).append(spo)
+        self.delta_by_predicate = by_p
+
+
+def forward_chain(onto, rules: Iterable[Rule], max_rounds: Optional[int] = None) -> List[Triple]:
+    """
+    Apply `rules` to `onto` until nothing new can be derived.
+
+    Uses semi-naive evaluation: after the first round, every rule is only
+    joined against combinations that involve at least one triple derived
+    in the round before, so facts are never re-derived from scratch.
+    Body patterns are answered from the SPO/POS/OSP indexes.
+
+    New triples are added with Ontology.add_triple (fused labels) and
+    their ids recorded in `onto.derived`. A head that already exists as
+    a triple is not added again.
+
+    Returns:
+        the derived triples, in the order they were added.
+
+    Raises:
+        ValueError: if a head would use a non-Predicate as predicate.
+    """
+    with paused_gc():
+        return _saturate(onto, list(rules), max_rounds)
+
+
+def _saturate(onto, rules: List[Rule], max_rounds: Optional[int]) -> List[Triple]:
+    ev = _Evaluator(onto)
+    index = onto._index
+    derived_all: List[Triple] = []
+    labels: Dict[int, str] = {}     # node id -> label, for fusing new labels
+
+    def label_of(node_id: int) -> str:
+        label = labels.get(node_id)
+        if label is None:
+            label = labels[node_id] = onto._label_of(node_id)
+        return label
+
+    rounds = 0
+    while max_rounds is None or rounds < max_rounds:
+        first_round = rounds == 0
+        heads: List[Tuple[int, int, int]] = []
+
+        for rule in rules:
+            if not first_round and not any(
+                _could_match(p, ev.delta_by_predicate) for p in rule.body
+            ):
+                continue
+            fired = ev.fire(rule, first_round)
+            for p in {spo[1] for spo in fired}:
+                if p not in onto.predicates:
+                    raise ValueError(
+                        f"Rule {rule.name or rule.head!r} derives a triple whose "
+                        f"predicate {p} is not a Predicate."
+                    )
+            heads.extend(fired)
+
+        # dict.fromkeys drops repeats in C and keeps first-derived order
+        has = index.has
+        new = [spo for spo in dict.fromkeys(heads) if not has(*spo)]
+
+        rounds += 1
+        if not new:
+            break
+
+        added = [onto.add_triple(s, p, o, f"{label_of(s)} {label_of(p)} {label_of(o)}")
+                 for s, p, o in new]
+        onto.derived.update(t.id for t in added)
+        derived_all.extend(added)
+        ev.set_delta(added)
+
+    return derived_all
+
+
+def _could_match(pattern: Pattern, delta_by_predicate: Dict[int, list]) -> bool:
+    p = pattern[1]
+    return is_var(p) or p in delta_by_predicate
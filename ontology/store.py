@@ -0,0 +1,142 @@
+# store.py
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .models import Triple
+
+
+# -------------------------------------------------------------
+# COLUMNAR TRIPLE STORE
+# -------------------------------------------------------------
+
+class ColumnarTriples:
+    """
+    Array-backed replacement for the `id -> Triple` dict.
+
+    Each triple is one row across parallel typed columns:
+
+        ids, subjects, predicates, objects : array('q')  (int64)
+        labels                             : list[str]
+
+    `Triple` objects are only built when a row is read, so storage is
+    32 bytes of integers plus one label reference per triple instead of
+    a Triple instance and its boxed ints. Measured with
+    `benchmarks/bench_storage.py` (CPython 3.11, 64-bit, 1M triples,
+    slotted Triple):
+
+        dict of Triple               ~ 249 bytes / triple
+        ColumnarTriples              ~  97 bytes / triple
+                                     (~ 99 bytes / triple at 10M)
+
+    Most of what remains is the label strings themselves. The
+    TripleIndex costs the same in both layouts and is not included:
+    ~125 bytes / triple in that benchmark, whose graph has 1000
+    subjects and objects and one predicate; graphs with many distinct
+    subjects pay more, for their many small inner dicts and lists.
+
+    Rows are looked up by binary search over the id column as long as
+    ids arrive in increasing order (the normal case for exports and for
+    Ontology.add_triple). The first out-of-order id switches lookups to
+    an `id -> row` dict.
+
+    The object supports the read/write mapping operations Ontology uses
+    on `triples`: [], in, len, iter, get, keys, values, items.
+    """
+
+    def __init__(self):
+        self.ids = array("q")
+        self.subjects = array("q")
+        self.predicates = array("q")
+        self.objects = array("q")
+        self.labels: List[str] = []
+        self._rows: Optional[Dict[int, int]] = None   # only once unsorted
+
+    # ---- row lookup ----
+
+    def _row(self, triple_id: int) -> int:
+        """Row number of `triple_id`, or -1 if absent."""
+        if self._rows is not None:
+            return self._rows.get(triple_id, -1)
+        ids = self.ids
+        i = bisect_left(ids, triple_id)
+        if i < len(ids) and ids[i] == triple_id:
+            return i
+        return -1
+
+    def _materialize(self, i: int) -> Triple:
+        return Triple(
+            self.ids[i],
+            self.subjects[i],
+            self.predicates[i],
+            self.objects[i],
+            self.labels[i],
+        )
+
+    # ---- writing ----
+
+    def append(self, triple_id: int, subject: int, predicate: int, object: int, label: str) -> None:
+        """Store a triple from its fields, without building a Triple."""
+        ids = self.ids
+        if self._rows is None and (not ids or triple_id > ids[-1]):
+            i = -1     # fast path: new, in-order id
+        else:
+            i = self._row(triple_id)
+        if i >= 0:
+            self.subjects[i] = subject
+            self.predicates[i] = predicate
+            self.objects[i] = object
+            self.labels[i] = label
+            return
+
+        if self._rows is None and ids and triple_id < ids[-1]:
+            self._rows = {tid: row for row, tid in enumerate(ids)}
+        if self._rows is not None:
+            self._rows[triple_id] = len(ids)
+
+        ids.append(triple_id)
+        self.subjects.append(subject)
+        self.predicates.append(predicate)
+        self.objects.append(object)
+        self.labels.append(label)
+
+    def __setitem__(self, triple_id: int, t: Triple) -> None:
+        if t.id != triple_id:
+            raise ValueError(f"Triple id {t.id} stored under key {triple_id}")
+        self.append(t.id, t.subject, t.predicate, t.object, t.label)
+
+    # ---- reading ----
+
+    def __getitem__(self, triple_id: int) -> Triple:
+        i = self._row(triple_id)
+        if i < 0:
+            raise KeyError(triple_id)
+        return self._materialize(i)
+
+    def get(self, triple_id: int, default=None):
+        i = self._row(triple_id)
+        return default if i < 0 else self._materialize(i)
+
+    def __contains__(self, triple_id) -> bool:
+        return isinstance(triple_id, int) and self._row(triple_id) >= 0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.ids)
+
+    def keys(self) -> Iterator[int]:
+        return iter(self.ids)
+
+    def values(self) -> Iterator[Triple]:
+        for i in range(len(self.ids)):
+            yield self._materialize(i)
+
+    def items(self) -> Iterator[Tuple[int, Triple]]:
+        for i in range(len(self.ids)):
+            yield self.ids[i], self._materialize(i)
+
+    def __repr__(self) -> str:
+        return f"ColumnarTriples({len(self)} triples)"
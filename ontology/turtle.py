@@ -0,0 +1,376 @@
+# turtle.py
+
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin
+
+
+# -------------------------------------------------------------
+# STREAMING TURTLE READER
+# -------------------------------------------------------------
+#
+# A tokenizer runs one master regex over a sliding text buffer, so only
+# the statement being parsed (plus one chunk of look-ahead) is in memory.
+# A small recursive-descent parser on top of it turns each statement into
+# (subject, predicate, object) term strings:
+#
+#   IRIs           -> the absolute IRI (prefixes and @base resolved)
+#   blank nodes    -> "_:label" (anonymous [] / collections get "_:genidN")
+#   literals       -> the lexical form, with "@lang" appended if tagged;
+#                     datatypes are dropped, so "42"^^xsd:int -> "42"
+
+RDF = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+RDF_TYPE = RDF + "type"
+RDF_FIRST = RDF + "first"
+RDF_REST = RDF + "rest"
+RDF_NIL = RDF + "nil"
+
+# Characters pulled from disk per read.
+TURTLE_CHUNK_SIZE = 1 << 16
+# Characters that must follow a token before it is trusted to be complete.
+_LOOKAHEAD = 3
+
+_PN_CHARS = r"[^\s<>\"'{}|^`\\.;,()\[\]#:]"
+_TOKEN = re.compile(
+    r"""
+      (?P<ws>(?:\s+|\#[^\n]*)+)
+    | (?P<iri><[^<>"{}|^`\\\s]*>)
+    | (?P<long>\"\"\"(?:[^"\\]|\\.|"(?!""))*\"\"\"|'''(?:[^'\\]|\\.|'(?!''))*''')
+    | (?P<string>"(?:[^"\\\n\r]|\\.)*"|'(?:[^'\\\n\r]|\\.)*')
+    | (?P<directive>@prefix\b|@base\b)
+    | (?P<lang>@[A-Za-z]+(?:-[A-Za-z0-9]+)*)
+    | (?P<caret>\^\^)
+    | (?P<number>[+-]?(?:\d+\.\d*[eE][+-]?\d+|\.?\d+[eE][+-]?\d+|\d*\.\d+|\d+))
+    | (?P<bnode>_:(?:%(pn)s|[0-9])(?:(?:%(pn)s|[.:])*(?:%(pn)s|:))?)
+    | (?P<pname>(?:%(pn)s(?:(?:%(pn)s|\.)*%(pn)s)?)?:(?:(?:%(pn)s|[:0-9]|\\.|%%[0-9A-Fa-f]{2})(?:(?:%(pn)s|[.:]|\\.|%%[0-9A-Fa-f]{2})*(?:%(pn)s|:|\\.|%%[0-9A-Fa-f]{2}))?)?)
+    | (?P<word>[A-Za-z]+)
+    | (?P<punct>[.;,\[\]()])
+    """ % {"pn": _PN_CHARS},
+    re.VERBOSE,
+)
+
+# What the start of a token cut off by the buffer edge can look like:
+# an IRI or string not closed yet, a directive or language tag, "^".
+# Unmatched input that is not one of these is an error however much
+# more is read, so it is reported without reading on.
+_PARTIAL = re.compile(
+    r"""
+      <[^<>"{}|^`\\\s]*
+    | "(?:[^"\\\n\r]|\\.)*\\?
+    | '(?:[^'\\\n\r]|\\.)*\\?
+    | @[A-Za-z]*(?:-[A-Za-z0-9]*)*
+    | \^
+    """,
+    re.VERBOSE,
+)
+
+_ESCAPE = re.compile(r"\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))", re.DOTALL)
+_SIMPLE_ESCAPES = {"t": "\t", "b": "\b", "n": "\n", "r": "\r", "f": "\f",
+                   '"': '"', "'": "'", "\\": "\\"}
+
+
+def _unescape(text: str) -> str:
+    if "\\" not in text:
+        return text
+
+    def sub(m):
+        hex4, hex8, ch = m.groups()
+        if hex4 or hex8:
+            return chr(int(hex4 or hex8, 16))
+        # local-name escapes (\- \. \~ ...) just drop the backslash
+        return _SIMPLE_ESCAPES.get(ch, ch)
+
+    return _ESCAPE.sub(sub, text)
+
+
+class _Tokens:
+    """Pulls (kind, text) tokens from a file through a sliding buffer."""
+
+    def __init__(self, f, path: Path, chunk_size: int):
+        self.f = f
+        self.path = path
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.line = 1       # line number at buf[pos]
+        self.eof = False
+        self._peeked: Optional[Tuple[str, str]] = None
+
+    def _fill(self) -> bool:
+        if self.pos:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        chunk = self.f.read(max(self.chunk_size, len(self.buf)))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf += chunk
+        return True
+
+    def error(self, msg: str):
+        raise ValueError(f"Invalid Turtle in '{self.path}': {msg} at line {self.line}")
+
+    def _next(self) -> Tuple[str, str]:
+        while True:
+            if self.pos >= len(self.buf) and not self._fill():
+                return ("eof", "")
+            m = _TOKEN.match(self.buf, self.pos)
+            # A token near the end of the buffer may continue in the next
+            # chunk ("1" of "1.70", '""' of '"""'), or not match at all
+            # yet ("<http://ex"): read more and retry.
+            if not self.eof and (
+                m.end() + _LOOKAHEAD > len(self.buf) if m is not None
+                else _PARTIAL.fullmatch(self.buf, self.pos)
+            ):
+                self._fill()
+                continue
+            if m is None:
+                self.error(f"Unexpected input {self.buf[self.pos:self.pos + 20]!r}")
+            # '""' that is really the start of a long string cut off by the
+            # buffer edge.
+            if m.lastgroup == "string" and self.buf.startswith(('"""', "'''"), self.pos):
+                if not self.eof:
+                    self._fill()
+                    continue
+                self.error("Unterminated long string")
+            text = m.group()
+            self.line += text.count("\n")
+            self.pos = m.end()
+            if m.lastgroup != "ws":
+                return (m.lastgroup, text)
+
+    def peek(self) -> Tuple[str, str]:
+        if self._peeked is None:
+            self._peeked = self._next()
+        return self._peeked
+
+    def take(self) -> Tuple[str, str]:
+        tok = self.peek()
+        self._peeked = None
+        return tok
+
+    def expect(self, text: str) -> None:
+        kind, got = self.take()
+        if got != text:
+            self.error(f"Expected {text!r}, got {got or 'end of file'!r}")
+
+
+class TurtleSource:
+    """
+    Lazy streaming Turtle reader.
+
+    Iterating yields (subject, predicate, object) term strings statement
+    by statement. Memory is bounded by the largest single statement, not
+    by the file.
+
+    Supports @prefix/@base (and SPARQL-style PREFIX/BASE), ';' and ','
+    lists, 'a', IRIs, prefixed names, blank node labels, '[ ... ]'
+    property lists, '( ... )' collections, and string, numeric and
+    boolean literals with language tags or datatypes.
+
+    Fields:
+        path: the .ttl file
+        statements: number of triples read so far
+    """
+
+    def __init__(self, path: Path, base: Optional[str] = None,
+                 chunk_size: int = TURTLE_CHUNK_SIZE):
+        self.path = path
+        self.base = base if base is not None else path.resolve().as_uri()
+        self.chunk_size = chunk_size
+        self.statements = 0
+
+    def __iter__(self) -> Iterator[Tuple[str, str, str]]:
+        try:
+            f = self.path.open("r", encoding="utf-8")
+        except OSError as e:
+            raise OSError(f"Could not open '{self.path}': {e.strerror}") from e
+        with f:
+            parser = _Parser(_Tokens(f, self.path, self.chunk_size), self.base)
+            for triple in parser.triples():
+                self.statements += 1
+                yield triple
+
+
+class _Parser:
+    def __init__(self, tokens: _Tokens, base: str):
+        self.t = tokens
+        self.base = base
+        self.prefixes: Dict[str, str] = {}
+        self.out: List[Tuple[str, str, str]] = []
+        self._genid = 0
+
+    # ---- driver ----
+
+    def triples(self) -> Iterator[Tuple[str, str, str]]:
+        t = self.t
+        while True:
+            kind, text = t.peek()
+            if kind == "eof":
+                return
+            if kind == "directive":
+                self.directive(text[1:], sparql=False)
+            elif kind == "word" and text.upper() in ("PREFIX", "BASE"):
+                self.directive(text.lower(), sparql=True)
+            else:
+                self.statement()
+            if self.out:
+                yield from self.out
+                self.out.clear()
+
+    def directive(self, name: str, sparql: bool) -> None:
+        t = self.t
+        t.take()
+        if name == "prefix":
+            kind, text = t.take()
+            if kind != "pname" or not text.endswith(":"):
+                t.error(f"Expected prefix name, got {text!r}")
+            kind, iri = t.take()
+            if kind != "iri":
+                t.error(f"Expected IRI, got {iri!r}")
+            self.prefixes[text[:-1]] = self.resolve(iri)
+        else:
+            kind, iri = t.take()
+            if kind != "iri":
+                t.error(f"Expected IRI, got {iri!r}")
+            self.base = self.resolve(iri)
+        if not sparql:
+            t.expect(".")
+
+    # ---- grammar ----
+
+    def statement(self) -> None:
+        t = self.t
+        kind, text = t.peek()
+        if text == "[":
+            subject = self.blank_property_list()
+            if t.peek()[1] != ".":
+                self.predicate_object_list(subject)
+        else:
+            subject = self.subject()
+            self.predicate_object_list(subject)
+        t.expect(".")
+
+    def subject(self) -> str:
+        kind, text = self.t.peek()
+        if text == "(":
+            return self.collection()
+        if kind in ("iri", "pname", "bnode"):
+            return self.term(*self.t.take())
+        self.t.error(f"Expected subject, got {text or 'end of file'!r}")
+
+    def predicate_object_list(self, subject: str) -> None:
+        t = self.t
+        while True:
+            predicate = self.verb()
+            self.object_list(subject, predicate)
+            if t.peek()[1] != ";":
+                return
+            while t.peek()[1] == ";":
+                t.take()
+            if t.peek()[1] in (".", "]"):
+                return
+
+    def verb(self) -> str:
+        kind, text = self.t.take()
+        if kind == "word" and text == "a":
+            return RDF_TYPE
+        if kind in ("iri", "pname"):
+            return self.term(kind, text)
+        self.t.error(f"Expected predicate, got {text or 'end of file'!r}")
+
+    def object_list(self, subject: str, predicate: str) -> None:
+        t = self.t
+        while True:
+            self.out.append((subject, predicate, self.object()))
+            if t.peek()[1] != ",":
+                return
+            t.take()
+
+    def object(self) -> str:
+        t = self.t
+        kind, text = t.peek()
+        if text == "[":
+            return self.blank_property_list()
+        if text == "(":
+            return self.collection()
+        kind, text = t.take()
+        if kind in ("iri", "pname", "bnode"):
+            return self.term(kind, text)
+        if kind in ("string", "long"):
+            return self.literal(text)
+        if kind == "number":
+            return text
+        if kind == "word" and text in ("true", "false"):
+            return text
+        t.error(f"Expected object, got {text or 'end of file'!r}")
+
+    def blank_property_list(self) -> str:
+        t = self.t
+        t.expect("[")
+        node = self.fresh_bnode()
+        if t.peek()[1] != "]":
+            self.predicate_object_list(node)
+        t.expect("]")
+        return node
+
+    def collection(self) -> str:
+        t = self.t
+        t.expect("(")
+        head = RDF_NIL
+        prev = None
+        while t.peek()[1] != ")":
+            if t.peek()[0] == "eof":
+                t.error("Unterminated collection")
+            node = self.fresh_bnode()
+            item = self.object()
+            if prev is None:
+                head = node
+            else:
+                self.out.append((prev, RDF_REST, node))
+            self.out.append((node, RDF_FIRST, item))
+            prev = node
+        t.take()
+        if prev is not None:
+            self.out.append((prev, RDF_REST, RDF_NIL))
+        return head
+
+    # ---- terms ----
+
+    def fresh_bnode(self) -> str:
+        self._genid += 1
+        return f"_:genid{self._genid}"
+
+    def resolve(self, iri_token: str) -> str:
+        iri = _unescape(iri_token[1:-1])
+        if ":" in iri.split("/", 1)[0]:     # already absolute
+            return iri
+        return urljoin(self.base, iri)
+
+    def term(self, kind: str, text: str) -> str:
+        if kind == "iri":
+            return self.resolve(text)
+        if kind == "bnode":
+            return text
+        prefix, _, local = text.partition(":")
+        ns = self.prefixes.get(prefix)
+        if ns is None:
+            self.t.error(f"Undefined prefix {prefix!r}")
+        return ns + _unescape(local)
+
+    def literal(self, text: str) -> str:
+        quote = 3 if text[:3] in ('"""', "'''") else 1
+        value = _unescape(text[quote:-quote])
+        t = self.t
+        kind, nxt = t.peek()
+        if kind == "lang":
+            t.take()
+            return f"{value}{nxt}"
+        if kind == "caret":
+            t.take()
+            kind, dtype = t.take()
+            if kind not in ("iri", "pname"):
+                t.error(f"Expected datatype IRI, got {dtype!r}")
+            self.term(kind, dtype)     # validate the prefix
+        return value
@@ -0,0 +1,13 @@
+
+
+from ontology import Ontology
+
+
+
+ontology = Ontology("validdata.json", storage="columnar")
+
+print(ontology.triples)
+
+print(ontology.triples[101])
+
+print(list(ontology.match(subject=1, predicate=10)))
@@ -0,0 +1,20 @@
+
+
+from pathlib import Path
+
+from ontology import Ontology
+from ontology.loaders import load_json
+from ontology.normalize import OntologyValidationError, validate_json_schema
+
+
+try:
+    ontology = Ontology("invaliddata.json")
+except ValueError as e:
+    print(e)
+
+
+try:
+    validate_json_schema(load_json(Path("invaliddata.json")), collect_errors=True)
+except OntologyValidationError as e:
+    for where, msg in e.errors:
+        print(where, msg)
@@ -0,0 +1,15 @@
+
+
+from ontology import Ontology
+
+
+
+ontology = Ontology("edges.csv")
+
+print(ontology.atoms)
+
+print(ontology.predicates)
+
+print(ontology.triples)
+
+print(ontology.load_stats["rows"])
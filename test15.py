@@ -0,0 +1,17 @@
+
+
+from ontology import Ontology
+from ontology.rules import Rule
+
+
+
+ontology = Ontology("validdata.json")
+
+# anything of a kind lives where its members live
+rule = Rule(body=[("?x", 10, "?k"), ("?x", 11, "?c")], head=("?k", 11, "?c"))
+
+print(ontology.infer([rule]))
+
+print(ontology.derived)
+
+print(list(ontology.match(subject=3, predicate=11)))
@@ -0,0 +1,17 @@
+
+
+from ontology import Ontology
+
+
+
+ontology = Ontology("validdata.json")
+
+kinds = ontology.reachability(10)
+
+print(kinds.reaches(1, 3))
+
+print(list(kinds.descendants(3)))
+
+ontology.add_triple(3, 10, 2)
+
+print(kinds.reaches(1, 2), list(kinds.ancestors(1)))
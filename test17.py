@@ -0,0 +1,11 @@
+from ontology import Ontology
+
+
+
+ontology = Ontology.from_sources(["validdata.json", "validdata.json", "edges.csv"], workers=2)
+
+print(ontology.load_stats)
+
+merged = Ontology.from_sources(["validdata.json", "validdata.json"], workers=1, policy="label")
+
+print(len(merged.atoms), len(merged.triples), merged.load_stats["reconciled"])
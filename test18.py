@@ -0,0 +1,23 @@
+import logging
+
+from ontology import Ontology
+from ontology.instrument import Instrumentation, JsonFileSink, LogSink, set_default
+
+logging.basicConfig(level=logging.INFO)
+
+seen = []
+instrument = Instrumentation(memory=True, profile=True, sinks=[LogSink(), seen.append])
+ontology = Ontology("validdata.json", instrument=instrument)
+
+print(ontology.load_stats["triples"])
+for stage in ontology.load_stats.stages.values():
+    print(stage)
+print(seen[0] is ontology.load_stats)
+ontology.load_stats.stages["normalize"].profile.sort_stats("cumulative").print_stats(3)
+
+set_default(Instrumentation(sinks=[JsonFileSink("/tmp/load_stats.jsonl")]))
+merged = Ontology.from_sources(["validdata.json", "edges.csv"], workers=1)
+print(list(merged.load_stats.stages))
+set_default(None)
+
+print(Ontology("validdata.json").load_stats.stages)
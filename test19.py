@@ -0,0 +1,29 @@
+from ontology import Ontology
+from ontology.integrity import IntegrityError, check_triples
+
+
+
+ontology = Ontology("validdata.json")
+
+print(ontology.check_integrity())
+
+bad = [
+    ontology.add_triple(1, 10, 999, "Alice type ?"),     # undeclared object
+    ontology.add_triple(1, 2, 3, "Alice Paris Human"),    # Paris is an Atom
+]
+
+for violation in ontology.check_integrity():
+    print(violation)
+
+print(check_triples(ontology, bad[1:]))
+
+ontology.strict = True
+ontology.add_triple(1, 11, 2)
+
+try:
+    ontology.add_triple(1, 2, 999)
+except IntegrityError as e:
+    print(e)
+
+strict = Ontology("edges.csv", strict=True)
+print(strict.check_integrity())
@@ -0,0 +1,57 @@
+import json
+import tempfile
+from pathlib import Path
+
+from ontology.loaders import JSON_CHUNK_SIZE, JsonObjectStream, _JsonReader, load_json, stream_json
+
+
+
+text = '{\n  "nodes": [\n    {"id": 1, "type": "Atom", "label": "Alice"},\n    {"id": 2, "type": "Atom", "label": "Paris"},\n    {"id": 3, "type": "Atom" "label": "Human"}\n  ]\n}\n'
+
+with tempfile.TemporaryDirectory() as tmp:
+    path = Path(tmp) / "broken.json"
+    path.write_text(text, encoding="utf-8")
+
+    try:
+        json.loads(text)
+    except json.JSONDecodeError as e:
+        print("stdlib:", e.lineno)
+
+    for chunk_size in (8, 1 << 16):
+        try:
+            for key, value in JsonObjectStream(path, chunk_size=chunk_size):
+                list(value)
+        except ValueError as e:
+            print(chunk_size, e)
+            assert str(e).endswith("at line 5"), e
+
+    try:
+        load_json(path)
+    except ValueError as e:
+        print(e)
+
+    path.write_text('{"nodes": [], "triples": []}', encoding="utf-8")
+    print(type(load_json(path)).__name__, type(stream_json(path)).__name__)
+
+# A syntax error early in a large file is reported without reading on.
+big = '{"nodes": [\n  {"id": 1 "type": "Atom", "label": "Alice"},\n' + '  {"id": 2, "type": "Atom", "label": "Paris"},\n' * 150_000 + '  {"id": 3, "type": "Atom", "label": "x"}\n]}\n'
+with tempfile.TemporaryDirectory() as tmp:
+    path = Path(tmp) / "big.json"
+    path.write_text(big, encoding="utf-8")
+    with path.open(encoding="utf-8") as f:
+        reader = _JsonReader(f, path)
+        reader.expect("{")
+        reader.value()
+        reader.expect(":")
+        reader.expect("[")
+        try:
+            reader.value()
+        except ValueError as e:
+            print(e)
+    print(len(reader.buf) <= JSON_CHUNK_SIZE)
+    assert len(reader.buf) <= JSON_CHUNK_SIZE, len(reader.buf)
+
+    # Long strings and literals cut by a tiny buffer still decode.
+    path.write_text('{"nodes": ["' + "x" * 100 + '", true, -12.5e3, "\\u00e9"]}', encoding="utf-8")
+    for key, value in JsonObjectStream(path, chunk_size=4):
+        print(key, [v if not isinstance(v, str) else len(v) for v in value])
@@ -0,0 +1,23 @@
+import time
+
+from ontology.normalize import OntologyValidationError
+from ontology.parallel import encode_sources
+
+
+
+sources = ["validdata.json", "invaliddata.json"] + ["validdata.json"] * 40
+
+start = time.perf_counter()
+shards = encode_sources(sources, workers=2)
+print(next(shards).source)
+try:
+    for shard in shards:
+        pass
+except OntologyValidationError as e:
+    print(e.errors[0])
+print(f"failed after {time.perf_counter() - start:.2f}s")
+
+# Stopping early cancels the files not yet started.
+shards = encode_sources(["validdata.json"] * 40, workers=2)
+print(next(shards).source)
+shards.close()
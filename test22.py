@@ -0,0 +1,27 @@
+import io
+import tempfile
+from pathlib import Path
+
+from ontology.turtle import TURTLE_CHUNK_SIZE, TurtleSource, _Tokens
+
+
+
+# Long IRIs, strings and tags cut by a tiny buffer still read fine.
+text = ('@prefix ex: <http://example.org/a/rather/long/namespace#> .\n'
+        'ex:alice ex:name "Alice with a long name"@en-GB ; ex:knows <http://example.org/bob> .\n')
+with tempfile.TemporaryDirectory() as tmp:
+    path = Path(tmp) / "small.ttl"
+    path.write_text(text, encoding="utf-8")
+    for chunk_size in (4, TURTLE_CHUNK_SIZE):
+        print(chunk_size, list(TurtleSource(path, chunk_size=chunk_size)))
+
+# A bad character early in a large file is reported without reading on.
+bad = "@prefix ex: <http://example.org/> .\nex:a ex:p ex:b .\nex:a ` ex:c .\n" + "ex:a ex:p ex:b .\n" * 200_000
+tokens = _Tokens(io.StringIO(bad), Path("bad.ttl"), TURTLE_CHUNK_SIZE)
+try:
+    while tokens.take()[0] != "eof":
+        pass
+except ValueError as e:
+    print(e)
+print(len(tokens.buf) <= 2 * TURTLE_CHUNK_SIZE)
+assert len(tokens.buf) <= 2 * TURTLE_CHUNK_SIZE, len(tokens.buf)
@@ -0,0 +1,15 @@
+
+
+from ontology import Ontology
+
+
+
+ontology = Ontology("validdata.json")
+
+print(list(ontology.match(subject=1)))
+
+print(list(ontology.match(predicate=11, object=2)))
+
+print(ontology.add_triple(2, 10, 3))
+
+print(ontology.count(object=3))